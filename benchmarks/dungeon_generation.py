@@ -0,0 +1,64 @@
+import argparse
+import time
+from typing import Optional, Tuple
+from src.dungeon.dungeon import Dungeon
+
+
+def measure(width: int, height: int, repeat: int, seed: int, **options) -> Tuple[float, int]:
+    """
+    ダンジョン生成にかかる時間を計測する
+
+    Args:
+        width (int): ダンジョンの横幅
+        height (int): ダンジョンの高さ
+        repeat (int): 計測回数
+        seed (int): 最初の計測に用いるシード値. 以降は1ずつ増やす
+        **options: Dungeon に渡す部屋の制約（min_room_width, max_depth など）
+
+    Returns:
+        tuple: 最も速かった生成時間（秒）と, そのときの部屋の数
+    """
+    best = (float("inf"), 0)
+    for i in range(repeat):
+        start = time.perf_counter()
+        dungeon = Dungeon(width, height, seed=seed + i, **options)
+        best = min(best, (time.perf_counter() - start, len(dungeon.get_rooms())))
+    return best
+
+
+def room_options(min_room_size: Optional[int], max_room_size: Optional[int], max_depth: Optional[int]) -> dict:
+    """
+    コマンドライン引数から Dungeon に渡す部屋の制約を組み立てる
+
+    Args:
+        min_room_size (int, optional): 部屋の最小の幅と高さ
+        max_room_size (int, optional): 部屋の最大の幅と高さ
+        max_depth (int, optional): BSP の分割の最大の深さ
+
+    Returns:
+        dict: 指定された制約だけを含む辞書
+    """
+    options = {"max_depth": max_depth}
+    if min_room_size is not None:
+        options.update(min_room_width=min_room_size, min_room_height=min_room_size)
+    if max_room_size is not None:
+        options.update(max_room_width=max_room_size, max_room_height=max_room_size)
+    return options
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dungeon の生成時間を計測する")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-room-size", type=int, default=None)
+    parser.add_argument("--max-room-size", type=int, default=None)
+    parser.add_argument("--max-depth", type=int, default=None)
+    args = parser.parse_args()
+
+    options = room_options(args.min_room_size, args.max_room_size, args.max_depth)
+    # 1セルあたりの時間が大きさによらず一定であれば, 生成時間はセル数に比例している
+    print(f"{'size':>13s} {'seconds':>8s} {'rooms':>8s} {'Mcells/s':>9s}")
+    for size in args.sizes:
+        seconds, rooms = measure(size, size, args.repeat, args.seed, **options)
+        print(f"{size:6d}x{size:<6d} {seconds:8.3f} {rooms:8d} {size * size / seconds / 1e6:9.2f}")
@@ -0,0 +1,69 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, Optional, Sequence
+
+# ワーカープロセスが読み込むモジュール（画面を使わない AI 同士の対戦や, 並列生成・シミュレーション）
+HEADLESS_MODULES = (
+    "src.reversi.player",
+    "src.reversi.game_master",
+    "src.maze.parallel_maze",
+    "src.dungeon.dungeon_batch",
+    "src.trump.blackjack",
+)
+# ワーカーで読み込まれてはならないモジュール
+UNWANTED_MODULES = ("curses", "_curses")
+# リポジトリのルート（src パッケージを import できるディレクトリ）
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str, repeat: int = 5) -> Dict[str, object]:
+    """
+    新しいインタプリタでモジュールを import する時間を, python -X importtime の出力から計測する
+    インタプリタ自体の起動時間は含めず, 指定したモジュールとそれが読み込むモジュールの時間の合計を求める
+
+    Args:
+        module (str): 計測するモジュールの名前
+        repeat (int, optional): 計測回数. 既定値は5
+
+    Returns:
+        dict: seconds（import 時間の中央値）, modules（読み込まれたモジュールの数）,
+            unwanted（読み込まれた UNWANTED_MODULES のリスト）を格納した辞書
+    """
+    timings = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        # 各行は "import time: self [us] | cumulative | imported package" の形式
+        rows = [line.split("|") for line in completed.stderr.splitlines() if line.startswith("import time:")]
+        imported = {row[2].strip(): int(row[1]) for row in rows[1:]}
+        timings.append(imported[module] / 1e6)
+    return {
+        "seconds": statistics.median(timings),
+        "modules": len(imported),
+        "unwanted": [name for name in UNWANTED_MODULES if name in imported],
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ワーカープロセスが読み込むモジュールの import 時間を計測する")
+    parser.add_argument("modules", nargs="*", default=list(HEADLESS_MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'module':32s} {'import':>10s} {'modules':>8s}  unwanted")
+    failed = False
+    for module in args.modules:
+        result = measure(module, args.repeat)
+        failed = failed or bool(result["unwanted"])
+        print(f"{module:32s} {result['seconds'] * 1e3:8.1f}ms {result['modules']:8d}  "
+              f"{', '.join(result['unwanted']) or '-'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
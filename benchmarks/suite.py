@@ -0,0 +1,390 @@
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Sequence
+from src.dungeon.dungeon import Dungeon
+from src.maze.maze import Maze
+from src.reversi.player import ReversiMinimaxPlayer, ReversiRandomPlayer
+from src.reversi.reversi_board import ReversiBoard
+from src.trump.shoe import Shoe
+from src.trump.trump import Number, Suit, Trump
+
+# 結果の JSON の形式のバージョン
+RESULT_FORMAT_VERSION = 1
+# 既定のベースラインのパス
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# 既定の回帰の閾値（ベースラインより何割遅くなったら回帰とみなすか）
+DEFAULT_THRESHOLD = 0.3
+# メモリ使用量の増加がこの値未満であれば, 割合によらず回帰とみなさない
+MEMORY_NOISE_BYTES = 64 * 1024
+# 実行環境の速さを測る基準の処理の繰り返し回数
+CALIBRATION_LOOPS = 20000
+
+
+class BenchmarkCase:
+    """
+    BenchmarkCaseクラスは, 計測する処理を1つの入力の大きさについて表します
+
+    setup は計測の対象外で, 1回の計測ごとに呼ばれ, 計測する処理（引数なしの関数）を返します
+    処理が状態を書き換える場合（カードを配るなど）でも, 計測ごとに作り直されるため同じ条件で計測できます
+
+    Attributes:
+        name (str): 処理の名前
+        size (int): 入力の大きさ
+        setup (Callable[[int], Callable[[], object]]): 入力の大きさから計測する処理を作る関数
+        number (int): 1回の計測で処理を繰り返す回数. 短い処理はまとめて計測し, 1回あたりの時間に直す
+    """
+
+    def __init__(self, name: str, size: int, setup: Callable[[int], Callable[[], object]], number: int = 1):
+        self.name = name
+        self.size = size
+        self.setup = setup
+        self.number = number
+
+    def get_key(self) -> str:
+        """
+        結果の JSON で用いるキーを返す
+
+        Returns:
+            str: "名前[大きさ]" 形式のキー
+        """
+        return f"{self.name}[{self.size}]"
+
+
+def _reversi_board(moves: int) -> ReversiBoard:
+    """
+    石の色ごとに固定したシード値のランダムなプレイヤーで moves 手進めた盤面を作る
+
+    Args:
+        moves (int): 進める手数
+
+    Returns:
+        ReversiBoard: 盤面
+    """
+    board = ReversiBoard()
+    players = [
+        ReversiRandomPlayer(ReversiBoard.Stone.BLACK, rng=random.Random(0)),
+        ReversiRandomPlayer(ReversiBoard.Stone.WHITE, rng=random.Random(1)),
+    ]
+    for move in range(moves):
+        players[move % 2].play(board)
+    return board
+
+
+def _setup_placeable_positions(moves: int) -> Callable[[], object]:
+    board = _reversi_board(moves)
+
+    def run():
+        board.get_placeable_positions(ReversiBoard.Stone.BLACK)
+        board.get_placeable_positions(ReversiBoard.Stone.WHITE)
+    return run
+
+
+def _setup_minimax(depth: int) -> Callable[[], object]:
+    board = _reversi_board(20)
+    player = ReversiMinimaxPlayer(ReversiBoard.Stone.BLACK, search_depth=depth)
+    return lambda: player.play(copy.deepcopy(board))
+
+
+def _setup_maze(size: int) -> Callable[[], object]:
+    return lambda: Maze(size, size, seed=0)
+
+
+def _setup_dungeon(size: int) -> Callable[[], object]:
+    return lambda: Dungeon(size, size, seed=0)
+
+
+def _setup_shuffle(deck_count: int) -> Callable[[], object]:
+    shoe = Shoe(deck_count=deck_count, rng=random.Random(0))
+    return shoe.shuffle
+
+
+def _setup_draw(deck_count: int) -> Callable[[], object]:
+    trumps = [Trump(rng=random.Random(i)) for i in range(deck_count)]
+    for trump in trumps:
+        trump.shuffle()
+
+    def run():
+        for trump in trumps:
+            for _ in range(len(trump)):
+                trump.draw()
+    return run
+
+
+def _setup_search(deck_count: int) -> Callable[[], object]:
+    shoe = Shoe(deck_count=deck_count, rng=random.Random(0))
+    shoe.shuffle()
+    shoe.draw(len(shoe) // 3)
+
+    def run():
+        shoe.search(suit=Suit.HEART)
+        shoe.search(number=Number.ACE)
+        shoe.search(suit=Suit.SPADE, number=Number.QUEEN)
+    return run
+
+
+def _cases(name: str, sizes: Sequence[int], setup: Callable[[int], Callable[[], object]],
+           number: int = 1) -> List[BenchmarkCase]:
+    return [BenchmarkCase(name, size, setup, number) for size in sizes]
+
+
+# 計測する処理の一覧. 大きさは, 盤面の手数・探索の深さ・迷路やダンジョンの一辺・トランプの組数
+CASES = (
+    _cases("reversi.get_placeable_positions", (0, 20, 40), _setup_placeable_positions, number=100)
+    + _cases("reversi.minimax_play", (1, 2, 3), _setup_minimax)
+    + _cases("maze.generate", (21, 41, 61), _setup_maze)
+    + _cases("dungeon.generate", (50, 200, 500), _setup_dungeon)
+    + _cases("trump.shuffle", (1, 6, 64), _setup_shuffle, number=20)
+    + _cases("trump.draw", (1, 10, 100), _setup_draw)
+    + _cases("trump.search", (1, 6, 64), _setup_search, number=20)
+)
+
+
+def select_cases(patterns: Optional[Sequence[str]] = None) -> List[BenchmarkCase]:
+    """
+    キーに指定した文字列のいずれかを含む計測を選ぶ
+
+    Args:
+        patterns (Sequence[str], optional): 選ぶキーに含まれる文字列. 省略時は全ての計測
+
+    Returns:
+        List[BenchmarkCase]: 選ばれた計測のリスト
+    """
+    if not patterns:
+        return list(CASES)
+    return [case for case in CASES if any(pattern in case.get_key() for pattern in patterns)]
+
+
+def calibrate() -> float:
+    """
+    実行環境の速さを測るため, 基準の処理（辞書とリストを使う純粋な Python のループ）にかかる時間を計測する
+
+    Returns:
+        float: 時間（秒）
+    """
+    start = time.perf_counter()
+    table = {}
+    values = []
+    for i in range(CALIBRATION_LOOPS):
+        table[i & 255] = table.get(i & 255, 0) + i
+        values.append(i * 3 % 7)
+    return time.perf_counter() - start
+
+
+def measure(case: BenchmarkCase, repeat: int = 5) -> dict:
+    """
+    1つの計測を行う. 時間は repeat 回の計測の最小値と中央値で, メモリは tracemalloc で追跡した1回分の最大使用量
+
+    共有のマシンでは実行環境の速さが時間とともに変わるため, 各回の前後で基準の処理の時間も計測し,
+    その平均に対する比（相対時間）の中央値も求める. ベースラインとの比較にはこの相対時間を用いる
+    時間の計測中はガベージコレクションを止め, tracemalloc は処理を遅くするためメモリは別に計測する
+
+    Args:
+        case (BenchmarkCase): 計測
+        repeat (int, optional): 時間の計測回数. 既定値は5
+
+    Returns:
+        dict: seconds（最小値）, median（中央値）, relative（相対時間の中央値）, calibration（基準の処理の時間の中央値）,
+            peak_bytes（最大メモリ使用量）を格納した辞書（時間は1回あたり）
+    """
+    # timeit と同じく, 呼び出し元のヒープの大きさに左右されないよう計測中はガベージコレクションを止める
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        calibrations = [calibrate()]
+        timings = []
+        for _ in range(repeat):
+            run = case.setup(case.size)
+            start = time.perf_counter()
+            for _ in range(case.number):
+                run()
+            timings.append((time.perf_counter() - start) / case.number)
+            calibrations.append(calibrate())
+    finally:
+        if gc_enabled:
+            gc.enable()
+    relatives = [timing * 2 / (before + after)
+                 for timing, before, after in zip(timings, calibrations, calibrations[1:])]
+
+    run = case.setup(case.size)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        run()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": min(timings), "median": statistics.median(timings), "relative": statistics.median(relatives),
+        "calibration": statistics.median(calibrations), "peak_bytes": peak_bytes,
+    }
+
+
+def run_suite(cases: Sequence[BenchmarkCase], repeat: int = 5,
+              progress: Optional[Callable[[str, dict], None]] = None) -> dict:
+    """
+    計測を順に行い, JSON に書き出せる形式にまとめる
+
+    Args:
+        cases (Sequence[BenchmarkCase]): 計測のリスト
+        repeat (int, optional): 時間の計測回数. 既定値は5
+        progress (Callable[[str, dict], None], optional): 1つの計測が終わるたびにキーと結果を渡して呼ばれる関数
+
+    Returns:
+        dict: 実行環境と, キーごとの計測結果を格納した辞書
+    """
+    results = {}
+    for case in cases:
+        results[case.get_key()] = measure(case, repeat)
+        if progress is not None:
+            progress(case.get_key(), results[case.get_key()])
+    return {
+        "format_version": RESULT_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    計測結果をベースラインと比べ, 閾値を超えて遅くなった, またはメモリ使用量が増えた計測を返す
+    時間は measure で求めた相対時間で比べるため, 実行環境の速さの違いに左右されにくい
+    ベースラインにない計測は比較しない
+
+    Args:
+        current (dict): run_suite の結果
+        baseline (dict): ベースラインの run_suite の結果
+        threshold (float, optional): 回帰とみなす増加の割合. 既定値は0.3（1.3倍）
+
+    Returns:
+        List[str]: 回帰した計測の説明のリスト. 回帰がなければ空
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        if result["relative"] > base["relative"] * (1 + threshold):
+            # 表示のため, ベースラインの相対時間を今回の実行環境の速さで時間に換算する
+            expected = base["relative"] * result["calibration"]
+            regressions.append(f"{key}: {expected * 1e3:.3f}ms expected -> {result['median'] * 1e3:.3f}ms "
+                               f"(x{result['relative'] / base['relative']:.2f})")
+        if (result["peak_bytes"] > base["peak_bytes"] * (1 + threshold)
+                and result["peak_bytes"] - base["peak_bytes"] >= MEMORY_NOISE_BYTES):
+            regressions.append(f"{key}: peak {base['peak_bytes']:,}B -> {result['peak_bytes']:,}B")
+    return regressions
+
+
+def check_regressions(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD, repeat: int = 5,
+                      retries: int = 1) -> List[str]:
+    """
+    計測結果をベースラインと比べ, 回帰した計測だけを retries 回まで計測し直して, 再現した回帰を返す
+    共有のマシンでは一時的に遅くなることがあるため, 1回の計測だけでは回帰とみなさない
+    計測し直した結果で current の結果を置き換える
+
+    Args:
+        current (dict): run_suite の結果
+        baseline (dict): ベースラインの run_suite の結果
+        threshold (float, optional): 回帰とみなす増加の割合. 既定値は0.3
+        repeat (int, optional): 計測し直すときの時間の計測回数. 既定値は5
+        retries (int, optional): 計測し直す回数の上限. 既定値は1
+
+    Returns:
+        List[str]: 再現した回帰の説明のリスト. 回帰がなければ空
+    """
+    cases = {case.get_key(): case for case in CASES}
+    regressions = compare(current, baseline, threshold)
+    for _ in range(retries):
+        if not regressions:
+            break
+        keys = [key for key in current["results"] if compare({"results": {key: current["results"][key]}},
+                                                             baseline, threshold)]
+        for key in keys:
+            if key in cases:
+                current["results"][key] = measure(cases[key], repeat)
+        regressions = compare(current, baseline, threshold)
+    return regressions
+
+
+def load_results(path: str) -> dict:
+    """
+    計測結果の JSON を読み込む
+
+    Args:
+        path (str): 読み込むパス
+
+    Returns:
+        dict: 計測結果
+
+    Raises:
+        ValueError: 形式のバージョンが異なる場合に発生します
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("format_version") != RESULT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark result format: {results.get('format_version')!r}")
+    return results
+
+
+def save_results(path: str, results: dict):
+    """
+    計測結果を JSON に書き出す
+
+    Args:
+        path (str): 書き出すパス
+        results (dict): 計測結果
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _print_result(key: str, result: dict):
+    print(f"{key:40s} {result['seconds'] * 1e3:10.3f}ms {result['median'] * 1e3:10.3f}ms "
+          f"{result['peak_bytes'] / 1024:10.1f}KiB", flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="主要な処理の実行時間とメモリ使用量を計測し, ベースラインと比べる")
+    parser.add_argument("patterns", nargs="*", help="計測するキーに含まれる文字列（省略時は全て）")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="計測結果を書き出す JSON のパス")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="比べるベースラインの JSON のパス")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update-baseline", action="store_true", help="計測結果でベースラインを置き換える")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':40s} {'best':>12s} {'median':>12s} {'peak':>13s}")
+    current = run_suite(select_cases(args.patterns), args.repeat, progress=_print_result)
+    if args.output:
+        save_results(args.output, current)
+    if args.update_baseline:
+        if os.path.exists(args.baseline):
+            # 一部だけ計測した場合は, それ以外の計測のベースラインを残す
+            baseline = load_results(args.baseline)
+            baseline["results"].update(current["results"])
+            current = dict(current, results=baseline["results"])
+        save_results(args.baseline, current)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}. Run with --update-baseline to create one.")
+        return 0
+
+    regressions = check_regressions(current, load_results(args.baseline), args.threshold, args.repeat)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import os
+import pytest
+from benchmarks.suite import (
+    BASELINE_PATH, CASES, DEFAULT_THRESHOLD, RESULT_FORMAT_VERSION, check_regressions, load_results, measure
+)
+
+# pytest benchmarks で実行する. 閾値は環境変数 BENCHMARK_THRESHOLD で変えられる
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    if not os.path.exists(BASELINE_PATH):
+        pytest.skip("No benchmark baseline.")
+    return load_results(BASELINE_PATH)
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.get_key())
+def test_benchmark(baseline, case):
+    # GIVEN
+    case = case
+
+    # WHEN
+    result = measure(case)
+
+    # THEN
+    # ベースラインより閾値を超えて遅くなっていない, またはメモリ使用量が増えていないことを確認する（回帰は計測し直して確かめる）
+    current = {"format_version": RESULT_FORMAT_VERSION, "results": {case.get_key(): result}}
+    assert check_regressions(current, baseline, THRESHOLD) == []
@@ -1,147 +1,546 @@
+import argparse
 from enum import Enum, unique
+import heapq
+import json
+import os
 import random
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 
 
 class Dungeon:
+    ALGORITHM = "bsp"
     MIN_ROOM_WIDTH = 3
     MIN_ROOM_HEIGHT = 3
     ROOM_MARGIN = 1
+    # save で書き出すメタデータの形式のバージョン
+    FILE_FORMAT_VERSION = 1
 
     @unique
     class Area(Enum):
-        WALL = ("WALL", "■")
-        ROOM = ("ROOM", " ")
-        LOAD = ("LOAD", " ")
+        WALL = (0, "WALL", "■")
+        ROOM = (1, "ROOM", " ")
+        LOAD = (2, "LOAD", " ")
+        UP_STAIRS = (3, "UP_STAIRS", "<")
+        DOWN_STAIRS = (4, "DOWN_STAIRS", ">")
 
-        def __init__(self, symbol, disp_char):
+        def __init__(self, code, symbol, disp_char):
+            self.code = code
             self.symbol = symbol
             self.disp_char = disp_char
 
-    def __init__(self, dungeon_width, dungeon_height):
+    # マップの uint8 コードから Area への変換表
+    AREAS = tuple(Area)
+
+    @unique
+    class SplitDirection(Enum):
+        HORIZON = "Horizon"
+        VERTICAL = "Vertical"
+
+    class Room:
+        __slots__ = ("index", "left", "top", "right", "bottom")
+
+        def __init__(self, index, left, top, right, bottom):
+            # 部屋の番号と, 部屋が占める範囲（左上と右下の座標, 両端を含む）
+            self.index = index
+            self.left = left
+            self.top = top
+            self.right = right
+            self.bottom = bottom
+
+        def __repr__(self) -> str:
+            return f"Room(index={self.index}, left={self.left}, top={self.top}, right={self.right}, bottom={self.bottom})"
+
+        def contains(self, x: int, y: int) -> bool:
+            return self.left <= x <= self.right and self.top <= y <= self.bottom
+
+        def intersects(self, left: int, top: int, right: int, bottom: int) -> bool:
+            return self.left <= right and left <= self.right and self.top <= bottom and top <= self.bottom
+
+        def distance_squared(self, x: int, y: int) -> int:
+            dx = max(self.left - x, 0, x - self.right)
+            dy = max(self.top - y, 0, y - self.bottom)
+            return dx * dx + dy * dy
+
+    class Corridor:
+        __slots__ = ("index", "room_a", "room_b", "waypoints")
+
+        def __init__(self, index, room_a, room_b, waypoints):
+            # 通路の番号と, 通路で結ばれた2つの部屋の番号
+            self.index = index
+            self.room_a = room_a
+            self.room_b = room_b
+            # room_a に接するセルから room_b に接するセルまでの折れ点（両端を含む）
+            self.waypoints = waypoints
+
+        def __repr__(self) -> str:
+            return f"Corridor(index={self.index}, room_a={self.room_a}, room_b={self.room_b}, waypoints={self.waypoints})"
+
+        def __len__(self) -> int:
+            return sum(abs(x1 - x0) + abs(y1 - y0) for (x0, y0), (x1, y1) in zip(self.waypoints, self.waypoints[1:])) + 1
+
+        def get_cells(self) -> List[Tuple[int, int]]:
+            # 折れ点を順にたどり, room_a 側から room_b 側へ並んだセルの座標を返す
+            cells = [self.waypoints[0]]
+            for (x0, y0), (x1, y1) in zip(self.waypoints, self.waypoints[1:]):
+                step_x = (x1 > x0) - (x1 < x0)
+                step_y = (y1 > y0) - (y1 < y0)
+                for step in range(1, abs(x1 - x0) + abs(y1 - y0) + 1):
+                    cells.append((x0 + step_x * step, y0 + step_y * step))
+            return cells
+
+    class BinaryTree:
+        # 節点は行きがけ順の番号で表し, 属性ごとの平らな配列に格納する（子や部屋がない場合は -1）
+        def __init__(self):
+            self.root = None
+            # マップ全体における区画の左上の座標と大きさ
+            self.x = []
+            self.y = []
+            self.width = []
+            self.height = []
+            self.left_node = []
+            self.right_node = []
+            self.boundary_line = []
+            self.split_direction = []
+            # 葉の部屋と, 部分木に含まれる最初と最後の部屋の番号
+            self.room = []
+            self.first_room = []
+            self.last_room = []
+
+        def __len__(self) -> int:
+            return len(self.x)
+
+        def add_node(self, x: int, y: int, width: int, height: int) -> int:
+            self.x.append(x)
+            self.y.append(y)
+            self.width.append(width)
+            self.height.append(height)
+            self.left_node.append(-1)
+            self.right_node.append(-1)
+            self.boundary_line.append(None)
+            self.split_direction.append(None)
+            self.room.append(-1)
+            self.first_room.append(-1)
+            self.last_room.append(-1)
+            return len(self.x) - 1
+
+        def is_leaf(self, node: int) -> bool:
+            return self.left_node[node] < 0 and self.right_node[node] < 0
+
+        def distance_squared(self, node: int, x: int, y: int) -> int:
+            dx = max(self.x[node] - x, 0, x - (self.x[node] + self.width[node] - 1))
+            dy = max(self.y[node] - y, 0, y - (self.y[node] + self.height[node] - 1))
+            return dx * dx + dy * dy
+
+        def intersects(self, node: int, left: int, top: int, right: int, bottom: int) -> bool:
+            return (self.x[node] <= right and left < self.x[node] + self.width[node]
+                    and self.y[node] <= bottom and top < self.y[node] + self.height[node])
+
+        def get_leaf_node(self):
+            # 番号が行きがけ順なので, 番号順に走査すれば左の部分木から右の部分木の順になる
+            return (node for node in range(len(self)) if self.is_leaf(node))
+
+        def get_internal_node(self):
+            return (node for node in range(len(self)) if not self.is_leaf(node))
+
+    def __init__(self, dungeon_width, dungeon_height, seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 min_room_width: int = MIN_ROOM_WIDTH, min_room_height: int = MIN_ROOM_HEIGHT,
+                 max_room_width: Optional[int] = None, max_room_height: Optional[int] = None,
+                 room_margin: int = ROOM_MARGIN, max_depth: Optional[int] = None):
+        if min_room_width < 1 or min_room_height < 1 or room_margin < 0:
+            raise ValueError("Room size must be positive and room margin must not be negative.")
+        if (max_room_width is not None and max_room_width < min_room_width) \
+                or (max_room_height is not None and max_room_height < min_room_height):
+            raise ValueError("Maximum room size must not be smaller than minimum room size.")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("Max depth must not be negative.")
+
         self.__dungeon_width = dungeon_width
         self.__dungeon_height = dungeon_height
+        self.__min_room_width = min_room_width
+        self.__min_room_height = min_room_height
+        self.__max_room_width = max_room_width
+        self.__max_room_height = max_room_height
+        self.__room_margin = room_margin
+        self.__max_depth = max_depth
 
-        self.__dungeon_map = np.full((self.__dungeon_height, self.__dungeon_width), Dungeon.Area.WALL)
-        self.__generate_dungeon()
+        self.__dungeon_map = np.full((self.__dungeon_height, self.__dungeon_width), Dungeon.Area.WALL.code, dtype=np.uint8)
+        # マップが書き換えられるたびに増える番号. 視界などのキャッシュの無効化に使う
+        self.__version = 0
+        self.__generate_dungeon(rng if rng is not None else random.Random(seed))
 
     def __str__(self) -> str:
-        dungeon_representation = ""
-        for rows in self.__dungeon_map:
-            for area in rows:
-                dungeon_representation += area.disp_char
-            dungeon_representation += "\n"
-        return dungeon_representation
-
-    def __generate_dungeon(self):
-        class Node:
-            def __init__(self):
-                self.left_node = None
-                self.right_node = None
-                self.boundary_line = None
-                self.split_direction = None
-                self.sub_map = None
-
-        class BinaryTree:
-            def __init__(self):
-                self.root = None
-
-            @staticmethod
-            def get_leaf_node(node):
-                if node.left_node is not None:
-                    yield from BinaryTree.get_leaf_node(node.left_node)
-                if node.right_node is not None:
-                    yield from BinaryTree.get_leaf_node(node.right_node)
-                if node.left_node is None and node.right_node is None:
-                    yield node
-
-            @staticmethod
-            def get_internal_node(node):
-                if node.left_node is not None or node.right_node is not None:
-                    yield node
-                if node.left_node is not None:
-                    yield from BinaryTree.get_internal_node(node.left_node)
-                if node.right_node is not None:
-                    yield from BinaryTree.get_internal_node(node.right_node)
-
-        @unique
-        class SplitDirection(Enum):
-            HORIZON = "Horizon"
-            VERTICAL = "Vertical"
-
-        def split_map(sub_map):
-            split_directions = []
-            sub_map_height, sub_map_width = sub_map.shape
-            if sub_map_width > (Dungeon.MIN_ROOM_WIDTH+(Dungeon.ROOM_MARGIN*2))*2+1:
-                split_directions.append(SplitDirection.HORIZON)
-            if sub_map_height > (Dungeon.MIN_ROOM_HEIGHT+(Dungeon.ROOM_MARGIN*2))*2+1:
-                split_directions.append(SplitDirection.VERTICAL)
-
-            node = Node()
-            node.sub_map = sub_map
-
-            if len(split_directions) == 0:
-                return node
-
-            split_direction = random.choice(split_directions)
-            if split_direction == SplitDirection.HORIZON:
-                split_x = random.randint(Dungeon.MIN_ROOM_WIDTH+(Dungeon.ROOM_MARGIN*2)+1, sub_map_width-(Dungeon.MIN_ROOM_WIDTH+(Dungeon.ROOM_MARGIN*2)+1))
-                node.boundary_line = split_x
-                node.split_direction = split_direction
-                node.left_node = split_map(sub_map[:, 0:split_x])
-                node.right_node = split_map(sub_map[:, split_x+1:sub_map_width])
-                return node
-            if split_direction == SplitDirection.VERTICAL:
-                split_y = random.randint(Dungeon.MIN_ROOM_HEIGHT+(Dungeon.ROOM_MARGIN*2)+1, sub_map_height-(Dungeon.MIN_ROOM_HEIGHT+(Dungeon.ROOM_MARGIN*2)+1))
-                node.boundary_line = split_y
-                node.split_direction = split_direction
-                node.left_node = split_map(sub_map[0:split_y, :])
-                node.right_node = split_map(sub_map[split_y+1:sub_map_height, :])
-                return node
-
-        def create_room(sub_map):
-            sub_map_height, sub_map_width = sub_map.shape
-
-            if Dungeon.MIN_ROOM_WIDTH+(Dungeon.ROOM_MARGIN*2) > sub_map_width or Dungeon.MIN_ROOM_HEIGHT+(Dungeon.ROOM_MARGIN*2) > sub_map_height:
+        # 各行の末尾に改行を表すコードを加え, 変換表で一度に文字へ置き換える
+        disp_chars = np.array([area.disp_char for area in Dungeon.AREAS] + ["\n"])
+        newline_code = len(Dungeon.AREAS)
+        codes = np.empty((self.__dungeon_height, self.__dungeon_width + 1), dtype=np.uint8)
+        codes[:, :-1] = self.__dungeon_map
+        codes[:, -1] = newline_code
+        return "".join(disp_chars[codes].ravel().tolist())
+
+    def get_size(self) -> Tuple[int, int]:
+        return (self.__dungeon_width, self.__dungeon_height)
+
+    def get_area(self, x: int, y: int) -> 'Dungeon.Area':
+        return Dungeon.AREAS[self.__dungeon_map[y, x]]
+
+    def set_area(self, x: int, y: int, area: 'Dungeon.Area') -> None:
+        self.__dungeon_map[y, x] = area.code
+        self.__version += 1
+
+    def get_version(self) -> int:
+        return self.__version
+
+    def get_map(self) -> np.ndarray:
+        # Area.code を格納した読み取り専用の配列を返す
+        dungeon_map = self.__dungeon_map.view()
+        dungeon_map.flags.writeable = False
+        return dungeon_map
+
+    def get_tree(self) -> 'Dungeon.BinaryTree':
+        return self.__tree
+
+    def get_rooms(self) -> List['Dungeon.Room']:
+        # 部屋は BSP 木の葉の順（左の部分木から右の部分木の順）に並ぶ
+        return list(self.__rooms)
+
+    def get_corridors(self) -> List['Dungeon.Corridor']:
+        return list(self.__corridors)
+
+    def get_room_graph(self) -> List[List[Tuple[int, int]]]:
+        # 部屋ごとに, 通路で繋がった（隣の部屋の番号, 通路の番号）のリストを返す
+        return [list(edges) for edges in self.__room_graph]
+
+    def find_room(self, x: int, y: int) -> Optional['Dungeon.Room']:
+        # 区画の境界線で左右どちらの部分木に含まれるかを判定しながら葉まで降りる
+        tree = self.__tree
+        node = tree.root
+        while not tree.is_leaf(node):
+            if tree.split_direction[node] == Dungeon.SplitDirection.HORIZON:
+                position, boundary = x, tree.x[node] + tree.boundary_line[node]
+            else:
+                position, boundary = y, tree.y[node] + tree.boundary_line[node]
+            if position < boundary:
+                node = tree.left_node[node]
+            elif position > boundary:
+                node = tree.right_node[node]
+            else:
+                return None
+        room_index = tree.room[node]
+        if room_index >= 0 and self.__rooms[room_index].contains(x, y):
+            return self.__rooms[room_index]
+        return None
+
+    def nearest_room(self, x: int, y: int) -> Optional['Dungeon.Room']:
+        # 区画までの距離が近い順に木をたどり, 見つかった部屋より遠い区画は調べない
+        # 距離が等しい区画は節点の番号順に調べ, 結果が実行ごとに変わらないようにする
+        tree = self.__tree
+        best_room = None
+        best_distance = None
+        heap = [(tree.distance_squared(tree.root, x, y), tree.root)]
+        while heap:
+            node_distance, node = heapq.heappop(heap)
+            if best_distance is not None and node_distance >= best_distance:
+                break
+            if tree.is_leaf(node):
+                if tree.room[node] >= 0:
+                    room = self.__rooms[tree.room[node]]
+                    room_distance = room.distance_squared(x, y)
+                    if best_distance is None or room_distance < best_distance:
+                        best_room, best_distance = room, room_distance
+                continue
+            for child in (tree.left_node[node], tree.right_node[node]):
+                heapq.heappush(heap, (tree.distance_squared(child, x, y), child))
+        return best_room
+
+    def rooms_in_rect(self, left: int, top: int, right: int, bottom: int) -> List['Dungeon.Room']:
+        # 矩形（両端を含む）と重なる区画の部分木だけをたどる
+        tree = self.__tree
+        rooms = []
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if not tree.intersects(node, left, top, right, bottom):
+                continue
+            if tree.is_leaf(node):
+                if tree.room[node] >= 0:
+                    room = self.__rooms[tree.room[node]]
+                    if room.intersects(left, top, right, bottom):
+                        rooms.append(room)
+                continue
+            stack.append(tree.right_node[node])
+            stack.append(tree.left_node[node])
+        return rooms
+
+    def save(self, path: str, tile_size: Optional[int] = None):
+        # マップを uint8 の .npy ファイルに, 部屋・通路・BSP 木を同じ名前の .json ファイルに書き出す
+        # tile_size を指定すると, マップを (タイル行, タイル列, tile_size, tile_size) に並べ替えて書き出す
+        # （端のタイルの余りは WALL で埋める）. 表示する範囲のタイルだけを読み込めるようになる
+        if tile_size is None:
+            with open(path, "wb") as f:
+                np.save(f, self.__dungeon_map)
+        else:
+            if tile_size < 1:
+                raise ValueError("Tile size must be positive.")
+            tiles_y = -(-self.__dungeon_height // tile_size)
+            tiles_x = -(-self.__dungeon_width // tile_size)
+            tiles = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(tiles_y, tiles_x, tile_size, tile_size))
+            # 大きなマップでも一時配列がタイル1行分で済むよう, タイル行ごとに並べ替える
+            for tile_y in range(tiles_y):
+                rows = np.full((tile_size, tiles_x * tile_size), Dungeon.Area.WALL.code, dtype=np.uint8)
+                band = self.__dungeon_map[tile_y * tile_size:(tile_y + 1) * tile_size]
+                rows[:band.shape[0], :band.shape[1]] = band
+                tiles[tile_y] = rows.reshape(tile_size, tiles_x, tile_size).transpose(1, 0, 2)
+            tiles.flush()
+            del tiles
+
+        tree = self.__tree
+        metadata = {
+            "format_version": Dungeon.FILE_FORMAT_VERSION,
+            "algorithm": Dungeon.ALGORITHM,
+            "width": self.__dungeon_width,
+            "height": self.__dungeon_height,
+            "tile_size": tile_size,
+            "room_constraints": {
+                "min_room_width": self.__min_room_width,
+                "min_room_height": self.__min_room_height,
+                "max_room_width": self.__max_room_width,
+                "max_room_height": self.__max_room_height,
+                "room_margin": self.__room_margin,
+                "max_depth": self.__max_depth,
+            },
+            "rooms": [[room.left, room.top, room.right, room.bottom] for room in self.__rooms],
+            "corridors": [[corridor.room_a, corridor.room_b, corridor.waypoints] for corridor in self.__corridors],
+            "tree": {
+                "x": tree.x,
+                "y": tree.y,
+                "width": tree.width,
+                "height": tree.height,
+                "left_node": tree.left_node,
+                "right_node": tree.right_node,
+                "boundary_line": tree.boundary_line,
+                "split_direction": [None if direction is None else direction.value for direction in tree.split_direction],
+                "room": tree.room,
+                "first_room": tree.first_room,
+                "last_room": tree.last_room,
+            },
+        }
+        with open(Dungeon.__metadata_path(path), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = None) -> 'Dungeon':
+        # save で書き出したダンジョンを読み込む. 生成処理は行わない
+        # mmap_mode="r" ではマップをコピーせずに読み取り専用で開く（set_area はできない）
+        # タイル形式は連続した配列に並べ替えるため, mmap_mode は指定できない
+        metadata = Dungeon.__read_metadata(path)
+        width, height, tile_size = metadata["width"], metadata["height"], metadata["tile_size"]
+        if tile_size is None:
+            dungeon_map = np.load(path, mmap_mode=mmap_mode)
+        else:
+            if mmap_mode is not None:
+                raise ValueError("Tiled dungeon files cannot be memory-mapped as a whole map.")
+            dungeon_map = Dungeon.read_region(path, 0, 0, width - 1, height - 1)
+        if dungeon_map.dtype != np.uint8 or dungeon_map.shape != (height, width):
+            raise DungeonError("Invalid dungeon data.")
+
+        dungeon = cls.__new__(cls)
+        dungeon.__dungeon_width = width
+        dungeon.__dungeon_height = height
+        constraints = metadata["room_constraints"]
+        dungeon.__min_room_width = constraints["min_room_width"]
+        dungeon.__min_room_height = constraints["min_room_height"]
+        dungeon.__max_room_width = constraints["max_room_width"]
+        dungeon.__max_room_height = constraints["max_room_height"]
+        dungeon.__room_margin = constraints["room_margin"]
+        dungeon.__max_depth = constraints["max_depth"]
+        dungeon.__dungeon_map = dungeon_map
+        dungeon.__version = 0
+
+        tree = Dungeon.BinaryTree()
+        for name, values in metadata["tree"].items():
+            if name == "split_direction":
+                values = [None if value is None else Dungeon.SplitDirection(value) for value in values]
+            setattr(tree, name, values)
+        tree.root = 0
+        dungeon.__tree = tree
+        dungeon.__rooms = [Dungeon.Room(index, *bounds) for index, bounds in enumerate(metadata["rooms"])]
+        dungeon.__corridors = []
+        dungeon.__room_graph = [[] for _ in dungeon.__rooms]
+        for index, (room_a, room_b, waypoints) in enumerate(metadata["corridors"]):
+            dungeon.__corridors.append(Dungeon.Corridor(index, room_a, room_b, [tuple(point) for point in waypoints]))
+            dungeon.__room_graph[room_a].append((room_b, index))
+            dungeon.__room_graph[room_b].append((room_a, index))
+        return dungeon
+
+    @staticmethod
+    def open_map(path: str) -> np.ndarray:
+        # save で書き出したマップを読み取り専用のメモリマップで開く. 部屋などのメタデータは読まない
+        # タイル形式の場合は (タイル行, タイル列, tile_size, tile_size) の配列になる
+        return np.load(path, mmap_mode="r")
+
+    @staticmethod
+    def read_region(path: str, left: int, top: int, right: int, bottom: int) -> np.ndarray:
+        # save で書き出したマップのうち, 矩形（両端を含み, マップの範囲に切り詰める）の部分だけを読み込む
+        # タイル形式では矩形に重なるタイルだけがディスクから読み込まれる
+        metadata = Dungeon.__read_metadata(path)
+        width, height, tile_size = metadata["width"], metadata["height"], metadata["tile_size"]
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, width - 1), min(bottom, height - 1)
+        if right < left or bottom < top:
+            return np.empty((max(bottom - top + 1, 0), max(right - left + 1, 0)), dtype=np.uint8)
+
+        dungeon_map = Dungeon.open_map(path)
+        if tile_size is None:
+            return np.array(dungeon_map[top:bottom + 1, left:right + 1])
+
+        first_tile_x, last_tile_x = left // tile_size, right // tile_size
+        first_tile_y, last_tile_y = top // tile_size, bottom // tile_size
+        tiles = dungeon_map[first_tile_y:last_tile_y + 1, first_tile_x:last_tile_x + 1]
+        # (タイル行, タイル列, 行, 列) を (タイル行, 行, タイル列, 列) に並べ替えて1枚の配列にする
+        region = tiles.transpose(0, 2, 1, 3).reshape(tiles.shape[0] * tile_size, tiles.shape[1] * tile_size)
+        offset_x, offset_y = first_tile_x * tile_size, first_tile_y * tile_size
+        return np.array(region[top - offset_y:bottom - offset_y + 1, left - offset_x:right - offset_x + 1])
+
+    @staticmethod
+    def __metadata_path(path: str) -> str:
+        return os.path.splitext(path)[0] + ".json"
+
+    @staticmethod
+    def __read_metadata(path: str) -> dict:
+        try:
+            with open(Dungeon.__metadata_path(path), encoding="utf-8") as f:
+                metadata = json.load(f)
+        except ValueError:
+            raise DungeonError("Invalid dungeon data.")
+        if not isinstance(metadata, dict) or metadata.get("format_version") != Dungeon.FILE_FORMAT_VERSION:
+            raise DungeonError("Invalid dungeon data.")
+        return metadata
+
+    def __generate_dungeon(self, rng: random.Random):
+        tree = Dungeon.BinaryTree()
+        # 部屋と余白が収まる区画の最小の大きさ
+        min_area_width = self.__min_room_width + self.__room_margin * 2
+        min_area_height = self.__min_room_height + self.__room_margin * 2
+
+        def split_map():
+            # 分割待ちの区画をスタックに積み, 左の区画から深さ優先で分割する（節点の番号は行きがけ順になる）
+            stack = [(-1, None, 0, 0, self.__dungeon_width, self.__dungeon_height, 0)]
+            while stack:
+                parent, side, x, y, width, height, depth = stack.pop()
+                node = tree.add_node(x, y, width, height)
+                if side is not None:
+                    side[parent] = node
+
+                split_directions = []
+                if self.__max_depth is None or depth < self.__max_depth:
+                    if width > min_area_width*2+1:
+                        split_directions.append(Dungeon.SplitDirection.HORIZON)
+                    if height > min_area_height*2+1:
+                        split_directions.append(Dungeon.SplitDirection.VERTICAL)
+
+                if len(split_directions) == 0:
+                    continue
+
+                split_direction = rng.choice(split_directions)
+                tree.split_direction[node] = split_direction
+                if split_direction == Dungeon.SplitDirection.HORIZON:
+                    split_x = rng.randint(min_area_width+1, width-(min_area_width+1))
+                    tree.boundary_line[node] = split_x
+                    stack.append((node, tree.right_node, x+split_x+1, y, width-split_x-1, height, depth+1))
+                    stack.append((node, tree.left_node, x, y, split_x, height, depth+1))
+                if split_direction == Dungeon.SplitDirection.VERTICAL:
+                    split_y = rng.randint(min_area_height+1, height-(min_area_height+1))
+                    tree.boundary_line[node] = split_y
+                    stack.append((node, tree.right_node, x, y+split_y+1, width, height-split_y-1, depth+1))
+                    stack.append((node, tree.left_node, x, y, width, split_y, depth+1))
+
+        def create_room(node):
+            node_width, node_height = tree.width[node], tree.height[node]
+            if min_area_width > node_width or min_area_height > node_height:
                 return
 
-            room_width = random.randint(Dungeon.MIN_ROOM_WIDTH, sub_map_width-(Dungeon.ROOM_MARGIN*2))
-            room_height = random.randint(Dungeon.MIN_ROOM_HEIGHT, sub_map_height-(Dungeon.ROOM_MARGIN*2))
-            room_left_upper_x = random.randint(0+Dungeon.ROOM_MARGIN, sub_map_width-(room_width+Dungeon.ROOM_MARGIN))
-            room_left_upper_y = random.randint(0+Dungeon.ROOM_MARGIN, sub_map_height-(room_height+Dungeon.ROOM_MARGIN))
-
-            sub_map[room_left_upper_y:room_left_upper_y+room_height, room_left_upper_x:room_left_upper_x+room_width] = Dungeon.Area.ROOM
-
-        def create_load(sub_binary_tree_map):
-            left_node = list(BinaryTree.get_leaf_node(sub_binary_tree_map.left_node))[-1]
-            left_node_map_x = np.where(left_node.sub_map==Dungeon.Area.ROOM)[1][-1]
-            left_node_map_y = np.where(left_node.sub_map==Dungeon.Area.ROOM)[0][-1]
-            left_node_sub_map_height, left_node_sub_map_width = left_node.sub_map.shape
-            if sub_binary_tree_map.split_direction == SplitDirection.HORIZON:
-                left_node.sub_map[left_node_map_y, left_node_map_x+1:left_node_sub_map_width] = None
-            if sub_binary_tree_map.split_direction == SplitDirection.VERTICAL:
-                left_node.sub_map[left_node_map_y+1:left_node_sub_map_height, left_node_map_x] = None
-
-            right_node = list(BinaryTree.get_leaf_node(sub_binary_tree_map.right_node))[0]
-            right_node_map_x = np.where(right_node.sub_map==Dungeon.Area.ROOM)[1][0]
-            right_node_map_y = np.where(right_node.sub_map==Dungeon.Area.ROOM)[0][0]
-            right_node_sub_map_height, right_node_sub_map_width = right_node.sub_map.shape
-            if sub_binary_tree_map.split_direction == SplitDirection.HORIZON:
-                right_node.sub_map[right_node_map_y, 0:right_node_map_x] = None
-            if sub_binary_tree_map.split_direction == SplitDirection.VERTICAL:
-                right_node.sub_map[0:right_node_map_y, right_node_map_x] = None
-
-            if sub_binary_tree_map.split_direction == SplitDirection.HORIZON:
-                (top, bottom) = tuple(sorted(set(np.where(sub_binary_tree_map.sub_map==None)[0])))
-                sub_binary_tree_map.sub_map[top:bottom+1, sub_binary_tree_map.boundary_line] = Dungeon.Area.LOAD
-            if sub_binary_tree_map.split_direction == SplitDirection.VERTICAL:
-                (left, right) = tuple(sorted(set(np.where(sub_binary_tree_map.sub_map==None)[1])))
-                sub_binary_tree_map.sub_map[sub_binary_tree_map.boundary_line, left:right+1] = Dungeon.Area.LOAD
-            sub_binary_tree_map.sub_map[sub_binary_tree_map.sub_map==None] = Dungeon.Area.LOAD
-
-        binary_tree_map = BinaryTree()
-        binary_tree_map.root = split_map(self.__dungeon_map)
-        for node in BinaryTree.get_leaf_node(binary_tree_map.root):
-            create_room(node.sub_map)
-        for node in BinaryTree.get_internal_node(binary_tree_map.root):
+            margin = self.__room_margin
+            max_width = node_width-(margin*2)
+            max_height = node_height-(margin*2)
+            if self.__max_room_width is not None:
+                max_width = min(max_width, self.__max_room_width)
+            if self.__max_room_height is not None:
+                max_height = min(max_height, self.__max_room_height)
+            room_width = rng.randint(self.__min_room_width, max_width)
+            room_height = rng.randint(self.__min_room_height, max_height)
+            room_left_upper_x = tree.x[node] + rng.randint(0+margin, node_width-(room_width+margin))
+            room_left_upper_y = tree.y[node] + rng.randint(0+margin, node_height-(room_height+margin))
+
+            self.__dungeon_map[room_left_upper_y:room_left_upper_y+room_height, room_left_upper_x:room_left_upper_x+room_width] = Dungeon.Area.ROOM.code
+            room = Dungeon.Room(len(self.__rooms), room_left_upper_x, room_left_upper_y, room_left_upper_x+room_width-1, room_left_upper_y+room_height-1)
+            tree.room[node] = tree.first_room[node] = tree.last_room[node] = room.index
+            self.__rooms.append(room)
+
+        def create_load(node):
+            # 左の部分木の最後の部屋の右下隅と, 右の部分木の最初の部屋の左上隅を通路で結ぶ
+            left_room = self.__rooms[tree.last_room[tree.left_node[node]]]
+            right_room = self.__rooms[tree.first_room[tree.right_node[node]]]
+            if tree.split_direction[node] == Dungeon.SplitDirection.HORIZON:
+                boundary_x = tree.x[node] + tree.boundary_line[node]
+                waypoints = [
+                    (left_room.right+1, left_room.bottom),
+                    (boundary_x, left_room.bottom),
+                    (boundary_x, right_room.top),
+                    (right_room.left-1, right_room.top),
+                ]
+            if tree.split_direction[node] == Dungeon.SplitDirection.VERTICAL:
+                boundary_y = tree.y[node] + tree.boundary_line[node]
+                waypoints = [
+                    (left_room.right, left_room.bottom+1),
+                    (left_room.right, boundary_y),
+                    (right_room.left, boundary_y),
+                    (right_room.left, right_room.top-1),
+                ]
+            # 折れ点の間の線分をそれぞれスライスで掘る
+            for (x0, y0), (x1, y1) in zip(waypoints, waypoints[1:]):
+                self.__dungeon_map[min(y0, y1):max(y0, y1)+1, min(x0, x1):max(x0, x1)+1] = Dungeon.Area.LOAD.code
+
+            corridor = Dungeon.Corridor(len(self.__corridors), left_room.index, right_room.index, waypoints)
+            self.__corridors.append(corridor)
+            self.__room_graph[left_room.index].append((right_room.index, corridor.index))
+            self.__room_graph[right_room.index].append((left_room.index, corridor.index))
+
+        self.__tree = tree
+        self.__rooms = []
+        split_map()
+        tree.root = 0
+        for node in tree.get_leaf_node():
+            create_room(node)
+        internal_nodes = list(tree.get_internal_node())
+        # 子の番号は親より大きいので, 番号の逆順にたどって部分木の最初と最後の部屋を伝播する
+        for node in reversed(internal_nodes):
+            tree.first_room[node] = tree.first_room[tree.left_node[node]]
+            tree.last_room[node] = tree.last_room[tree.right_node[node]]
+        self.__corridors = []
+        self.__room_graph = [[] for _ in self.__rooms]
+        for node in internal_nodes:
             create_load(node)
+
+
+class DungeonError(Exception):
+    pass
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    ダンジョンを生成して表示する
+
+    Args:
+        argv (Sequence[str], optional): コマンドライン引数. 省略時は sys.argv
+    """
+    parser = argparse.ArgumentParser(description="ダンジョンを生成して表示する")
+    parser.add_argument("--width", type=int, default=60)
+    parser.add_argument("--height", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    print(Dungeon(args.width, args.height, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
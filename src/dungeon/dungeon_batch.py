@@ -0,0 +1,155 @@
+from itertools import accumulate
+from multiprocessing import Pool, shared_memory
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from .dungeon import Dungeon
+
+
+class DungeonBatch:
+    """
+    DungeonBatchクラスは, generate_batch でまとめて生成したダンジョンのマップと処理性能を保持します
+
+    Attributes:
+        specs (list): 生成したダンジョンの (width, height, seed) のリスト
+        maps (list): 各ダンジョンの Area.code を格納した uint8 配列のリスト
+        seconds (float): 生成にかかった時間（秒）
+        processes (int): 生成に用いたプロセス数
+    """
+
+    def __init__(self, specs: List[Tuple[int, int, int]], maps: List[np.ndarray], seconds: float, processes: int):
+        self.specs = specs
+        self.maps = maps
+        self.seconds = seconds
+        self.processes = processes
+
+    def __len__(self) -> int:
+        return len(self.maps)
+
+    def get_throughput(self) -> float:
+        """
+        1秒あたりに生成したダンジョンの数を返す
+
+        Returns:
+            float: ダンジョン数/秒
+        """
+        return len(self.maps) / self.seconds if self.seconds > 0 else float("inf")
+
+    def get_cell_throughput(self) -> float:
+        """
+        1秒あたりに生成したセルの数を返す
+
+        Returns:
+            float: セル数/秒
+        """
+        cells = sum(width * height for width, height, _ in self.specs)
+        return cells / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _generate_into_shared_memory(shm_name: str, tasks: List[Tuple[int, int, int, int]]):
+    """
+    ダンジョンを生成し, 共有メモリ上の指定された位置へ書き込む（ワーカープロセスで実行される）
+
+    Args:
+        shm_name (str): 書き込み先の共有メモリの名前
+        tasks (list): (書き込み位置, width, height, seed) のリスト
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        for offset, width, height, seed in tasks:
+            target = np.ndarray((height, width), dtype=np.uint8, buffer=shm.buf, offset=offset)
+            target[:] = Dungeon(width, height, seed=seed).get_map()
+            del target
+    finally:
+        shm.close()
+
+
+def _generate_into_npy(path: str, tasks: List[Tuple[int, int, int, int]]):
+    """
+    ダンジョンを生成し, 積み重ねた .npy ファイルの指定された位置へ書き込む（ワーカープロセスで実行される）
+
+    Args:
+        path (str): 書き込み先の .npy ファイルのパス
+        tasks (list): (インデックス, width, height, seed) のリスト
+    """
+    maps = np.load(path, mmap_mode="r+")
+    for index, width, height, seed in tasks:
+        maps[index] = Dungeon(width, height, seed=seed).get_map()
+    maps.flush()
+    del maps
+
+
+def generate_batch(specs: Sequence[Tuple[int, int, int]], processes: Optional[int] = None,
+                   output_path: Optional[str] = None, chunksize: int = 16) -> DungeonBatch:
+    """
+    複数のダンジョンをプロセスプールで並列に生成する
+    生成結果は Dungeon オブジェクトを pickle して戻すのではなく, uint8 のマップだけを
+    共有メモリ（output_path を省略した場合）または1つの積み重ねた .npy ファイルへ直接書き込む
+
+    Args:
+        specs (Sequence[Tuple[int, int, int]]): 生成するダンジョンの (width, height, seed) のリスト
+        processes (int, optional): ワーカープロセス数. 省略時は CPU コア数
+        output_path (str, optional): 出力する .npy ファイルのパス. 指定した場合は全て同じ大きさであること
+        chunksize (int, optional): 1回のタスクでワーカーに渡すダンジョンの数. 既定値は16
+
+    Returns:
+        DungeonBatch: 生成したマップと処理性能
+
+    Raises:
+        ValueError: output_path を指定し, ダンジョンの大きさが揃っていない場合に発生します
+    """
+    specs = [tuple(spec) for spec in specs]
+    processes = processes or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if output_path is not None:
+        shapes = {(height, width) for width, height, _ in specs}
+        if len(shapes) > 1:
+            raise ValueError("All dungeons must have the same size to be stacked into one .npy file.")
+        height, width = shapes.pop() if shapes else (0, 0)
+        np.lib.format.open_memmap(output_path, mode="w+", dtype=np.uint8, shape=(len(specs), height, width)).flush()
+        tasks = [(index, width, height, seed) for index, (width, height, seed) in enumerate(specs)]
+        _run_chunks(_generate_into_npy, output_path, tasks, processes, chunksize)
+        maps = list(np.load(output_path, mmap_mode="r"))
+    else:
+        offsets = list(accumulate((width * height for width, height, _ in specs), initial=0))
+        shm = shared_memory.SharedMemory(create=True, size=max(offsets[-1], 1))
+        try:
+            tasks = [(offsets[i], width, height, seed) for i, (width, height, seed) in enumerate(specs)]
+            _run_chunks(_generate_into_shared_memory, shm.name, tasks, processes, chunksize)
+            buffer = np.frombuffer(shm.buf, dtype=np.uint8, count=offsets[-1]).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        maps = [
+            buffer[offsets[i]:offsets[i + 1]].reshape(height, width) for i, (width, height, _) in enumerate(specs)
+        ]
+
+    return DungeonBatch(specs, maps, time.perf_counter() - start, processes)
+
+
+def _run_chunks(worker, target: str, tasks: list, processes: int, chunksize: int):
+    """
+    タスクをチャンクに分け, ワーカー関数をプロセスプールで実行する
+
+    Args:
+        worker (callable): ワーカー関数
+        target (str): 書き込み先（共有メモリの名前またはファイルパス）
+        tasks (list): タスクのリスト
+        processes (int): プロセス数
+        chunksize (int): 1チャンクのタスク数
+    """
+    chunks = [(target, tasks[i:i + chunksize]) for i in range(0, len(tasks), chunksize)]
+    if processes == 1:
+        for chunk in chunks:
+            worker(*chunk)
+        return
+    with Pool(processes) as pool:
+        pool.starmap(worker, chunks)
+
+
+if __name__ == "__main__":
+    batch = generate_batch([(200, 200, seed) for seed in range(200)])
+    print(f"{len(batch)} dungeons in {batch.seconds:.2f}s ({batch.get_throughput():.1f} dungeons/s, "
+          f"{batch.get_cell_throughput() / 1e6:.2f} Mcells/s) with {batch.processes} processes")
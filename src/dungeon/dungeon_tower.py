@@ -0,0 +1,253 @@
+from collections import OrderedDict
+import os
+from typing import Optional, Tuple
+import numpy as np
+from ..rng.rng_provider import RngProvider
+from .dungeon import Dungeon
+
+
+class DungeonTower:
+    """
+    DungeonTowerクラスは, 複数の階層からなるダンジョンを階層ごとに遅延生成するためのクラスです
+    各階層のシード値は塔のシード値から決定的に導かれるため, 初めて訪れたときに生成し,
+    メモリから追い出した階層も同じ内容で再生成できます
+    プレイヤーが書き換えた階層は, persist_dir を指定した場合に限り追い出す前と flush の呼び出し時にディスクへ保存されます
+
+    階層 n の下り階段は階層 n+1 の上り階段に繋がり, どちらの位置も各階層のシード値だけから決まります
+
+    Attributes:
+        width (int): 各階層の横幅
+        height (int): 各階層の高さ
+        floor_count (int): 階層の数
+        seed (int): 塔のシード値
+
+    Example:
+        tower = DungeonTower(80, 50, floor_count=100, seed=42)
+        floor = tower.get_floor(0)  # 1階を生成して取得する
+        (next_floor, (x, y)) = tower.descend(0)  # 下り階段で移動した先の階層と到着位置を取得する
+        tower.flush()  # メモリ上の書き換えられた階層をディスクへ保存する
+    """
+
+    def __init__(self, width: int, height: int, floor_count: int = 100, seed: int = 0,
+                 max_live_floors: int = 8, persist_dir: Optional[str] = None):
+        """
+        コンストラクタ. この時点では階層を生成しない
+
+        Args:
+            width (int): 各階層の横幅
+            height (int): 各階層の高さ
+            floor_count (int, optional): 階層の数. 既定値は100
+            seed (int, optional): 塔のシード値. 既定値は0
+            max_live_floors (int, optional): メモリ上に保持する階層の数の上限. 既定値は8
+            persist_dir (str, optional): 書き換えられた階層を保存するディレクトリ. 省略時は保存しない
+        """
+        self.width = width
+        self.height = height
+        self.floor_count = floor_count
+        self.seed = seed
+        self.__rng_provider = RngProvider(seed)
+        self.__max_live_floors = max_live_floors
+        self.__persist_dir = persist_dir
+        if persist_dir is not None:
+            os.makedirs(persist_dir, exist_ok=True)
+
+        # 階層番号から (Dungeon, 階段を置いた直後のマップのバージョン) への LRU
+        self.__floors = OrderedDict()
+        self.__stairs = {}
+
+    def get_floor_seed(self, floor: int) -> int:
+        """
+        階層のシード値を求める
+
+        Args:
+            floor (int): 階層番号（0始まり）
+
+        Returns:
+            int: 階層のシード値
+        """
+        self.__check_floor(floor)
+        return self.__rng_provider.derive(floor, 0).spawn_seeds(1)[0]
+
+    def get_floor(self, floor: int) -> Dungeon:
+        """
+        階層を取得する. メモリ上になければ生成（または保存された内容を復元）する
+
+        Args:
+            floor (int): 階層番号（0始まり）
+
+        Returns:
+            Dungeon: 階層のダンジョン
+        """
+        self.__check_floor(floor)
+        entry = self.__floors.get(floor)
+        if entry is not None:
+            self.__floors.move_to_end(floor)
+            return entry[0]
+
+        dungeon = Dungeon(self.width, self.height, seed=self.get_floor_seed(floor))
+        self.__stairs[floor] = self.__place_stairs(floor, dungeon)
+        base_version = dungeon.get_version()
+        self.__restore(floor, dungeon)
+
+        self.__floors[floor] = (dungeon, base_version)
+        while len(self.__floors) > self.__max_live_floors:
+            evicted_floor, (evicted_dungeon, evicted_base_version) = self.__floors.popitem(last=False)
+            if evicted_dungeon.get_version() != evicted_base_version:
+                self.__persist(evicted_floor, evicted_dungeon)
+        return dungeon
+
+    def flush(self):
+        """
+        メモリ上の階層のうち, 書き換えられたものをディスクへ保存する
+        追い出されていない階層の書き換えはプロセスの終了時に失われるため, 終了前に呼び出す
+        persist_dir を指定していない場合は何もしない
+        """
+        if self.__persist_dir is None:
+            return
+        for floor, (dungeon, base_version) in self.__floors.items():
+            if dungeon.get_version() != base_version:
+                self.__persist(floor, dungeon)
+                # 保存した内容から変わっていなければ, 追い出すときに再び保存しない
+                self.__floors[floor] = (dungeon, dungeon.get_version())
+
+    def is_live(self, floor: int) -> bool:
+        """
+        階層がメモリ上にあるかどうかを返す
+
+        Args:
+            floor (int): 階層番号
+
+        Returns:
+            bool: メモリ上にあればTrue
+        """
+        return floor in self.__floors
+
+    def get_stairs(self, floor: int) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        階層の上り階段と下り階段の位置を取得する
+
+        Args:
+            floor (int): 階層番号
+
+        Returns:
+            tuple: (上り階段の座標, 下り階段の座標). 最上階の上り階段と最下階の下り階段は None
+        """
+        if floor not in self.__stairs:
+            self.get_floor(floor)
+        return self.__stairs[floor]
+
+    def descend(self, floor: int) -> Tuple[int, Tuple[int, int]]:
+        """
+        下り階段で1つ下の階層へ移動する
+
+        Args:
+            floor (int): 現在の階層番号
+
+        Returns:
+            tuple: (移動先の階層番号, 移動先の上り階段の座標)
+
+        Raises:
+            ValueError: 最下階から下りようとした場合に発生します
+        """
+        if floor + 1 >= self.floor_count:
+            raise ValueError("There is no floor below.")
+        self.get_floor(floor + 1)
+        return (floor + 1, self.get_stairs(floor + 1)[0])
+
+    def ascend(self, floor: int) -> Tuple[int, Tuple[int, int]]:
+        """
+        上り階段で1つ上の階層へ移動する
+
+        Args:
+            floor (int): 現在の階層番号
+
+        Returns:
+            tuple: (移動先の階層番号, 移動先の下り階段の座標)
+
+        Raises:
+            ValueError: 最上階から上ろうとした場合に発生します
+        """
+        if floor <= 0:
+            raise ValueError("There is no floor above.")
+        self.get_floor(floor - 1)
+        return (floor - 1, self.get_stairs(floor - 1)[1])
+
+    def __check_floor(self, floor: int):
+        """
+        階層番号が範囲内かを確認する
+
+        Args:
+            floor (int): 階層番号
+
+        Raises:
+            IndexError: 階層番号が範囲外の場合に発生します
+        """
+        if not 0 <= floor < self.floor_count:
+            raise IndexError("Floor is out of the tower.")
+
+    def __place_stairs(self, floor: int, dungeon: Dungeon) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        階層のシード値から決まる部屋に上り階段と下り階段を置く
+
+        Args:
+            floor (int): 階層番号
+            dungeon (Dungeon): 階層のダンジョン
+
+        Returns:
+            tuple: (上り階段の座標, 下り階段の座標). 部屋が無い階層では (None, None)
+        """
+        rng = self.__rng_provider.derive(floor, 1).python_random()
+        rooms = dungeon.get_rooms()
+        if not rooms:
+            return (None, None)
+        up_room, down_room = rng.sample(rooms, 2) if len(rooms) >= 2 else (rooms[0], rooms[0])
+
+        up_stairs = None
+        down_stairs = None
+        if floor > 0:
+            up_stairs = (rng.randint(up_room.left, up_room.right), rng.randint(up_room.top, up_room.bottom))
+            dungeon.set_area(*up_stairs, Dungeon.Area.UP_STAIRS)
+        if floor < self.floor_count - 1:
+            down_stairs = (rng.randint(down_room.left, down_room.right), rng.randint(down_room.top, down_room.bottom))
+            # 部屋が1つしかない場合でも上り階段と重ならない位置を選ぶ
+            while down_stairs == up_stairs:
+                down_stairs = (rng.randint(down_room.left, down_room.right), rng.randint(down_room.top, down_room.bottom))
+            dungeon.set_area(*down_stairs, Dungeon.Area.DOWN_STAIRS)
+        return (up_stairs, down_stairs)
+
+    def __persist_path(self, floor: int) -> str:
+        """
+        階層の保存先のパスを返す
+
+        Args:
+            floor (int): 階層番号
+
+        Returns:
+            str: 保存先のパス
+        """
+        return os.path.join(self.__persist_dir, f"floor_{floor}.npy")
+
+    def __persist(self, floor: int, dungeon: Dungeon):
+        """
+        書き換えられた階層のマップをディスクへ保存する
+
+        Args:
+            floor (int): 階層番号
+            dungeon (Dungeon): 階層のダンジョン
+        """
+        if self.__persist_dir is not None:
+            np.save(self.__persist_path(floor), dungeon.get_map())
+
+    def __restore(self, floor: int, dungeon: Dungeon):
+        """
+        保存された階層があれば, 再生成したダンジョンとの差分を書き戻す
+
+        Args:
+            floor (int): 階層番号
+            dungeon (Dungeon): 再生成した階層のダンジョン
+        """
+        if self.__persist_dir is None or not os.path.exists(self.__persist_path(floor)):
+            return
+        saved_map = np.load(self.__persist_path(floor))
+        for y, x in np.argwhere(saved_map != dungeon.get_map()).tolist():
+            dungeon.set_area(x, y, Dungeon.AREAS[saved_map[y, x]])
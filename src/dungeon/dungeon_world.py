@@ -0,0 +1,266 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+import numpy as np
+from ..rng.rng_provider import RngProvider
+from .dungeon import Dungeon
+
+
+# RngProvider.derive に渡すキーの先頭の値（チャンク, 横方向の境界, 縦方向の境界）
+_CHUNK_KEY = 0
+_AXIS_KEYS = {"h": 1, "v": 2}
+
+
+def _zigzag(value: int) -> int:
+    """
+    負の値も取るチャンクの座標を, RngProvider.derive のキーに使える0以上の整数に重ならないよう対応させる
+    0, -1, 1, -2, 2, ... を 0, 1, 2, 3, 4, ... に対応させる
+
+    Args:
+        value (int): 座標
+
+    Returns:
+        int: 0以上の整数
+    """
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _door_position(seed: int, axis: str, chunk_x: int, chunk_y: int, length: int) -> int:
+    """
+    チャンク境界の出入口の位置を決める. 境界を共有する両側のチャンクから同じ値が得られる
+
+    Args:
+        seed (int): ワールドのシード値
+        axis (str): "h" はチャンク (x, y) と (x+1, y) の境界, "v" は (x, y) と (x, y+1) の境界
+        chunk_x (int): 境界の左側（または上側）のチャンクのX座標
+        chunk_y (int): 境界の左側（または上側）のチャンクのY座標
+        length (int): 境界の長さ
+
+    Returns:
+        int: 境界に沿った出入口の位置（両端を除く）
+    """
+    rng = RngProvider(seed).derive(_AXIS_KEYS[axis], _zigzag(chunk_x), _zigzag(chunk_y)).python_random()
+    return rng.randint(1, length - 2)
+
+
+def build_chunk(seed: int, chunk_x: int, chunk_y: int, chunk_width: int, chunk_height: int) -> np.ndarray:
+    """
+    チャンクを生成する. チャンク内部は BSP のダンジョンで, 四辺の出入口から最寄りの部屋まで通路を掘る
+    プロセスプールでも実行できるよう, 結果は uint8 のマップだけを返す
+
+    Args:
+        seed (int): ワールドのシード値
+        chunk_x (int): チャンクのX座標
+        chunk_y (int): チャンクのY座標
+        chunk_width (int): チャンクの横幅
+        chunk_height (int): チャンクの高さ
+
+    Returns:
+        np.ndarray: チャンクの Area.code を格納した (chunk_height, chunk_width) の uint8 配列
+    """
+    chunk_seed = RngProvider(seed).derive(_CHUNK_KEY, _zigzag(chunk_x), _zigzag(chunk_y)).spawn_seeds(1)[0]
+    dungeon = Dungeon(chunk_width, chunk_height, seed=chunk_seed)
+    chunk = np.array(dungeon.get_map())
+
+    doors = [
+        (0, _door_position(seed, "h", chunk_x - 1, chunk_y, chunk_height)),
+        (chunk_width - 1, _door_position(seed, "h", chunk_x, chunk_y, chunk_height)),
+        (_door_position(seed, "v", chunk_x, chunk_y - 1, chunk_width), 0),
+        (_door_position(seed, "v", chunk_x, chunk_y, chunk_width), chunk_height - 1),
+    ]
+    for door_x, door_y in doors:
+        room = dungeon.nearest_room(door_x, door_y)
+        target_x = min(max(door_x, room.left), room.right)
+        target_y = min(max(door_y, room.top), room.bottom)
+        # 出入口から部屋まで, 横・縦の順に壁だけを通路に変える
+        for segment in (
+            chunk[door_y, min(door_x, target_x):max(door_x, target_x) + 1],
+            chunk[min(door_y, target_y):max(door_y, target_y) + 1, target_x],
+        ):
+            segment[segment == Dungeon.Area.WALL.code] = Dungeon.Area.LOAD.code
+    return chunk
+
+
+class DungeonWorld:
+    """
+    DungeonWorldクラスは, プレイヤーの移動に合わせてチャンク単位で生成される無限のダンジョンです
+    各チャンクは (ワールドのシード値, チャンク座標) から決定的に生成される BSP のダンジョンで,
+    隣り合うチャンクは境界上の共通の出入口で繋がります
+    プレイヤーの周囲のチャンクはバックグラウンドで先読みし, 離れたチャンクはメモリから追い出します
+
+    Attributes:
+        seed (int): ワールドのシード値
+        chunk_width (int): チャンクの横幅
+        chunk_height (int): チャンクの高さ
+
+    Example:
+        with DungeonWorld(seed=42) as world:
+            world.update_position(player_x, player_y)  # 周囲のチャンクの先読みと, 遠いチャンクの追い出し
+            area = world.get_area(player_x + 1, player_y)
+    """
+
+    def __init__(self, seed: int = 0, chunk_width: int = 64, chunk_height: int = 64,
+                 prefetch_radius: int = 1, evict_radius: int = 3, executor: Optional[Executor] = None):
+        """
+        コンストラクタ
+
+        Args:
+            seed (int, optional): ワールドのシード値. 既定値は0
+            chunk_width (int, optional): チャンクの横幅. 既定値は64
+            chunk_height (int, optional): チャンクの高さ. 既定値は64
+            prefetch_radius (int, optional): 先読みするチャンクの範囲（チャンク数）. 既定値は1
+            evict_radius (int, optional): これより離れたチャンクを追い出す範囲（チャンク数）. 既定値は3
+            executor (Executor, optional): チャンクを生成する Executor. 省略時はバックグラウンドスレッド1つ
+
+        Raises:
+            ValueError: チャンクが小さすぎる場合, または追い出す範囲が先読みの範囲より狭い場合に発生します
+        """
+        minimum_width = Dungeon.MIN_ROOM_WIDTH + Dungeon.ROOM_MARGIN * 2
+        minimum_height = Dungeon.MIN_ROOM_HEIGHT + Dungeon.ROOM_MARGIN * 2
+        if chunk_width < minimum_width or chunk_height < minimum_height:
+            raise ValueError("Chunk size is too small.")
+        if evict_radius < prefetch_radius:
+            raise ValueError("Evict radius must not be smaller than prefetch radius.")
+
+        self.seed = seed
+        self.chunk_width = chunk_width
+        self.chunk_height = chunk_height
+        self.__prefetch_radius = prefetch_radius
+        self.__evict_radius = evict_radius
+        self.__owns_executor = executor is None
+        self.__executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        self.__chunks: Dict[Tuple[int, int], np.ndarray] = {}
+        self.__pending: Dict[Tuple[int, int], Future] = {}
+
+    def __enter__(self) -> 'DungeonWorld':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        先読み中の生成を取り消し, 自前の Executor を終了する
+        """
+        for future in self.__pending.values():
+            future.cancel()
+        self.__pending.clear()
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=True)
+
+    def get_chunk_position(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        ワールド座標を含むチャンクの座標を求める
+
+        Args:
+            x (int): ワールドのX座標
+            y (int): ワールドのY座標
+
+        Returns:
+            tuple: チャンクの座標
+        """
+        return (x // self.chunk_width, y // self.chunk_height)
+
+    def update_position(self, x: int, y: int):
+        """
+        プレイヤーの位置を通知する. 周囲のチャンクの生成を予約し, 離れたチャンクを追い出す
+
+        Args:
+            x (int): プレイヤーのワールドX座標
+            y (int): プレイヤーのワールドY座標
+        """
+        center_x, center_y = self.get_chunk_position(x, y)
+        self.__collect_finished()
+
+        for key in [key for key in self.__chunks if self.__distance(key, center_x, center_y) > self.__evict_radius]:
+            del self.__chunks[key]
+        for key in [key for key in self.__pending if self.__distance(key, center_x, center_y) > self.__evict_radius]:
+            self.__pending.pop(key).cancel()
+
+        radius = self.__prefetch_radius
+        # 近いチャンクから順に予約する
+        nearby = sorted(
+            ((center_x + dx, center_y + dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)),
+            key=lambda key: self.__distance(key, center_x, center_y)
+        )
+        for key in nearby:
+            if key not in self.__chunks and key not in self.__pending:
+                self.__pending[key] = self.__executor.submit(
+                    build_chunk, self.seed, key[0], key[1], self.chunk_width, self.chunk_height
+                )
+
+    def get_chunk(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """
+        チャンクのマップを取得する. 先読み中であれば完了を待ち, 予約されていなければその場で生成する
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+
+        Returns:
+            np.ndarray: チャンクの Area.code を格納した uint8 配列
+        """
+        key = (chunk_x, chunk_y)
+        chunk = self.__chunks.get(key)
+        if chunk is not None:
+            return chunk
+
+        future = self.__pending.pop(key, None)
+        if future is not None and not future.cancelled():
+            chunk = future.result()
+        else:
+            chunk = build_chunk(self.seed, chunk_x, chunk_y, self.chunk_width, self.chunk_height)
+        self.__chunks[key] = chunk
+        return chunk
+
+    def get_area(self, x: int, y: int) -> Dungeon.Area:
+        """
+        ワールド座標のエリアの種類を取得する
+
+        Args:
+            x (int): ワールドのX座標
+            y (int): ワールドのY座標
+
+        Returns:
+            Dungeon.Area: 指定された位置のエリアの種類
+        """
+        chunk_x, chunk_y = self.get_chunk_position(x, y)
+        chunk = self.get_chunk(chunk_x, chunk_y)
+        return Dungeon.AREAS[chunk[y - chunk_y * self.chunk_height, x - chunk_x * self.chunk_width]]
+
+    def is_loaded(self, chunk_x: int, chunk_y: int) -> bool:
+        """
+        チャンクが生成済みでメモリ上にあるかどうかを返す
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+
+        Returns:
+            bool: メモリ上にあればTrue
+        """
+        self.__collect_finished()
+        return (chunk_x, chunk_y) in self.__chunks
+
+    def __collect_finished(self):
+        """
+        生成が完了したチャンクを先読み中の一覧から取り出す
+        """
+        for key in [key for key, future in self.__pending.items() if future.done()]:
+            future = self.__pending.pop(key)
+            if not future.cancelled():
+                self.__chunks[key] = future.result()
+
+    @staticmethod
+    def __distance(key: Tuple[int, int], center_x: int, center_y: int) -> int:
+        """
+        チャンク間のチェビシェフ距離を求める
+
+        Args:
+            key (tuple): チャンクの座標
+            center_x (int): 基準のチャンクのX座標
+            center_y (int): 基準のチャンクのY座標
+
+        Returns:
+            int: チャンク数で表した距離
+        """
+        return max(abs(key[0] - center_x), abs(key[1] - center_y))
@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from typing import Tuple
+import numpy as np
+from .dungeon import Dungeon
+
+
+class DungeonFOV:
+    """
+    DungeonFOVクラスは, ダンジョン上の視界（field of view）と視線（line of sight）を求めるためのクラスです
+    視界は再帰的シャドウキャスティングで求め, (位置, 半径) ごとにキャッシュします
+    ダンジョンのマップが書き換えられる（Dungeon.get_version が変わる）とキャッシュは破棄されます
+    壁は視線を遮りますが, 壁そのものは見えるものとして扱います
+
+    Example:
+        fov = DungeonFOV(dungeon)
+        visible = fov.compute(x, y, radius=8)  # visible[dy + 8, dx + 8] が (x + dx, y + dy) の可視判定
+        blocked = ~fov.line_of_sight(sources, targets)  # (N, 2) の座標配列の組をまとめて判定する
+    """
+
+    # 8つの八分円それぞれについて, 走査座標 (列, 行) をマップ上の (dx, dy) へ変換する係数
+    OCTANTS = (
+        (1, 0, 0, 1),
+        (0, 1, 1, 0),
+        (0, -1, 1, 0),
+        (-1, 0, 0, 1),
+        (-1, 0, 0, -1),
+        (0, -1, -1, 0),
+        (0, 1, -1, 0),
+        (1, 0, 0, -1),
+    )
+
+    def __init__(self, dungeon: Dungeon, max_cached_views: int = 1024):
+        """
+        コンストラクタ
+
+        Args:
+            dungeon (Dungeon): 対象のダンジョン
+            max_cached_views (int, optional): キャッシュする視界の数の上限. 既定値は1024
+        """
+        self.__dungeon = dungeon
+        self.__max_cached_views = max_cached_views
+        self.__cache = OrderedDict()
+        self.__version = None
+        self.__transparent = None
+
+    def compute(self, x: int, y: int, radius: int) -> np.ndarray:
+        """
+        指定された位置から見えるセルを求める
+
+        Args:
+            x (int): 視点のX座標
+            y (int): 視点のY座標
+            radius (int): 視界の半径
+
+        Returns:
+            np.ndarray: (2*radius+1, 2*radius+1) の読み取り専用の bool 配列
+                        [dy + radius, dx + radius] が座標 (x + dx, y + dy) の可視判定を表す
+        """
+        self.__refresh()
+        key = (x, y, radius)
+        visible = self.__cache.get(key)
+        if visible is not None:
+            self.__cache.move_to_end(key)
+            return visible
+
+        visible = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=np.bool_)
+        height, width = self.__transparent.shape
+        if 0 <= x < width and 0 <= y < height:
+            visible[radius, radius] = True
+            for octant in DungeonFOV.OCTANTS:
+                self.__cast_light(visible, x, y, radius, 1, 1.0, 0.0, octant)
+        visible.flags.writeable = False
+
+        self.__cache[key] = visible
+        if len(self.__cache) > self.__max_cached_views:
+            self.__cache.popitem(last=False)
+        return visible
+
+    def is_visible(self, x: int, y: int, radius: int, target_x: int, target_y: int) -> bool:
+        """
+        指定された位置から目標のセルが見えるかどうかを返す
+
+        Args:
+            x (int): 視点のX座標
+            y (int): 視点のY座標
+            radius (int): 視界の半径
+            target_x (int): 目標のX座標
+            target_y (int): 目標のY座標
+
+        Returns:
+            bool: 見える場合はTrue
+        """
+        dx, dy = target_x - x, target_y - y
+        if abs(dx) > radius or abs(dy) > radius:
+            return False
+        return bool(self.compute(x, y, radius)[dy + radius, dx + radius])
+
+    def line_of_sight(self, sources: np.ndarray, targets: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+        """
+        複数の (視点, 目標) の組について, 間に視線を遮る壁がないかをまとめて判定する
+        視点と目標を結ぶ線分上のセルを一括で求め, 両端を除くセルに壁があるかを調べる
+
+        Args:
+            sources (np.ndarray): 視点の (x, y) を行とした (N, 2) の整数配列
+            targets (np.ndarray): 目標の (x, y) を行とした (N, 2) の整数配列
+            chunk_size (int, optional): 一度に処理する組の数. メモリ使用量の上限になる. 既定値は4096
+
+        Returns:
+            np.ndarray: 視線が通る組を True とした長さ N の bool 配列
+        """
+        self.__refresh()
+        sources = np.asarray(sources, dtype=np.int64).reshape(-1, 2)
+        targets = np.asarray(targets, dtype=np.int64).reshape(-1, 2)
+        result = np.empty(len(sources), dtype=np.bool_)
+        for begin in range(0, len(sources), chunk_size):
+            end = begin + chunk_size
+            result[begin:end] = self.__line_of_sight_chunk(sources[begin:end], targets[begin:end])
+        return result
+
+    def __line_of_sight_chunk(self, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        line_of_sight の1チャンク分を判定する
+
+        Args:
+            sources (np.ndarray): 視点の (N, 2) 配列
+            targets (np.ndarray): 目標の (N, 2) 配列
+
+        Returns:
+            np.ndarray: 視線が通る組を True とした長さ N の bool 配列
+        """
+        delta = targets - sources
+        steps = np.abs(delta).max(axis=1)
+        max_steps = int(steps.max()) if len(steps) else 0
+        if max_steps < 2:
+            return np.ones(len(sources), dtype=np.bool_)
+
+        # 各組の線分を steps 等分した点を四捨五入してセルの座標にする（両端は含めない）
+        k = np.arange(1, max_steps)
+        ratio = k[np.newaxis, :] / np.maximum(steps, 1)[:, np.newaxis]
+        xs = np.floor(sources[:, 0:1] + delta[:, 0:1] * ratio + 0.5).astype(np.int64)
+        ys = np.floor(sources[:, 1:2] + delta[:, 1:2] * ratio + 0.5).astype(np.int64)
+        inside_line = k[np.newaxis, :] < steps[:, np.newaxis]
+
+        height, width = self.__transparent.shape
+        on_map = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        transparent = np.zeros(xs.shape, dtype=np.bool_)
+        transparent[on_map] = self.__transparent[ys[on_map], xs[on_map]]
+        return np.all(transparent | ~inside_line, axis=1)
+
+    def __refresh(self):
+        """
+        ダンジョンのマップが書き換えられていれば, 透過判定の配列を作り直してキャッシュを破棄する
+        """
+        version = self.__dungeon.get_version()
+        if version != self.__version:
+            self.__transparent = self.__dungeon.get_map() != Dungeon.Area.WALL.code
+            self.__cache.clear()
+            self.__version = version
+
+    def __cast_light(self, visible: np.ndarray, origin_x: int, origin_y: int, radius: int,
+                     row: int, start_slope: float, end_slope: float, octant: Tuple[int, int, int, int]):
+        """
+        1つの八分円について, 行ごとに光を投げて見えるセルを記録する（再帰的シャドウキャスティング）
+
+        Args:
+            visible (np.ndarray): 可視判定を書き込む配列
+            origin_x (int): 視点のX座標
+            origin_y (int): 視点のY座標
+            radius (int): 視界の半径
+            row (int): 走査を始める行（視点からの距離）
+            start_slope (float): 走査範囲の開始側の傾き
+            end_slope (float): 走査範囲の終了側の傾き
+            octant (tuple): 八分円の変換係数
+        """
+        if start_slope < end_slope:
+            return
+        xx, xy, yx, yy = octant
+        height, width = self.__transparent.shape
+        radius_squared = radius * radius
+        next_start_slope = start_slope
+        for distance in range(row, radius + 1):
+            blocked = False
+            dy = -distance
+            for dx in range(-distance, 1):
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start_slope < right_slope:
+                    continue
+                if end_slope > left_slope:
+                    break
+
+                map_dx = dx * xx + dy * xy
+                map_dy = dx * yx + dy * yy
+                map_x, map_y = origin_x + map_dx, origin_y + map_dy
+                inside = 0 <= map_x < width and 0 <= map_y < height
+                if dx * dx + dy * dy <= radius_squared and inside:
+                    visible[map_dy + radius, map_dx + radius] = True
+
+                opaque = not inside or not self.__transparent[map_y, map_x]
+                if blocked:
+                    if opaque:
+                        next_start_slope = right_slope
+                        continue
+                    blocked = False
+                    start_slope = next_start_slope
+                elif opaque and distance < radius:
+                    blocked = True
+                    self.__cast_light(visible, origin_x, origin_y, radius, distance + 1, start_slope, left_slope, octant)
+                    next_start_slope = right_slope
+            if blocked:
+                break
@@ -0,0 +1,228 @@
+from collections import OrderedDict
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+from .dungeon import Dungeon
+
+
+class DungeonPathfinder:
+    """
+    DungeonPathfinderクラスは, ダンジョンの生成時に作られる部屋と通路のグラフを使った階層的な経路探索を行います
+    まず部屋を頂点, 通路を辺とするグラフ上で経由する部屋と通路を決め,
+    次にそれらの部屋と通路に含まれるセルだけを対象にセル単位の A* 探索を行います
+    部屋間の距離は出発する部屋ごとに計算してキャッシュし, 以降の探索で再利用します
+
+    Example:
+        pathfinder = DungeonPathfinder(dungeon)
+        path = pathfinder.find_path((3, 4), (95, 60))  # 出発地点から目的地までのセルの座標のリスト
+    """
+
+    def __init__(self, dungeon: Dungeon, max_cached_rooms: int = 256):
+        """
+        コンストラクタ
+
+        Args:
+            dungeon (Dungeon): 対象のダンジョン
+            max_cached_rooms (int, optional): 部屋間の距離をキャッシュする出発部屋の数の上限. 既定値は256
+        """
+        self.__dungeon = dungeon
+        self.__rooms = dungeon.get_rooms()
+        self.__corridors = dungeon.get_corridors()
+        self.__room_graph = dungeon.get_room_graph()
+        self.__max_cached_rooms = max_cached_rooms
+        self.__distance_cache = OrderedDict()
+
+        # 通路のセルから通路の番号への対応表（通路同士が交差するセルは複数の通路に属する）
+        self.__corridor_cells = {}
+        for corridor in self.__corridors:
+            for cell in corridor.get_cells():
+                self.__corridor_cells.setdefault(cell, []).append(corridor.index)
+
+        # 部屋と部屋を結ぶ辺の重み（部屋の中心から通路を通って隣の部屋の中心までの歩数）
+        self.__edge_costs = [
+            DungeonPathfinder.__manhattan(self.__center(corridor.room_a), corridor.waypoints[0])
+            + len(corridor) - 1
+            + DungeonPathfinder.__manhattan(corridor.waypoints[-1], self.__center(corridor.room_b))
+            for corridor in self.__corridors
+        ]
+
+    def get_room_distances(self, room_index: int) -> Tuple[Dict[int, int], Dict[int, Tuple[int, int]]]:
+        """
+        指定された部屋から他の全ての部屋までの距離を求める. 計算結果はキャッシュされる
+
+        Args:
+            room_index (int): 出発する部屋の番号
+
+        Returns:
+            tuple: 部屋ごとの距離の辞書と, 部屋ごとの（直前の部屋, 通過した通路）の辞書
+        """
+        cached = self.__distance_cache.get(room_index)
+        if cached is not None:
+            self.__distance_cache.move_to_end(room_index)
+            return cached
+
+        distances = {room_index: 0}
+        previous = {}
+        heap = [(0, room_index)]
+        while heap:
+            distance, room = heapq.heappop(heap)
+            if distance > distances[room]:
+                continue
+            for neighbor, corridor_index in self.__room_graph[room]:
+                next_distance = distance + self.__edge_costs[corridor_index]
+                if next_distance < distances.get(neighbor, next_distance + 1):
+                    distances[neighbor] = next_distance
+                    previous[neighbor] = (room, corridor_index)
+                    heapq.heappush(heap, (next_distance, neighbor))
+
+        cached = (distances, previous)
+        self.__distance_cache[room_index] = cached
+        if len(self.__distance_cache) > self.__max_cached_rooms:
+            self.__distance_cache.popitem(last=False)
+        return cached
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        出発地点から目的地までの経路を探索する
+
+        Args:
+            start (tuple): 出発地点の座標
+            goal (tuple): 目的地の座標
+
+        Returns:
+            List[Tuple[int, int]] or None: 出発地点から目的地までのセルの座標のリスト（両端を含む）
+                                           出発地点か目的地が壁の場合, または経路がない場合は None
+        """
+        start_candidates = self.__locate(start)
+        goal_candidates = self.__locate(goal)
+        if not start_candidates or not goal_candidates:
+            return None
+
+        # 出発地点と目的地が属しうる部屋の組み合わせのうち, 部屋間の距離が最も短いものを選ぶ
+        best = None
+        for start_room, start_corridor in start_candidates:
+            distances, previous = self.get_room_distances(start_room)
+            for goal_room, goal_corridor in goal_candidates:
+                if goal_room not in distances:
+                    continue
+                cost = (
+                    DungeonPathfinder.__manhattan(start, self.__center(start_room))
+                    + distances[goal_room]
+                    + DungeonPathfinder.__manhattan(self.__center(goal_room), goal)
+                )
+                if best is None or cost < best[0]:
+                    best = (cost, start_room, start_corridor, goal_room, goal_corridor, previous)
+        if best is None:
+            return None
+
+        _, start_room, start_corridor, goal_room, goal_corridor, previous = best
+        route_rooms = [goal_room]
+        route_corridors = [corridor for corridor in (start_corridor, goal_corridor) if corridor is not None]
+        room = goal_room
+        while room != start_room:
+            room, corridor_index = previous[room]
+            route_rooms.append(room)
+            route_corridors.append(corridor_index)
+
+        allowed = self.__route_cells(route_rooms, route_corridors)
+        return DungeonPathfinder.__a_star(start, goal, allowed)
+
+    def __locate(self, cell: Tuple[int, int]) -> List[Tuple[int, Optional[int]]]:
+        """
+        セルが属する部屋を求める. 通路上のセルは, その通路が結ぶ両端の部屋を候補とする
+
+        Args:
+            cell (tuple): セルの座標
+
+        Returns:
+            List[Tuple[int, Optional[int]]]: （部屋の番号, 経由する通路の番号または None）のリスト
+        """
+        x, y = cell
+        room = self.__dungeon.find_room(x, y)
+        if room is not None:
+            return [(room.index, None)]
+        candidates = []
+        for corridor_index in self.__corridor_cells.get(cell, []):
+            corridor = self.__corridors[corridor_index]
+            candidates.append((corridor.room_a, corridor_index))
+            candidates.append((corridor.room_b, corridor_index))
+        return candidates
+
+    def __route_cells(self, route_rooms: List[int], route_corridors: List[int]) -> Set[Tuple[int, int]]:
+        """
+        経由する部屋と通路に含まれるセルの集合を求める
+
+        Args:
+            route_rooms (List[int]): 経由する部屋の番号のリスト
+            route_corridors (List[int]): 経由する通路の番号のリスト
+
+        Returns:
+            Set[Tuple[int, int]]: セルの座標の集合
+        """
+        cells = set()
+        for room_index in route_rooms:
+            room = self.__rooms[room_index]
+            cells.update((x, y) for y in range(room.top, room.bottom + 1) for x in range(room.left, room.right + 1))
+        for corridor_index in route_corridors:
+            cells.update(self.__corridors[corridor_index].get_cells())
+        return cells
+
+    def __center(self, room_index: int) -> Tuple[int, int]:
+        """
+        部屋の中心のセルの座標を求める
+
+        Args:
+            room_index (int): 部屋の番号
+
+        Returns:
+            tuple: 部屋の中心の座標
+        """
+        room = self.__rooms[room_index]
+        return ((room.left + room.right) // 2, (room.top + room.bottom) // 2)
+
+    @staticmethod
+    def __manhattan(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        """
+        2点間のマンハッタン距離を求める
+
+        Args:
+            a (tuple): 1点目の座標
+            b (tuple): 2点目の座標
+
+        Returns:
+            int: マンハッタン距離
+        """
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    @staticmethod
+    def __a_star(start: Tuple[int, int], goal: Tuple[int, int], allowed: Set[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+        """
+        許可されたセルだけを通る A* 探索を行う
+
+        Args:
+            start (tuple): 出発地点の座標
+            goal (tuple): 目的地の座標
+            allowed (Set[Tuple[int, int]]): 通行できるセルの集合
+
+        Returns:
+            List[Tuple[int, int]] or None: 出発地点から目的地までのセルの座標のリスト. 経路がない場合は None
+        """
+        costs = {start: 0}
+        previous = {}
+        heap = [(DungeonPathfinder.__manhattan(start, goal), 0, start)]
+        while heap:
+            _, cost, cell = heapq.heappop(heap)
+            if cell == goal:
+                path = [cell]
+                while cell in previous:
+                    cell = previous[cell]
+                    path.append(cell)
+                return path[::-1]
+            if cost > costs[cell]:
+                continue
+            x, y = cell
+            for neighbor in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if neighbor in allowed and cost + 1 < costs.get(neighbor, cost + 2):
+                    costs[neighbor] = cost + 1
+                    previous[neighbor] = cell
+                    heapq.heappush(heap, (cost + 1 + DungeonPathfinder.__manhattan(neighbor, goal), cost + 1, neighbor))
+        return None
@@ -0,0 +1,195 @@
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Optional, Tuple
+
+
+class LevelCache:
+    """
+    LevelCacheクラスは, シード値を指定して生成したマップ（Maze や Dungeon）を再利用するためのキャッシュです
+    キーは（クラス, サイズ, 生成アルゴリズム, シード値）で, メモリ上の LRU とディスク上のファイルの2段で保持します
+    同じシード値からは同じマップが生成されるので, キャッシュを破棄しても結果は変わりません
+
+    Attributes:
+        max_entries (int): メモリ上に保持するマップ数の上限
+        max_bytes (int or None): メモリ上に保持するマップの合計サイズ（pickle 後のバイト数）の上限
+        directory (str or None): ディスク上のキャッシュを置くディレクトリ. None の場合はディスクを使わない
+
+    Example:
+        cache = LevelCache(max_entries=64, directory="/var/cache/levels")
+        maze = cache.get(Maze, (21, 21), seed=42)  # 初回は生成し, 以降はキャッシュから返す
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = None, directory: Optional[str] = None):
+        """
+        コンストラクタ
+
+        Args:
+            max_entries (int, optional): メモリ上に保持するマップ数の上限. 既定値は128
+            max_bytes (int, optional): メモリ上に保持するマップの合計サイズの上限. 既定値は上限なし
+            directory (str, optional): ディスク上のキャッシュを置くディレクトリ. 既定値はディスクを使わない
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self.__entries = OrderedDict()
+        self.__total_bytes = 0
+
+    def __len__(self) -> int:
+        """
+        メモリ上に保持しているマップの数を返す
+
+        Returns:
+            int: 保持しているマップの数
+        """
+        return len(self.__entries)
+
+    def __contains__(self, key: Tuple) -> bool:
+        """
+        キーに対応するマップがメモリ上にあるかどうかを返す
+
+        Args:
+            key (tuple): make_key で作成したキー
+
+        Returns:
+            bool: メモリ上にあればTrue
+        """
+        return key in self.__entries
+
+    @staticmethod
+    def make_key(level_class: type, size: Tuple[int, int], seed: int, algorithm: Optional[str] = None) -> Tuple:
+        """
+        キャッシュのキーを作成する
+
+        Args:
+            level_class (type): マップのクラス
+            size (tuple): マップの横幅と高さ
+            seed (int): マップ生成に用いるシード値
+            algorithm (str, optional): 生成アルゴリズム名. 省略時はクラスの ALGORITHM 属性を用いる
+
+        Returns:
+            tuple: （クラス名, サイズ, 生成アルゴリズム, シード値）のタプル
+        """
+        if algorithm is None:
+            algorithm = getattr(level_class, "ALGORITHM", "default")
+        class_name = f"{level_class.__module__}.{level_class.__qualname__}"
+        return (class_name, tuple(size), algorithm, seed)
+
+    def get(self, level_class: type, size: Tuple[int, int], seed: int, algorithm: Optional[str] = None) -> Any:
+        """
+        マップを取得する. メモリ, ディスクの順に探し, どちらにもなければ生成して保存する
+        返されるオブジェクトはキャッシュと共有されるため, 呼び出し側で書き換えないこと
+
+        Args:
+            level_class (type): マップのクラス. (width, height, seed=seed) で生成できること
+            size (tuple): マップの横幅と高さ
+            seed (int): マップ生成に用いるシード値
+            algorithm (str, optional): 生成アルゴリズム名. 省略時はクラスの ALGORITHM 属性を用いる
+
+        Returns:
+            Any: 指定された条件のマップ
+
+        Raises:
+            ValueError: シード値が指定されていない場合に発生します
+        """
+        if seed is None:
+            raise ValueError("Seed must be specified to cache a level.")
+
+        key = LevelCache.make_key(level_class, size, seed, algorithm)
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+        data = self.__read_disk(key)
+        if data is not None:
+            level = pickle.loads(data)
+        else:
+            width, height = size
+            level = level_class(width, height, seed=seed)
+            # ディスクへの保存もサイズの上限もない場合, pickle したバイト列は使わないので作らない
+            if self.directory is not None or self.max_bytes is not None:
+                data = pickle.dumps(level, protocol=pickle.HIGHEST_PROTOCOL)
+                self.__write_disk(key, data)
+
+        byte_count = len(data) if data is not None else 0
+        self.__entries[key] = (level, byte_count)
+        self.__total_bytes += byte_count
+        self.__evict()
+        return level
+
+    def clear(self, disk: bool = False):
+        """
+        キャッシュを空にする
+
+        Args:
+            disk (bool, optional): True の場合はディスク上のキャッシュも削除する. 既定値はFalse
+        """
+        self.__entries.clear()
+        self.__total_bytes = 0
+        if disk and self.directory is not None:
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def __evict(self):
+        """
+        上限を超えている間, 最も長く使われていないマップをメモリから取り除く
+        ディスク上のキャッシュは残るので, 次回はディスクから読み込まれる
+        """
+        while len(self.__entries) > self.max_entries or (
+            self.max_bytes is not None and self.__total_bytes > self.max_bytes and len(self.__entries) > 1
+        ):
+            _, (_, size) = self.__entries.popitem(last=False)
+            self.__total_bytes -= size
+
+    def __path(self, key: Tuple) -> str:
+        """
+        キーに対応するキャッシュファイルのパスを返す
+
+        Args:
+            key (tuple): キャッシュのキー
+
+        Returns:
+            str: キャッシュファイルのパス
+        """
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".pickle")
+
+    def __read_disk(self, key: Tuple) -> Optional[bytes]:
+        """
+        ディスク上のキャッシュを読み込む
+
+        Args:
+            key (tuple): キャッシュのキー
+
+        Returns:
+            bytes or None: pickle されたマップ. キャッシュがない場合は None
+        """
+        if self.directory is None:
+            return None
+        try:
+            with open(self.__path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def __write_disk(self, key: Tuple, data: bytes):
+        """
+        ディスクへキャッシュを書き込む. 書き込み途中のファイルが読まれないよう, 一時ファイルから置き換える
+
+        Args:
+            key (tuple): キャッシュのキー
+            data (bytes): pickle されたマップ
+        """
+        if self.directory is None:
+            return
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, self.__path(key))
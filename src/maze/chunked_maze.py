@@ -0,0 +1,309 @@
+from collections import OrderedDict
+import os
+import random
+import tempfile
+from typing import Optional, Tuple
+import weakref
+import numpy as np
+from ..rng.rng_provider import RngProvider
+from .maze import Maze, MazeError
+
+
+# セルの種類と uint8 コードの対応表（ファイル初期値の0が壁になるように並べる）
+CELL_CODES = (Maze.Cell.WALL, Maze.Cell.FIELD, Maze.Cell.START, Maze.Cell.GOAL)
+WALL_CODE = CELL_CODES.index(Maze.Cell.WALL)
+FIELD_CODE = CELL_CODES.index(Maze.Cell.FIELD)
+START_CODE = CELL_CODES.index(Maze.Cell.START)
+GOAL_CODE = CELL_CODES.index(Maze.Cell.GOAL)
+
+# 掘り進める方向（x方向のオフセット, y方向のオフセット）
+DIRECTIONS = ((0, -2), (-2, 0), (0, 2), (2, 0))
+
+
+def carve_perfect_maze(grid: np.ndarray, rng: random.Random) -> None:
+    """
+    壁で埋められた uint8 配列に, 深さ優先探索で完全迷路（ループのない迷路）を掘る
+
+    配列の外周は書き換えず, 奇数座標のセルとその間の壁だけを掘るため,
+    外周を共有する隣接領域を別々に掘っても書き込みが重ならない
+    再帰ではなく明示的なスタックを用いるので, 大きな領域でも再帰上限に達しない
+
+    Args:
+        grid (np.ndarray): 掘る対象の2次元配列. 縦横ともに奇数の大きさで, 全て WALL_CODE であること
+        rng (random.Random): 掘る方向の選択に用いる乱数生成器
+    """
+    height, width = grid.shape
+    grid[1, 1] = FIELD_CODE
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        # 掘り進められる方向の検索
+        candidates = [
+            (dx, dy) for dx, dy in DIRECTIONS
+            if 0 < x + dx < width and 0 < y + dy < height and grid[y + dy, x + dx] == WALL_CODE
+        ]
+        # 掘り進める方向が存在しない場合は一つ戻る
+        if not candidates:
+            stack.pop()
+            continue
+
+        dx, dy = rng.choice(candidates)
+        grid[y + dy // 2, x + dx // 2] = FIELD_CODE
+        grid[y + dy, x + dx] = FIELD_CODE
+        stack.append((x + dx, y + dy))
+
+
+def _remove_file(path: str):
+    """
+    ファイルを削除する. すでに削除されている場合は何もしない
+
+    Args:
+        path (str): 削除するファイルのパス
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ChunkedMaze:
+    """
+    ChunkedMazeクラスは, メモリに載らない巨大な迷路をチャンク単位で遅延生成するためのクラスです
+    迷路のセルはディスク上のメモリマップドファイルに uint8 で格納され,
+    get_cell で参照されたチャンクだけが (seed, チャンク座標) から決定的に生成されます
+
+    各チャンクの内部は完全迷路として生成し, チャンク同士は左または上の隣接チャンクとだけ
+    1か所の通路で繋ぎます. チャンクを頂点とする全域木になるため, 迷路全体も連結でループのない迷路になります
+
+    Attributes:
+        width (int): 迷路の幅（セル数）. 奇数で指定する必要があります
+        height (int): 迷路の高さ（セル数）. 奇数で指定する必要があります
+        chunk_size (int): 1チャンクの1辺に含まれる通路セルの数
+        seed (int): 迷路生成に用いるシード値
+
+    Raises:
+        MazeError: 迷路の幅や高さが小さすぎる, もしくは偶数である場合に発生します
+
+    Example:
+        maze = ChunkedMaze(100001, 100001, seed=42)  # 幅・高さ100001の迷路を用意する（この時点では生成しない）
+        cell = maze.get_cell(50001, 70001)  # 参照したセルを含むチャンクだけが生成される
+    """
+
+    def __init__(self, width: int, height: int, seed: int = 0, chunk_size: int = 64,
+                 path: Optional[str] = None, max_cached_chunks: int = 256):
+        """
+        チャンク迷路クラスのコンストラクタ
+
+        Args:
+            width (int): 迷路の横幅
+            height (int): 迷路の高さ
+            seed (int, optional): 迷路生成に用いるシード値. 既定値は0
+            chunk_size (int, optional): 1チャンクの1辺に含まれる通路セルの数. 既定値は64
+            path (str, optional): セルを格納するファイルのパス. 省略時は一時ファイルを用いる
+            max_cached_chunks (int, optional): メモリ上に保持するチャンク数の上限. 既定値は256
+
+        Raises:
+            MazeError: 迷路の幅または高さが小さすぎる場合, または偶数である場合に発生します
+        """
+        if width < 5 or height < 5:
+            raise MazeError("Maze size is too small.")
+
+        if width % 2 == 0 or height % 2 == 0:
+            raise MazeError("Maze size must be specified in odd numbers.")
+
+        if chunk_size < 1:
+            raise MazeError("Chunk size must be a positive number.")
+
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.__max_cached_chunks = max_cached_chunks
+        self.__rng_provider = RngProvider(seed)
+
+        # 通路セルの数と, それを分割したチャンクの数
+        self.__cells_x = (width - 1) // 2
+        self.__cells_y = (height - 1) // 2
+        self.__chunks_x = -(-self.__cells_x // chunk_size)
+        self.__chunks_y = -(-self.__cells_y // chunk_size)
+
+        # 自分で作った一時ファイルは close で削除する. close を呼ばずに破棄された場合も finalize で削除する
+        self.__remove_file = None
+        if path is None:
+            file_descriptor, path = tempfile.mkstemp(suffix=".maze")
+            os.close(file_descriptor)
+            self.__remove_file = weakref.finalize(self, _remove_file, path)
+        self.path = path
+        # 新規ファイルは0（壁）で埋められた疎ファイルになるので, 未生成の領域はディスクを消費しない
+        self.__cells = np.memmap(path, dtype=np.uint8, mode="w+", shape=(height, width))
+        self.__generated = np.zeros((self.__chunks_y, self.__chunks_x), dtype=np.bool_)
+        self.__cache = OrderedDict()
+
+    def __enter__(self) -> 'ChunkedMaze':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        生成済みのセルをファイルへ書き出してファイルを閉じる. 一時ファイルを用いていた場合は削除する
+        閉じた後はセルを参照できない
+        """
+        if self.__cells is None:
+            return
+        self.__cells.flush()
+        self.__cells = None
+        self.__cache.clear()
+        if self.__remove_file is not None:
+            self.__remove_file()
+
+    def get_size(self) -> Tuple[int, int]:
+        """
+        迷路のサイズを取得する
+
+        Returns:
+            tuple: 迷路の横幅と高さを格納したタプル
+        """
+        return (self.width, self.height)
+
+    def get_chunk_count(self) -> Tuple[int, int]:
+        """
+        チャンクの横方向と縦方向の個数を取得する
+
+        Returns:
+            tuple: 横方向と縦方向のチャンク数を格納したタプル
+        """
+        return (self.__chunks_x, self.__chunks_y)
+
+    def get_cell(self, x: int, y: int) -> Maze.Cell:
+        """
+        指定された位置のセルの種類を取得する. 未生成のチャンクであればその場で生成する
+
+        Args:
+            x (int): 取得するセルのX座標
+            y (int): 取得するセルのY座標
+
+        Returns:
+            Cell: 指定された位置の Cell オブジェクト
+        """
+        if self.__cells is None:
+            raise MazeError("Maze is closed.")
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("Position is out of the maze.")
+
+        # 右端と下端の外壁はどのチャンクにも属さない
+        if x == self.width - 1 or y == self.height - 1:
+            return Maze.Cell.WALL
+
+        span = 2 * self.chunk_size
+        chunk = self.__load_chunk(x // span, y // span)
+        return CELL_CODES[chunk[y % span, x % span]]
+
+    def is_generated(self, chunk_x: int, chunk_y: int) -> bool:
+        """
+        指定されたチャンクが生成済みかどうかを返す
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+
+        Returns:
+            bool: 生成済みであればTrue
+        """
+        return bool(self.__generated[chunk_y, chunk_x])
+
+    def get_cached_chunk_count(self) -> int:
+        """
+        メモリ上に保持しているチャンクの数を取得する
+
+        Returns:
+            int: 保持しているチャンクの数
+        """
+        return len(self.__cache)
+
+    def flush(self):
+        """
+        生成済みのセルをファイルへ書き出す
+        """
+        if self.__cells is not None:
+            self.__cells.flush()
+
+    def __load_chunk(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """
+        チャンクを LRU キャッシュから取得する. キャッシュになければファイルから読み込む
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+
+        Returns:
+            np.ndarray: チャンクが所有するセルの配列
+        """
+        key = (chunk_x, chunk_y)
+        chunk = self.__cache.get(key)
+        if chunk is not None:
+            self.__cache.move_to_end(key)
+            return chunk
+
+        if not self.__generated[chunk_y, chunk_x]:
+            self.__generate_chunk(chunk_x, chunk_y)
+
+        # チャンクが所有するのは左端・上端の壁を含み, 右端・下端の壁を含まない範囲
+        x0, y0, cells_w, cells_h = self.__chunk_bounds(chunk_x, chunk_y)
+        chunk = np.array(self.__cells[y0:y0 + 2 * cells_h, x0:x0 + 2 * cells_w])
+        self.__cache[key] = chunk
+        if len(self.__cache) > self.__max_cached_chunks:
+            self.__cache.popitem(last=False)
+        return chunk
+
+    def __generate_chunk(self, chunk_x: int, chunk_y: int):
+        """
+        チャンクの迷路を生成し, ファイルへ書き込む
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+        """
+        x0, y0, cells_w, cells_h = self.__chunk_bounds(chunk_x, chunk_y)
+        rng = self.__rng_provider.derive(chunk_x, chunk_y).python_random()
+
+        tile = np.zeros((2 * cells_h + 1, 2 * cells_w + 1), dtype=np.uint8)
+        carve_perfect_maze(tile, rng)
+
+        # 親チャンク（左または上）との境界の壁に通路を1か所開ける
+        if chunk_x > 0 and (chunk_y == 0 or rng.random() < 0.5):
+            tile[2 * rng.randrange(cells_h) + 1, 0] = FIELD_CODE
+        elif chunk_y > 0:
+            tile[0, 2 * rng.randrange(cells_w) + 1] = FIELD_CODE
+
+        # 右端と下端の壁は隣接チャンクの所有なので書き込まない
+        own = tile[:-1, :-1]
+        if x0 <= 1 < x0 + own.shape[1] and y0 <= 1 < y0 + own.shape[0]:
+            own[1 - y0, 1 - x0] = START_CODE
+        goal_x, goal_y = self.width - 2, self.height - 2
+        if x0 <= goal_x < x0 + own.shape[1] and y0 <= goal_y < y0 + own.shape[0]:
+            own[goal_y - y0, goal_x - x0] = GOAL_CODE
+
+        self.__cells[y0:y0 + own.shape[0], x0:x0 + own.shape[1]] = own
+        self.__generated[chunk_y, chunk_x] = True
+
+    def __chunk_bounds(self, chunk_x: int, chunk_y: int) -> Tuple[int, int, int, int]:
+        """
+        チャンクの左上の座標と, チャンクに含まれる通路セルの数を求める
+
+        Args:
+            chunk_x (int): チャンクのX座標
+            chunk_y (int): チャンクのY座標
+
+        Returns:
+            tuple: 左上のX座標, 左上のY座標, 横方向の通路セル数, 縦方向の通路セル数
+        """
+        if not (0 <= chunk_x < self.__chunks_x and 0 <= chunk_y < self.__chunks_y):
+            raise IndexError("Chunk is out of the maze.")
+
+        first_x = chunk_x * self.chunk_size
+        first_y = chunk_y * self.chunk_size
+        cells_w = min(self.chunk_size, self.__cells_x - first_x)
+        cells_h = min(self.chunk_size, self.__cells_y - first_y)
+        return (2 * first_x, 2 * first_y, cells_w, cells_h)
@@ -0,0 +1,223 @@
+from collections import OrderedDict, deque
+from enum import Enum, unique
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+import numpy as np
+from .maze import Maze
+
+
+class FlowField:
+    """
+    FlowFieldクラスは, 迷路の全ての通路セルについて目的地へ向かう次の一歩の方向を事前計算したものです
+    目的地から一度だけ幅優先探索を行い, 各セルの向きを配列として保持するため,
+    多数のエージェントが同じ目的地へ向かう場合も, 1歩あたり配列を1回参照するだけで移動できます
+
+    Attributes:
+        target (tuple): 目的地の座標
+
+    Example:
+        field = get_flow_field(maze)  # ゴールへ向かうフローフィールドを取得する（迷路ごとにキャッシュされる）
+        (x, y) = field.next_position(1, 1)  # スタートから1歩進んだ座標を取得する
+        positions = field.step(positions)  # (N, 2) の座標配列をまとめて1歩進める
+    """
+
+    @unique
+    class Direction(Enum):
+        NONE = (0, 0, 0)
+        UP = (1, 0, -1)
+        RIGHT = (2, 1, 0)
+        DOWN = (3, 0, 1)
+        LEFT = (4, -1, 0)
+
+        def __init__(self, code, step_x, step_y):
+            self.code = code
+            self.step_x = step_x
+            self.step_y = step_y
+
+    # 方向コードから Direction と移動量への変換表
+    __DIRECTIONS = tuple(Direction)
+    STEP_X = np.array([direction.step_x for direction in Direction], dtype=np.int64)
+    STEP_Y = np.array([direction.step_y for direction in Direction], dtype=np.int64)
+
+    def __init__(self, maze: Maze, target: Optional[Tuple[int, int]] = None):
+        """
+        コンストラクタ. 目的地から幅優先探索を行い, 全ての通路セルの向きを求める
+
+        Args:
+            maze (Maze): 対象の迷路
+            target (tuple, optional): 目的地の座標. 省略時はゴール (width-2, height-2)
+
+        Raises:
+            ValueError: 目的地が壁の場合に発生します
+        """
+        width, height = maze.get_size()
+        if target is None:
+            target = (width - 2, height - 2)
+        target_x, target_y = target
+        if maze.get_cell(target_x, target_y) == Maze.Cell.WALL:
+            raise ValueError("Target must not be a wall.")
+        self.target = (target_x, target_y)
+
+        passable = np.array(
+            [[maze.get_cell(x, y) != Maze.Cell.WALL for x in range(width)] for y in range(height)], dtype=np.bool_
+        )
+        self.__distance = FlowField.__compute_distance(passable, target_x, target_y)
+        self.__directions = FlowField.__compute_directions(self.__distance)
+
+    @staticmethod
+    def __compute_distance(passable: np.ndarray, target_x: int, target_y: int) -> np.ndarray:
+        """
+        目的地から各セルまでの歩数を幅優先探索で求める
+
+        Args:
+            passable (np.ndarray): 通行可能なセルを True とした配列
+            target_x (int): 目的地のX座標
+            target_y (int): 目的地のY座標
+
+        Returns:
+            np.ndarray: 各セルから目的地までの歩数. 到達できないセルは -1
+        """
+        height, width = passable.shape
+        # 1次元の添字で探索し, 隣接セルは添字の加減算で求める
+        open_cells = passable.ravel().tolist()
+        distance = [-1] * (width * height)
+        start = target_y * width + target_x
+        distance[start] = 0
+        queue = deque([start])
+        offsets = (-width, 1, width, -1)
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            for offset in offsets:
+                neighbor = index + offset
+                # 迷路の外周は壁なので, 添字が配列の外に出ることはない
+                if open_cells[neighbor] and distance[neighbor] < 0:
+                    distance[neighbor] = next_distance
+                    queue.append(neighbor)
+        return np.array(distance, dtype=np.int32).reshape(height, width)
+
+    @staticmethod
+    def __compute_directions(distance: np.ndarray) -> np.ndarray:
+        """
+        歩数の配列から, 各セルで歩数が1つ小さい隣接セルへ向かう方向を一括で求める
+
+        Args:
+            distance (np.ndarray): 各セルから目的地までの歩数
+
+        Returns:
+            np.ndarray: 各セルの方向コードを格納した uint8 配列
+        """
+        padded = np.pad(distance, 1, constant_values=-1)
+        neighbors = {
+            FlowField.Direction.UP: padded[:-2, 1:-1],
+            FlowField.Direction.RIGHT: padded[1:-1, 2:],
+            FlowField.Direction.DOWN: padded[2:, 1:-1],
+            FlowField.Direction.LEFT: padded[1:-1, :-2],
+        }
+        directions = np.full(distance.shape, FlowField.Direction.NONE.code, dtype=np.uint8)
+        movable = distance > 0
+        for direction, neighbor_distance in neighbors.items():
+            toward = movable & (neighbor_distance == distance - 1) & (directions == FlowField.Direction.NONE.code)
+            directions[toward] = direction.code
+        return directions
+
+    def get_direction(self, x: int, y: int) -> 'FlowField.Direction':
+        """
+        指定されたセルから目的地へ向かう方向を取得する
+
+        Args:
+            x (int): セルのX座標
+            y (int): セルのY座標
+
+        Returns:
+            Direction: 進む方向. 壁・目的地・到達できないセルでは NONE
+        """
+        return FlowField.__DIRECTIONS[self.__directions[y, x]]
+
+    def get_distance(self, x: int, y: int) -> int:
+        """
+        指定されたセルから目的地までの歩数を取得する
+
+        Args:
+            x (int): セルのX座標
+            y (int): セルのY座標
+
+        Returns:
+            int: 目的地までの歩数. 到達できないセルは -1
+        """
+        return int(self.__distance[y, x])
+
+    def get_direction_map(self) -> np.ndarray:
+        """
+        全セルの方向コードの配列を取得する（読み取り専用）
+
+        Returns:
+            np.ndarray: Direction.code を格納した (height, width) の uint8 配列
+        """
+        directions = self.__directions.view()
+        directions.flags.writeable = False
+        return directions
+
+    def next_position(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        指定されたセルから目的地へ1歩進んだ座標を取得する
+
+        Args:
+            x (int): セルのX座標
+            y (int): セルのY座標
+
+        Returns:
+            tuple: 1歩進んだ座標. 進めない場合は元の座標
+        """
+        code = self.__directions[y, x]
+        return (x + int(FlowField.STEP_X[code]), y + int(FlowField.STEP_Y[code]))
+
+    def step(self, positions: np.ndarray) -> np.ndarray:
+        """
+        複数のエージェントの座標をまとめて1歩進める
+
+        Args:
+            positions (np.ndarray): (x, y) を行とした (N, 2) の整数配列
+
+        Returns:
+            np.ndarray: 1歩進んだ (N, 2) の座標配列
+        """
+        positions = np.asarray(positions)
+        codes = self.__directions[positions[:, 1], positions[:, 0]]
+        return np.stack((positions[:, 0] + FlowField.STEP_X[codes], positions[:, 1] + FlowField.STEP_Y[codes]), axis=1)
+
+
+# 迷路ごとのフローフィールドのキャッシュ. 迷路が破棄されると一緒に破棄される
+_flow_field_cache = WeakKeyDictionary()
+
+
+def get_flow_field(maze: Maze, target: Optional[Tuple[int, int]] = None, max_targets: int = 16) -> FlowField:
+    """
+    迷路と目的地に対応するフローフィールドを取得する. 計算済みであればキャッシュから返す
+
+    Args:
+        maze (Maze): 対象の迷路
+        target (tuple, optional): 目的地の座標. 省略時はゴール (width-2, height-2)
+        max_targets (int, optional): 迷路ごとに保持する目的地の数の上限. 既定値は16
+
+    Returns:
+        FlowField: 目的地へ向かうフローフィールド
+    """
+    if target is None:
+        width, height = maze.get_size()
+        target = (width - 2, height - 2)
+
+    fields = _flow_field_cache.get(maze)
+    if fields is None:
+        fields = OrderedDict()
+        _flow_field_cache[maze] = fields
+
+    field = fields.get(target)
+    if field is None:
+        field = FlowField(maze, target)
+        fields[target] = field
+        if len(fields) > max_targets:
+            fields.popitem(last=False)
+    else:
+        fields.move_to_end(target)
+    return field
@@ -1,5 +1,9 @@
+import argparse
 from enum import Enum, unique
 import random
+import struct
+import zlib
+from typing import List, Optional, Sequence, Tuple
 
 
 # 迷路クラス
@@ -10,6 +14,7 @@ class Maze:
     迷路の生成には, 深さ優先探索を用いたバックトラッキング法を採用しています
 
     Attributes:
+        ALGORITHM (str): 迷路の生成アルゴリズム名
         width (int): 迷路の幅（セル数）. 奇数で指定する必要があります
         height (int): 迷路の高さ（セル数）. 奇数で指定する必要があります
 
@@ -18,10 +23,23 @@ class Maze:
 
     Example:
         maze = Maze(21, 21)  # 幅21、高さ21の迷路を生成する
+        maze = Maze(21, 21, seed=42)  # シード値を指定すると同じ迷路を再生成できる
         print(maze)  # 生成された迷路を表示する
         (21, 21) = maze.get_size()  # 迷路のサイズを取得する
         cell = maze.get_cell(5, 7)  # 座標(5, 7)のセルの種類を取得する
+        maze.save("level.maze")  # 迷路をバイナリ形式で保存する
+        maze = Maze.load("level.maze")  # 保存した迷路を生成処理なしで読み込む
     """
+    ALGORITHM = "backtracking"
+
+    # バイナリ形式のヘッダ（識別子, バージョン, フラグ, 幅, 高さ, スタート座標, ゴール座標）
+    BINARY_MAGIC = b"MAZE"
+    BINARY_VERSION = 1
+    BINARY_HEADER = struct.Struct("<4sBBIIIIII")
+    BINARY_FLAG_COMPRESSED = 0x01
+    # スタート・ゴールのセルが無い場合に立てるフラグ（ヘッダの座標は使わない）
+    BINARY_FLAG_NO_START = 0x02
+    BINARY_FLAG_NO_GOAL = 0x04
 
     @unique
     class Cell(Enum):
@@ -30,7 +48,11 @@ class Maze:
         START = "S"
         GOAL = "G"
 
-    def __init__(self, width: int, height: int, start_x: int = 1, start_y: int = 1):
+    # セルの文字をビット（壁:1, それ以外:0）に置き換える変換表
+    __CHAR_TO_BIT = str.maketrans(Cell.WALL.value + Cell.FIELD.value + Cell.START.value + Cell.GOAL.value, "1000")
+
+    def __init__(self, width: int, height: int, start_x: int = 1, start_y: int = 1,
+                 seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """
         迷路クラスのコンストラクタ
 
@@ -39,6 +61,8 @@ class Maze:
             height (int): 迷路の高さ
             start_x (int, optional): スタート地点のX座標. 既定値は1
             start_y (int, optional): スタート地点のY座標. 既定値は1
+            seed (int, optional): 迷路生成に用いるシード値. 省略時は毎回異なる迷路を生成する
+            rng (random.Random, optional): 迷路生成に用いる乱数生成器. 指定した場合は seed より優先する
 
         Raises:
             MazeError: 迷路の幅または高さが小さすぎる場合, または偶数である場合に発生します
@@ -52,7 +76,24 @@ class Maze:
 
         self.width = width
         self.height = height
-        self.__generate_maze(start_x, start_y)
+        self.__generate_maze(start_x, start_y, rng if rng is not None else random.Random(seed))
+
+    @classmethod
+    def _from_cells(cls, cells: List[List['Maze.Cell']]) -> 'Maze':
+        """
+        生成済みのセルから迷路を組み立てる. 迷路の生成処理は行わない
+
+        Args:
+            cells (List[List[Cell]]): 行ごとのセルのリスト
+
+        Returns:
+            Maze: 与えられたセルを持つ Maze オブジェクト
+        """
+        maze = cls.__new__(cls)
+        maze.width = len(cells[0])
+        maze.height = len(cells)
+        maze.__maze = cells
+        return maze
 
     def __str__(self) -> str:
         """
@@ -68,29 +109,31 @@ class Maze:
             output += "\n"
         return output
 
-    def __generate_maze(self, start_x: int, start_y: int):
+    def __generate_maze(self, start_x: int, start_y: int, rng: random.Random):
         """
         迷路を生成する
 
         Args:
             start_x (int): スタート地点のX座標
             start_y (int): スタート地点のY座標
+            rng (random.Random): 迷路生成に用いる乱数生成器
         """
         self.__maze = [[Maze.Cell.WALL] * self.width for h in range(self.height)]
         # スタートの設定
         self.__maze[start_y][start_x] = Maze.Cell.START
         # 迷路の作成
-        self.__dig(start_x, start_y)
+        self.__dig(start_x, start_y, rng)
         # ゴールの設定
         self.__maze[self.height - 2][self.width - 2] = Maze.Cell.GOAL
 
-    def __dig(self, x: int, y: int):
+    def __dig(self, x: int, y: int, rng: random.Random):
         """
         迷路を掘り進める
 
         Args:
             x (int): 現在のX座標
             y (int): 現在のY座標
+            rng (random.Random): 掘る方向の選択に用いる乱数生成器
         """
         @unique
         class Direction(Enum):
@@ -115,23 +158,23 @@ class Maze:
             if len(directions) == 0:
                 break
 
-            direction = random.choice(directions)
+            direction = rng.choice(directions)
             if direction == Direction.UP:
                 self.__maze[y - 1][x] = Maze.Cell.FIELD
                 self.__maze[y - 2][x] = Maze.Cell.FIELD
-                self.__dig(x, y - 2)
+                self.__dig(x, y - 2, rng)
             if direction == Direction.RIGHT:
                 self.__maze[y][x - 1] = Maze.Cell.FIELD
                 self.__maze[y][x - 2] = Maze.Cell.FIELD
-                self.__dig(x - 2, y)
+                self.__dig(x - 2, y, rng)
             if direction == Direction.DOWN:
                 self.__maze[y + 1][x] = Maze.Cell.FIELD
                 self.__maze[y + 2][x] = Maze.Cell.FIELD
-                self.__dig(x, y + 2)
+                self.__dig(x, y + 2, rng)
             if direction == Direction.LEFT:
                 self.__maze[y][x + 1] = Maze.Cell.FIELD
                 self.__maze[y][x + 2] = Maze.Cell.FIELD
-                self.__dig(x + 2, y)
+                self.__dig(x + 2, y, rng)
 
     def get_size(self) -> (int, int):
         """
@@ -155,6 +198,146 @@ class Maze:
         """
         return self.__maze[y][x]
 
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """
+        迷路をバイナリ形式に変換する
+        壁を1, それ以外を0とした1セル1ビットの配列の前に, サイズとスタート・ゴールの座標を格納したヘッダを付ける
+        スタートやゴールのセルが無い場合（ゴールがスタートを上書きした場合など）は, 座標の代わりにフラグで示す
+
+        Args:
+            compress (bool, optional): True の場合はセルの配列を zlib で圧縮する. 既定値はFalse
+
+        Returns:
+            bytes: 迷路のバイナリ表現
+        """
+        flags = 0
+        start = self.__find_cell(Maze.Cell.START)
+        if start is None:
+            start = (0, 0)
+            flags |= Maze.BINARY_FLAG_NO_START
+        goal = self.__find_cell(Maze.Cell.GOAL)
+        if goal is None:
+            goal = (0, 0)
+            flags |= Maze.BINARY_FLAG_NO_GOAL
+
+        # セルの文字を0と1の文字列に置き換え, 2進数として一度にバイト列へ変換する
+        bits = "".join(cell.value for cells in self.__maze for cell in cells).translate(Maze.__CHAR_TO_BIT)
+        bits += "0" * (-len(bits) % 8)
+        payload = int(bits, 2).to_bytes(len(bits) // 8, "big") if bits else b""
+
+        if compress:
+            payload = zlib.compress(payload)
+            flags |= Maze.BINARY_FLAG_COMPRESSED
+        header = Maze.BINARY_HEADER.pack(
+            Maze.BINARY_MAGIC, Maze.BINARY_VERSION, flags,
+            self.width, self.height, *start, *goal
+        )
+        return header + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Maze':
+        """
+        バイナリ形式から迷路を復元する. 迷路の生成処理は行わない
+
+        Args:
+            data (bytes): to_bytes で作成したバイナリ表現
+
+        Returns:
+            Maze: 復元された迷路
+
+        Raises:
+            MazeError: バイナリ形式が不正な場合に発生します
+        """
+        if len(data) < Maze.BINARY_HEADER.size:
+            raise MazeError("Invalid maze data.")
+        magic, version, flags, width, height, start_x, start_y, goal_x, goal_y = Maze.BINARY_HEADER.unpack_from(data)
+        if magic != Maze.BINARY_MAGIC or version != Maze.BINARY_VERSION:
+            raise MazeError("Invalid maze data.")
+        if width == 0 or height == 0:
+            raise MazeError("Invalid maze data.")
+        if not flags & Maze.BINARY_FLAG_NO_START and (start_x >= width or start_y >= height):
+            raise MazeError("Invalid maze data.")
+        if not flags & Maze.BINARY_FLAG_NO_GOAL and (goal_x >= width or goal_y >= height):
+            raise MazeError("Invalid maze data.")
+
+        payload = data[Maze.BINARY_HEADER.size:]
+        if flags & Maze.BINARY_FLAG_COMPRESSED:
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error:
+                raise MazeError("Invalid maze data.") from None
+        cell_count = width * height
+        if len(payload) != (cell_count + 7) // 8:
+            raise MazeError("Invalid maze data.")
+
+        bits = bin(int.from_bytes(payload, "big"))[2:].zfill(len(payload) * 8) if payload else ""
+        bit_to_cell = {"0": Maze.Cell.FIELD, "1": Maze.Cell.WALL}
+        cells = [[bit_to_cell[bit] for bit in bits[y * width:(y + 1) * width]] for y in range(height)]
+        if not flags & Maze.BINARY_FLAG_NO_START:
+            cells[start_y][start_x] = Maze.Cell.START
+        if not flags & Maze.BINARY_FLAG_NO_GOAL:
+            cells[goal_y][goal_x] = Maze.Cell.GOAL
+        return cls._from_cells(cells)
+
+    def save(self, path: str, compress: bool = False):
+        """
+        迷路をバイナリ形式でファイルに保存する
+
+        Args:
+            path (str): 保存先のファイルパス
+            compress (bool, optional): True の場合はセルの配列を zlib で圧縮する. 既定値はFalse
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes(compress))
+
+    @classmethod
+    def load(cls, path: str) -> 'Maze':
+        """
+        バイナリ形式のファイルから迷路を読み込む
+
+        Args:
+            path (str): 読み込むファイルパス
+
+        Returns:
+            Maze: 読み込んだ迷路
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __find_cell(self, target: 'Maze.Cell') -> Optional[Tuple[int, int]]:
+        """
+        指定された種類のセルの座標を探す
+
+        Args:
+            target (Cell): 探すセルの種類
+
+        Returns:
+            Optional[Tuple[int, int]]: 見つかったセルの座標. 見つからない場合は None
+        """
+        for y, cells in enumerate(self.__maze):
+            if target in cells:
+                return (cells.index(target), y)
+        return None
+
 
 class MazeError(Exception):
     pass
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    迷路を生成して表示する
+
+    Args:
+        argv (Sequence[str], optional): コマンドライン引数. 省略時は sys.argv
+    """
+    parser = argparse.ArgumentParser(description="迷路を生成して表示する")
+    parser.add_argument("--width", type=int, default=21)
+    parser.add_argument("--height", type=int, default=21)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    print(Maze(args.width, args.height, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+from multiprocessing import Pool, shared_memory
+import os
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from .maze import Maze, MazeError
+from .chunked_maze import CELL_CODES, FIELD_CODE, START_CODE, GOAL_CODE, carve_perfect_maze
+from ..rng.rng_provider import RngProvider
+
+# 既定の領域の数. 領域ごとにシード値を割り当てるため, 同じシード値から同じ迷路を作れるよう
+# ワーカープロセス数（CPU コア数）ではなく固定の値にする
+DEFAULT_REGION_COUNT = 16
+
+
+def _carve_region(shm_name: str, width: int, height: int, first_row: int, last_row: int, seed: int):
+    """
+    共有メモリ上の迷路のうち, 指定された帯状の領域に完全迷路を掘る（ワーカープロセスで実行される）
+
+    Args:
+        shm_name (str): 迷路を格納した共有メモリの名前
+        width (int): 迷路の横幅
+        height (int): 迷路の高さ
+        first_row (int): 領域に含まれる最初の通路セルの行番号
+        last_row (int): 領域に含まれる最後の通路セルの次の行番号
+        seed (int): この領域の迷路生成に用いるシード値
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        grid = np.ndarray((height, width), dtype=np.uint8, buffer=shm.buf)
+        carve_perfect_maze(grid[2 * first_row:2 * last_row + 1, :], random.Random(seed))
+        del grid
+    finally:
+        shm.close()
+
+
+def generate_parallel_grid(width: int, height: int, processes: Optional[int] = None,
+                           regions: Optional[int] = None, seed: int = 0) -> np.ndarray:
+    """
+    迷路を帯状の領域に分割し, 各領域を別プロセスで生成した迷路を uint8 配列で返す
+
+    各ワーカーは共有メモリへ直接書き込むため, 生成結果をプロセス間でコピーしない
+    最後に隣り合う領域の境界の壁に1か所ずつ通路を開けるので, 全体も連結でループのない迷路になる
+
+    Args:
+        width (int): 迷路の横幅
+        height (int): 迷路の高さ
+        processes (int, optional): ワーカープロセス数. 省略時は CPU コア数
+        regions (int, optional): 分割する領域の数. 省略時は DEFAULT_REGION_COUNT（通路の行数が少ない場合は行数）
+        seed (int, optional): 迷路生成に用いるシード値. 既定値は0
+
+    Returns:
+        np.ndarray: 各セルを chunked_maze.CELL_CODES のコードで表した配列
+
+    Raises:
+        MazeError: 迷路の幅または高さが小さすぎる場合, または偶数である場合に発生します
+    """
+    if width < 5 or height < 5:
+        raise MazeError("Maze size is too small.")
+
+    if width % 2 == 0 or height % 2 == 0:
+        raise MazeError("Maze size must be specified in odd numbers.")
+
+    processes = processes or os.cpu_count() or 1
+    cells_y = (height - 1) // 2
+    regions = max(1, min(regions or DEFAULT_REGION_COUNT, cells_y))
+    bounds = [cells_y * i // regions for i in range(regions + 1)]
+
+    shm = shared_memory.SharedMemory(create=True, size=width * height)
+    try:
+        grid = np.ndarray((height, width), dtype=np.uint8, buffer=shm.buf)
+        grid[:] = 0
+        # 領域ごとに互いに独立したシード値を割り当てる
+        provider = RngProvider(seed)
+        region_seeds = provider.spawn_seeds(regions)
+        tasks = [
+            (shm.name, width, height, bounds[i], bounds[i + 1], region_seeds[i]) for i in range(regions)
+        ]
+        if processes == 1:
+            for task in tasks:
+                _carve_region(*task)
+        else:
+            with Pool(processes) as pool:
+                pool.starmap(_carve_region, tasks)
+
+        # 隣り合う領域の境界の壁に通路を1か所ずつ開けて連結する
+        rng = provider.python_random()
+        cells_x = (width - 1) // 2
+        for boundary in bounds[1:-1]:
+            grid[2 * boundary, 2 * rng.randrange(cells_x) + 1] = FIELD_CODE
+
+        grid[1, 1] = START_CODE
+        grid[height - 2, width - 2] = GOAL_CODE
+        result = grid.copy()
+        del grid
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+
+def generate_parallel(width: int, height: int, processes: Optional[int] = None,
+                      regions: Optional[int] = None, seed: int = 0) -> Maze:
+    """
+    迷路を複数プロセスで並列に生成し, Maze オブジェクトとして返す
+
+    Args:
+        width (int): 迷路の横幅
+        height (int): 迷路の高さ
+        processes (int, optional): ワーカープロセス数. 省略時は CPU コア数
+        regions (int, optional): 分割する領域の数. 省略時は DEFAULT_REGION_COUNT（通路の行数が少ない場合は行数）
+        seed (int, optional): 迷路生成に用いるシード値. 既定値は0
+
+    Returns:
+        Maze: 生成された迷路
+    """
+    grid = generate_parallel_grid(width, height, processes, regions, seed)
+    return Maze._from_cells([[CELL_CODES[code] for code in row] for row in grid.tolist()])
+
+
+def measure_speedup(width: int, height: int, process_counts: Sequence[int] = (1, 2, 4, 8),
+                    seed: int = 0) -> List[Dict[str, float]]:
+    """
+    プロセス数ごとの生成時間を計測し, 1プロセスに対する高速化率を求める
+
+    Args:
+        width (int): 迷路の横幅
+        height (int): 迷路の高さ
+        process_counts (Sequence[int], optional): 計測するプロセス数の一覧
+        seed (int, optional): 迷路生成に用いるシード値. 既定値は0
+
+    Returns:
+        List[Dict[str, float]]: プロセス数, 生成時間（秒）, 高速化率を格納した辞書のリスト
+    """
+    results = []
+    for processes in process_counts:
+        start = time.perf_counter()
+        generate_parallel_grid(width, height, processes=processes, seed=seed)
+        elapsed = time.perf_counter() - start
+        results.append({"processes": processes, "seconds": elapsed})
+
+    baseline = results[0]["seconds"]
+    for result in results:
+        result["speedup"] = baseline / result["seconds"]
+    return results
+
+
+if __name__ == "__main__":
+    for result in measure_speedup(2001, 2001):
+        print(f"processes={result['processes']:2d}  {result['seconds']:8.3f}s  speedup x{result['speedup']:.2f}")
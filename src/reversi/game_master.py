@@ -1,5 +1,5 @@
-from reversi_board import ReversiBoard
-from player import *
+from .reversi_board import ReversiBoard
+from .player import ReversiHumanPlayer, ReversiPlayer, ReversiRandomPlayer
 from typing import Optional
 
 
@@ -39,7 +39,7 @@ class InvalidStoneColorError(Exception):
     pass
 
 
-if __name__=="__main__":
+def main():
     black_player = ReversiRandomPlayer(ReversiBoard.Stone.BLACK)
     white_player = ReversiHumanPlayer(ReversiBoard.Stone.WHITE)
     game_master = ReversiGameMaster(black_player, white_player)
@@ -47,4 +47,8 @@ if __name__=="__main__":
     if game_master.get_winner() is not None:
         print(f"Winner : {game_master.get_winner().value}")
     else:
-        print("Draw")
\ No newline at end of file
+        print("Draw")
+
+
+if __name__=="__main__":
+    main()
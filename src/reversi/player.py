@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 import random
 from copy import deepcopy
-from reversi_board import ReversiBoard
-import curses
-from typing import Tuple, List
+from .reversi_board import ReversiBoard
+from typing import Tuple, List, Optional
 
 
 class ReversiPlayer(ABC):
@@ -36,6 +35,9 @@ class ReversiHumanPlayer(ReversiPlayer):
         reversi_board.put_stone(put_x, put_y, self._stone_color)
 
     def __choose_position_with_arrow_keys(self, reversi_board: ReversiBoard, placeable_positions: List[Tuple[int, int]]) -> Tuple[int, int]:
+        # curses は人間が打つときにだけ読み込み, AI 同士で対戦するワーカーには読み込ませない
+        import curses
+
         def display_positions(stdscr, select_index):
             stdscr.clear()
             stdscr.addstr(0, 0, "Current board:\n")
@@ -73,13 +75,14 @@ class ReversiHumanPlayer(ReversiPlayer):
         return curses.wrapper(main)
 
 class ReversiRandomPlayer(ReversiPlayer):
-    def __init__(self, stone_color: ReversiBoard.Stone):
+    def __init__(self, stone_color: ReversiBoard.Stone, rng: Optional[random.Random] = None):
         super().__init__(stone_color)
+        self.__rng = rng if rng is not None else random.Random()
 
     def play(self, reversi_board: ReversiBoard) -> None:
         placeable_positions = reversi_board.get_placeable_positions(self._stone_color)
         if placeable_positions:
-            selected_position = random.choice(placeable_positions)
+            selected_position = self.__rng.choice(placeable_positions)
             put_x, put_y = selected_position
             reversi_board.put_stone(put_x, put_y, self._stone_color)
 
@@ -0,0 +1,113 @@
+import random
+from typing import List, Optional
+import numpy as np
+
+
+# derive で作る子のキーの先頭に付ける印（spawn の子のキーは生成順の番号なので, 十分大きな値にする）
+_DERIVE_MARK = 2 ** 32
+
+
+class RngProvider:
+    """
+    RngProviderクラスは, 1つのシード値から互いに独立した乱数生成器を作ります
+    numpy.random.SeedSequence の spawn で子の SeedSequence を作るため, 作った乱数生成器どうしの系列は
+    統計的に独立で, 同じシード値からは同じ順番で同じ乱数生成器が作られます
+
+    ワーカーごとに spawn した RngProvider を渡せば, 並列に実行しても結果はワーカーの数や実行順によらず再現できます
+
+    Attributes:
+        seed_sequence (np.random.SeedSequence): 乱数生成器の元になる SeedSequence
+
+    Example:
+        provider = RngProvider(seed=0)
+        maze = Maze(21, 21, rng=provider.python_random())
+        trump = Trump(rng=provider.python_random())
+        workers = provider.spawn(8)  # ワーカーごとの RngProvider
+        chunk_rng = provider.derive(3, 5).python_random()  # 位置などのキーから, 生成順によらない乱数生成器を作る
+    """
+
+    def __init__(self, seed: Optional[int] = None, seed_sequence: Optional[np.random.SeedSequence] = None):
+        """
+        コンストラクタ
+
+        Args:
+            seed (int, optional): シード値. 省略時は OS のエントロピーから作る
+            seed_sequence (np.random.SeedSequence, optional): 元になる SeedSequence. 指定した場合は seed より優先する
+        """
+        self.seed_sequence = seed_sequence if seed_sequence is not None else np.random.SeedSequence(seed)
+
+    def get_entropy(self) -> int:
+        """
+        元になったエントロピーを返す. seed を省略した場合でも, この値を seed に渡せば同じ乱数生成器を作り直せる
+
+        Returns:
+            int: エントロピー
+        """
+        return self.seed_sequence.entropy
+
+    def spawn(self, n: int) -> List["RngProvider"]:
+        """
+        互いに独立した子の RngProvider を n 個作る. 呼び出すたびに新しい子が作られる
+
+        Args:
+            n (int): 作る数
+
+        Returns:
+            List[RngProvider]: 子の RngProvider のリスト
+        """
+        return [RngProvider(seed_sequence=child) for child in self.seed_sequence.spawn(n)]
+
+    def derive(self, *key: int) -> "RngProvider":
+        """
+        キーから子の RngProvider を作る. 生成順によらず, 同じキーからは常に同じ子が作られる
+        チャンクの座標や階層の番号など, 任意の順番で作り直す必要があるものに用いる
+        spawn で作る子とはキーが重ならないよう, キーの先頭に印を付ける
+
+        Args:
+            *key (int): 0以上の整数のキー
+
+        Returns:
+            RngProvider: 子の RngProvider
+
+        Raises:
+            ValueError: キーに負の値が含まれる場合に発生します
+        """
+        if any(k < 0 for k in key):
+            raise ValueError("Keys must be non-negative integers.")
+        parent = self.seed_sequence
+        child = np.random.SeedSequence(parent.entropy, spawn_key=tuple(parent.spawn_key) + (_DERIVE_MARK,) + key,
+                                       pool_size=parent.pool_size)
+        return RngProvider(seed_sequence=child)
+
+    def python_random(self) -> random.Random:
+        """
+        独立した random.Random を作る. 呼び出すたびに新しい系列の乱数生成器が作られる
+
+        Returns:
+            random.Random: 乱数生成器
+        """
+        child, = self.seed_sequence.spawn(1)
+        return random.Random(int.from_bytes(child.generate_state(8).tobytes(), "little"))
+
+    def numpy_generator(self) -> np.random.Generator:
+        """
+        独立した numpy.random.Generator を作る. 呼び出すたびに新しい系列の乱数生成器が作られる
+
+        Returns:
+            np.random.Generator: 乱数生成器
+        """
+        child, = self.seed_sequence.spawn(1)
+        return np.random.default_rng(child)
+
+    def spawn_seeds(self, n: int) -> List[int]:
+        """
+        互いに独立した64ビットのシード値を n 個作る. 整数のシード値しか受け取らない処理やワーカーに渡すために用いる
+
+        Args:
+            n (int): 作る数
+
+        Returns:
+            List[int]: シード値のリスト
+        """
+        return [int(child.generate_state(2, dtype=np.uint64)[0]) for child in self.seed_sequence.spawn(n)]
+
@@ -0,0 +1,547 @@
+import argparse
+from enum import Enum, unique
+from multiprocessing import Pool
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..rng.rng_provider import RngProvider
+from .trump import JOKER_CODES, NUMBER_COUNT
+from .shoe import Shoe
+
+
+@unique
+class Action(Enum):
+    """
+    プレイヤーの行動を表す列挙型
+
+    Attributes:
+        HIT (Action): ヒット
+        STAND (Action): スタンド
+        DOUBLE (Action): ダブルダウン. できない場合はヒット
+        DOUBLE_OR_STAND (Action): ダブルダウン. できない場合はスタンド
+        SPLIT (Action): スプリット
+    """
+    HIT = "H"
+    STAND = "S"
+    DOUBLE = "D"
+    DOUBLE_OR_STAND = "Ds"
+    SPLIT = "P"
+
+    def __init__(self, mark):
+        self.mark = mark
+
+
+# ディーラーのアップカードの値（2〜10, A は 11）と, 戦略表の列の並び
+UPCARDS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+# カードのコードから点数（A は 11）への変換表
+CODE_VALUES = tuple(min(code % NUMBER_COUNT + 1, 10) if code % NUMBER_COUNT else 11 for code in range(JOKER_CODES[0]))
+# カードのコードから Hi-Lo のカウント値への変換表（2〜6 は +1, 7〜9 は 0, 10 と A は -1）
+HI_LO_VALUES = tuple(1 if value <= 6 else (0 if value <= 9 else -1) for value in CODE_VALUES)
+
+
+class Rules:
+    """
+    ブラックジャックのルールを表すクラス
+
+    Attributes:
+        deck_count (int): シューの組数
+        penetration (float): シャッフルまでに配るカードの割合
+        dealer_hits_soft_17 (bool): ディーラーがソフト17でヒットするかどうか
+        blackjack_payout (float): ブラックジャックの配当
+        double_after_split (bool): スプリット後のダブルダウンを認めるかどうか
+        max_hands (int): スプリットで作れる手札の最大数
+    """
+
+    def __init__(self, deck_count: int = 6, penetration: float = 0.75, dealer_hits_soft_17: bool = False,
+                 blackjack_payout: float = 1.5, double_after_split: bool = True, max_hands: int = 4):
+        self.deck_count = deck_count
+        self.penetration = penetration
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.blackjack_payout = blackjack_payout
+        self.double_after_split = double_after_split
+        self.max_hands = max_hands
+
+
+class Strategy:
+    """
+    Strategyクラスは, 手札とディーラーのアップカードから行動を引く戦略表です
+    ハードの合計・ソフトの合計・ペアごとに, アップカード 2〜A の10列の行動を持ちます
+    表にない合計は, ハード・ソフトとも 17 以上はスタンド, それ未満はヒットになります
+
+    Attributes:
+        bet_ramp (list): (トゥルーカウントの下限, 賭ける単位数) のリスト. 空の場合は常に1単位
+
+    Example:
+        strategy = Strategy.basic()
+        action = strategy.decide([10, 6], 10)  # 10 と 6 の手札, ディーラーのアップカード 10 → Action.HIT
+    """
+
+    def __init__(self, hard: Dict[int, str], soft: Dict[int, str], pairs: Dict[int, str],
+                 bet_ramp: Sequence[Tuple[float, int]] = ()):
+        """
+        コンストラクタ
+
+        Args:
+            hard (Dict[int, str]): ハードの合計から, アップカードごとの行動の記号を空白で区切った文字列への辞書
+            soft (Dict[int, str]): ソフトの合計から, 同様の文字列への辞書
+            pairs (Dict[int, str]): ペアのカードの点数（A は 11）から, 同様の文字列への辞書
+            bet_ramp (Sequence[Tuple[float, int]], optional): (トゥルーカウントの下限, 賭ける単位数) のリスト
+
+        Raises:
+            ValueError: 行動の数がアップカードの数と一致しない場合に発生します
+        """
+        self.__hard = Strategy.__parse(hard)
+        self.__soft = Strategy.__parse(soft)
+        self.__pairs = Strategy.__parse(pairs)
+        self.bet_ramp = sorted(bet_ramp, reverse=True)
+
+    @staticmethod
+    def __parse(rows: Dict[int, str]) -> Dict[int, Tuple[Action, ...]]:
+        """
+        行動の記号の文字列を Action の行に変換する
+
+        Args:
+            rows (Dict[int, str]): 合計から行動の記号の文字列への辞書
+
+        Returns:
+            Dict[int, Tuple[Action, ...]]: 合計からアップカードごとの行動への辞書
+        """
+        table = {}
+        for total, row in rows.items():
+            actions = tuple(Action(mark) for mark in row.split())
+            if len(actions) != len(UPCARDS):
+                raise ValueError("Each strategy row must have one action per dealer upcard.")
+            table[total] = actions
+        return table
+
+    @classmethod
+    def basic(cls, bet_ramp: Sequence[Tuple[float, int]] = ()) -> 'Strategy':
+        """
+        複数組のシュー, ディーラーはソフト17でスタンド, スプリット後のダブルダウンありのベーシックストラテジー
+
+        Args:
+            bet_ramp (Sequence[Tuple[float, int]], optional): (トゥルーカウントの下限, 賭ける単位数) のリスト
+
+        Returns:
+            Strategy: ベーシックストラテジーの戦略表
+        """
+        hard = {
+            **{total: "H H H H H H H H H H" for total in range(4, 9)},
+            9: "H D D D D H H H H H",
+            10: "D D D D D D D D H H",
+            11: "D D D D D D D D D H",
+            12: "H H S S S H H H H H",
+            **{total: "S S S S S H H H H H" for total in range(13, 17)},
+        }
+        soft = {
+            12: "H H H H H H H H H H",
+            13: "H H H D D H H H H H",
+            14: "H H H D D H H H H H",
+            15: "H H D D D H H H H H",
+            16: "H H D D D H H H H H",
+            17: "H D D D D H H H H H",
+            18: "S Ds Ds Ds Ds S S H H H",
+        }
+        pairs = {
+            2: "P P P P P P H H H H",
+            3: "P P P P P P H H H H",
+            4: "H H H P P H H H H H",
+            5: "D D D D D D D D H H",
+            6: "P P P P P H H H H H",
+            7: "P P P P P P H H H H",
+            8: "P P P P P P P P P P",
+            9: "P P P P P S P P S S",
+            10: "S S S S S S S S S S",
+            11: "P P P P P P P P P P",
+        }
+        return cls(hard, soft, pairs, bet_ramp)
+
+    def decide(self, values: List[int], upcard: int, can_split: bool = True) -> Action:
+        """
+        手札とディーラーのアップカードから行動を決める
+
+        Args:
+            values (List[int]): 手札のカードの点数（A は 11）
+            upcard (int): ディーラーのアップカードの点数（A は 11）
+            can_split (bool, optional): スプリットできるかどうか. 既定値はTrue
+
+        Returns:
+            Action: 行動
+        """
+        column = upcard - 2
+        # ペアの表でスプリットになっていても, スプリットできなければハード・ソフトの表に従う
+        if len(values) == 2 and values[0] == values[1] and values[0] in self.__pairs:
+            action = self.__pairs[values[0]][column]
+            if action != Action.SPLIT or can_split:
+                return action
+        total, soft = hand_total(values)
+        table = self.__soft if soft else self.__hard
+        row = table.get(total)
+        if row is None:
+            return Action.STAND if total >= 17 else Action.HIT
+        return row[column]
+
+    def get_bet(self, true_count: float) -> int:
+        """
+        トゥルーカウントから賭ける単位数を決める
+
+        Args:
+            true_count (float): トゥルーカウント（ランニングカウントを残りの組数で割ったもの）
+
+        Returns:
+            int: 賭ける単位数
+        """
+        for minimum, units in self.bet_ramp:
+            if true_count >= minimum:
+                return units
+        return 1
+
+
+def hand_total(values: List[int]) -> Tuple[int, bool]:
+    """
+    手札の合計を求める. A は合計が21を超えない限り11として数える
+
+    Args:
+        values (List[int]): 手札のカードの点数（A は 11）
+
+    Returns:
+        tuple: 合計と, A を11として数えているか（ソフトか）どうか
+    """
+    total = sum(values)
+    aces = values.count(11)
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces > 0
+
+
+class RunningStats:
+    """
+    RunningStatsクラスは, 値を1つずつ加えながら平均と分散を求めます（Welford のアルゴリズム）
+    別々に集計した結果を merge で結合できるため, 並列に集計した結果をまとめられます
+
+    Attributes:
+        count (int): 値の数
+        mean (float): 平均
+        m2 (float): 平均からの偏差の2乗和
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float):
+        """
+        値を1つ加える
+
+        Args:
+            value (float): 加える値
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: 'RunningStats'):
+        """
+        別に集計した結果を結合する
+
+        Args:
+            other (RunningStats): 結合する集計結果
+        """
+        count = self.count + other.count
+        if count == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    def get_variance(self) -> float:
+        """
+        標本分散を返す
+
+        Returns:
+            float: 標本分散. 値が2つ未満の場合は0
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def get_standard_error(self) -> float:
+        """
+        平均の標準誤差を返す
+
+        Returns:
+            float: 平均の標準誤差. 値が2つ未満の場合は0
+        """
+        return math.sqrt(self.get_variance() / self.count) if self.count > 1 else 0.0
+
+
+class BlackjackTable:
+    """
+    BlackjackTableクラスは, 1人のプレイヤーが戦略表に従ってディーラーと対戦するテーブルです
+    カードはシューから配り, カットカードに達したらラウンドの間にシャッフルします
+    """
+
+    def __init__(self, strategy: Strategy, rules: Rules, rng: random.Random):
+        """
+        コンストラクタ
+
+        Args:
+            strategy (Strategy): プレイヤーの戦略表
+            rules (Rules): ルール
+            rng (random.Random): シャッフルに用いる乱数生成器
+        """
+        self.__strategy = strategy
+        self.__rules = rules
+        self.__shoe = Shoe(deck_count=rules.deck_count, penetration=rules.penetration, rng=rng)
+        self.__shoe.shuffle()
+        self.__running_count = 0
+
+    def play_round(self) -> Tuple[float, int]:
+        """
+        1ラウンドを行う
+
+        Returns:
+            tuple: プレイヤーの損益（単位数）と, ラウンドの最初に賭けた単位数
+        """
+        if self.__shoe.needs_shuffle():
+            self.__shoe.shuffle()
+            self.__running_count = 0
+        rules = self.__rules
+        decks_remaining = max(len(self.__shoe) / (NUMBER_COUNT * 4), 0.5)
+        bet = self.__strategy.get_bet(self.__running_count / decks_remaining)
+
+        player = [self.__deal(), None]
+        dealer = [self.__deal(), None]
+        player[1] = self.__deal()
+        dealer[1] = self.__deal()
+        upcard = dealer[0]
+
+        # ナチュラル（最初の2枚で21）の判定. ディーラーはアップカードが A か 10 の場合に確認する
+        dealer_blackjack = hand_total(dealer)[0] == 21
+        player_blackjack = hand_total(player)[0] == 21
+        if dealer_blackjack:
+            return (0.0 if player_blackjack else -bet), bet
+        if player_blackjack:
+            return bet * rules.blackjack_payout, bet
+
+        # (手札, 賭けた単位数, スプリットした A か) を順に処理する
+        finished = []
+        pending = [(player, bet, False)]
+        hand_count = 1
+        while pending:
+            hand, hand_bet, split_aces = pending.pop()
+            if len(hand) == 1:
+                hand.append(self.__deal())
+                if split_aces:
+                    finished.append((hand, hand_bet))
+                    continue
+            split = hand_count > 1
+            while True:
+                total, _ = hand_total(hand)
+                if total >= 21:
+                    break
+                can_split = hand_count < rules.max_hands
+                can_double = len(hand) == 2 and (rules.double_after_split or not split)
+                action = self.__strategy.decide(hand, upcard, can_split)
+                if action == Action.SPLIT and len(hand) == 2 and hand[0] == hand[1] and can_split:
+                    hand_count += 1
+                    pending.append(([hand[1]], hand_bet, hand[1] == 11))
+                    pending.append(([hand[0]], hand_bet, hand[0] == 11))
+                    hand = None
+                    break
+                if action in (Action.DOUBLE, Action.DOUBLE_OR_STAND) and can_double:
+                    hand_bet *= 2
+                    hand.append(self.__deal())
+                    break
+                if action == Action.STAND or action == Action.DOUBLE_OR_STAND:
+                    break
+                hand.append(self.__deal())
+            if hand is not None:
+                finished.append((hand, hand_bet))
+
+        # プレイヤーの手札が全てバーストしていなければ, ディーラーが引く
+        if any(hand_total(hand)[0] <= 21 for hand, _ in finished):
+            while True:
+                total, soft = hand_total(dealer)
+                if total > 17 or (total == 17 and not (soft and rules.dealer_hits_soft_17)):
+                    break
+                dealer.append(self.__deal())
+        dealer_total = hand_total(dealer)[0]
+
+        net = 0.0
+        for hand, hand_bet in finished:
+            total = hand_total(hand)[0]
+            if total > 21:
+                net -= hand_bet
+            elif dealer_total > 21 or total > dealer_total:
+                net += hand_bet
+            elif total < dealer_total:
+                net -= hand_bet
+        return net, bet
+
+    def __deal(self) -> int:
+        """
+        シューからカードを1枚配り, ランニングカウントを更新する
+
+        Returns:
+            int: 配ったカードの点数（A は 11）
+        """
+        if len(self.__shoe) == 0:
+            self.__shoe.shuffle()
+            self.__running_count = 0
+        code = self.__shoe.draw_codes(1)[0]
+        self.__running_count += HI_LO_VALUES[code]
+        return CODE_VALUES[code]
+
+
+class BlackjackResult:
+    """
+    BlackjackResultクラスは, simulate で集計したブラックジャックの結果を保持します
+
+    Attributes:
+        stats (RunningStats): ラウンドごとの損益（単位数）の集計
+        wagered (int): ラウンドの最初に賭けた単位数の合計
+        seconds (float): シミュレーションにかかった時間（秒）
+    """
+
+    def __init__(self, stats: RunningStats, wagered: int, seconds: float):
+        self.stats = stats
+        self.wagered = wagered
+        self.seconds = seconds
+
+    def get_ev(self) -> float:
+        """
+        賭けた1単位あたりの期待値を返す
+
+        Returns:
+            float: 期待値（賭けた単位数に対する損益の割合）
+        """
+        return self.stats.mean * self.stats.count / self.wagered if self.wagered else 0.0
+
+    def get_hands_per_second(self) -> float:
+        """
+        1秒あたりのラウンド数を返す
+
+        Returns:
+            float: ラウンド数/秒
+        """
+        return self.stats.count / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _simulate_shard(hands: int, seed: int, strategy: Strategy, rules: Rules) -> Tuple[RunningStats, int]:
+    """
+    1つのシャードのラウンドを行う（ワーカープロセスで実行される）
+
+    Args:
+        hands (int): ラウンド数
+        seed (int): シャードのシード値
+        strategy (Strategy): プレイヤーの戦略表
+        rules (Rules): ルール
+
+    Returns:
+        tuple: 損益の集計と, 賭けた単位数の合計
+    """
+    table = BlackjackTable(strategy, rules, random.Random(seed))
+    stats = RunningStats()
+    wagered = 0
+    for _ in range(hands):
+        net, bet = table.play_round()
+        stats.add(net)
+        wagered += bet
+    return stats, wagered
+
+
+def _simulate_shard_task(task: Tuple[int, int, Strategy, Rules]) -> Tuple[RunningStats, int]:
+    """
+    Pool.imap から _simulate_shard を呼ぶ
+
+    Args:
+        task (tuple): _simulate_shard の引数
+
+    Returns:
+        tuple: 損益の集計と, 賭けた単位数の合計
+    """
+    return _simulate_shard(*task)
+
+
+def split_shards(hands: int, shards: int, seed: int) -> List[Tuple[int, int]]:
+    """
+    ラウンドをシャードに分け, シャードごとに独立した乱数のシード値を割り当てる
+
+    Args:
+        hands (int): 全体のラウンド数
+        shards (int): シャードの数
+        seed (int): 全体のシード値
+
+    Returns:
+        List[Tuple[int, int]]: シャードごとの (ラウンド数, シード値) のリスト
+    """
+    sizes = [hands // shards + (1 if i < hands % shards else 0) for i in range(shards)]
+    return list(zip(sizes, RngProvider(seed).spawn_seeds(shards)))
+
+
+def simulate(hands: int, strategy: Optional[Strategy] = None, rules: Optional[Rules] = None, seed: int = 0,
+             processes: Optional[int] = None, shards: Optional[int] = None) -> BlackjackResult:
+    """
+    ブラックジャックのシミュレーションをプロセスプールで並列に行う
+    ラウンドはシャードに分けられ, シャードごとに RngProvider で作った独立した乱数を使う
+    集計はシャードの順に結合するため, 同じ seed と shards であればプロセス数によらず同じ結果になる
+
+    Args:
+        hands (int): ラウンド数
+        strategy (Strategy, optional): プレイヤーの戦略表. 省略時はベーシックストラテジー
+        rules (Rules, optional): ルール. 省略時は既定のルール
+        seed (int, optional): シード値. 既定値は0
+        processes (int, optional): ワーカープロセス数. 省略時は CPU コア数
+        shards (int, optional): シャードの数. 省略時は64（ラウンド数が少ない場合はラウンド数）
+
+    Returns:
+        BlackjackResult: 損益の集計
+    """
+    strategy = strategy if strategy is not None else Strategy.basic()
+    rules = rules if rules is not None else Rules()
+    processes = processes or os.cpu_count() or 1
+    shards = shards or max(min(64, hands), 1)
+    tasks = [(size, shard_seed, strategy, rules) for size, shard_seed in split_shards(hands, shards, seed)]
+
+    start = time.perf_counter()
+    stats = RunningStats()
+    wagered = 0
+    if processes == 1:
+        for shard_stats, shard_wagered in map(_simulate_shard_task, tasks):
+            stats.merge(shard_stats)
+            wagered += shard_wagered
+    else:
+        with Pool(processes) as pool:
+            # シャードの結果を順に受け取り, シャードの順に結合する
+            for shard_stats, shard_wagered in pool.imap(_simulate_shard_task, tasks):
+                stats.merge(shard_stats)
+                wagered += shard_wagered
+    return BlackjackResult(stats, wagered, time.perf_counter() - start)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    ベーシックストラテジーでブラックジャックのシミュレーションを行い, 期待値を表示する
+
+    Args:
+        argv (Sequence[str], optional): コマンドライン引数. 省略時は sys.argv
+    """
+    parser = argparse.ArgumentParser(description="ブラックジャックのシミュレーションを行う")
+    parser.add_argument("--hands", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    result = simulate(args.hands, seed=args.seed, processes=args.processes)
+    print(f"{result.stats.count} hands in {result.seconds:.2f}s ({result.get_hands_per_second():,.0f} hands/s)")
+    print(f"EV {result.get_ev() * 100:+.3f}% ± {result.stats.get_standard_error() * 100:.3f}% "
+          f"(variance {result.stats.get_variance():.3f})")
+
+
+if __name__ == "__main__":
+    main()
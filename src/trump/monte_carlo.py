@@ -0,0 +1,149 @@
+from typing import Iterable, Optional, Sequence
+import numpy as np
+from .trump import DECK_CODES, Card
+from .poker import MAX_HAND_SIZE, MIN_HAND_SIZE, get_hand_evaluator
+
+
+def shuffled_decks(count: int, rng: np.random.Generator, codes: Sequence[int] = DECK_CODES) -> np.ndarray:
+    """
+    互いに独立にシャッフルしたデッキをまとめて作る
+    乱数の行列を行ごとに argsort して, 各行を一様ランダムな順列にする
+
+    Args:
+        count (int): デッキの数
+        rng (np.random.Generator): 乱数生成器
+        codes (Sequence[int], optional): デッキに含めるカードのコード. 既定値は JOKER を除く52枚
+
+    Returns:
+        np.ndarray: 各行がシャッフルしたデッキのコードである (count, len(codes)) の uint8 配列
+    """
+    codes = np.frombuffer(bytes(codes), dtype=np.uint8)
+    return codes[np.argsort(rng.random((count, len(codes))), axis=1)]
+
+
+def deal_hands(decks: np.ndarray, players: int, hand_size: int) -> np.ndarray:
+    """
+    シャッフルしたデッキの先頭から, 各プレイヤーに手札をまとめて配る
+
+    Args:
+        decks (np.ndarray): shuffled_decks で作った (N, カード枚数) の配列
+        players (int): プレイヤーの数
+        hand_size (int): 1人あたりの枚数
+
+    Returns:
+        np.ndarray: (N, players, hand_size) の手札の配列
+
+    Raises:
+        ValueError: デッキの枚数が足りない場合に発生します
+    """
+    if players * hand_size > decks.shape[1]:
+        raise ValueError("Not enough cards in the deck.")
+    return decks[:, :players * hand_size].reshape(decks.shape[0], players, hand_size)
+
+
+class EquityResult:
+    """
+    EquityResultクラスは, simulate_equity で求めた各プレイヤーの勝率を保持します
+
+    Attributes:
+        trials (int): 試行回数
+        wins (np.ndarray): プレイヤーごとの単独で勝った回数
+        ties (np.ndarray): プレイヤーごとの引き分け（複数人で勝った）回数
+        equity (np.ndarray): プレイヤーごとのエクイティ（引き分けは勝った人数で等分した, ポットの取り分の期待値）
+    """
+
+    def __init__(self, trials: int, wins: np.ndarray, ties: np.ndarray, equity: np.ndarray):
+        self.trials = trials
+        self.wins = wins
+        self.ties = ties
+        self.equity = equity
+
+    def get_win_rates(self) -> np.ndarray:
+        """
+        プレイヤーごとの単独で勝った割合を返す
+
+        Returns:
+            np.ndarray: 勝率の配列
+        """
+        return self.wins / self.trials if self.trials else np.zeros(len(self.wins))
+
+
+def simulate_equity(hands: Sequence[Iterable[Card]], board: Iterable[Card] = (), trials: int = 100000,
+                    hand_size: int = 2, board_size: int = 5, seed: Optional[int] = None,
+                    chunk_size: int = 10000, rng: Optional[np.random.Generator] = None) -> EquityResult:
+    """
+    モンテカルロ法で各プレイヤーのエクイティを求める
+    分かっているカード（手札と場のカード）を除いたデッキを chunk_size 個ずつまとめてシャッフルし,
+    足りない手札と場のカードを配って, 全員の役を一度に判定する
+
+    Args:
+        hands (Sequence[Iterable[Card]]): プレイヤーごとの分かっている手札. 空であれば全て無作為に配る
+        board (Iterable[Card], optional): 分かっている場のカード
+        trials (int, optional): 試行回数. 既定値は100000
+        hand_size (int, optional): 1人あたりの手札の枚数. 既定値は2（テキサスホールデム）
+        board_size (int, optional): 場のカードの枚数. 既定値は5
+        seed (int, optional): 乱数のシード値. rng を指定した場合は無視される
+        chunk_size (int, optional): 1度にシャッフルするデッキの数. メモリ使用量の上限になる. 既定値は10000
+        rng (np.random.Generator, optional): 乱数生成器. 省略時は seed から作る
+
+    Returns:
+        EquityResult: 各プレイヤーの勝率とエクイティ
+
+    Raises:
+        ValueError: 枚数の指定が不正な場合, カードが重複している場合, またはデッキの枚数が足りない場合に発生します
+    """
+    known_hands = [[card.code for card in hand] for hand in hands]
+    known_board = [card.code for card in board]
+    players = len(known_hands)
+    if players < 1:
+        raise ValueError("At least one player is required.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    if not MIN_HAND_SIZE <= hand_size + board_size <= MAX_HAND_SIZE:
+        raise ValueError("Each player must make a hand of 5 to 7 cards.")
+    if any(len(hand) > hand_size for hand in known_hands) or len(known_board) > board_size:
+        raise ValueError("Too many known cards.")
+    known = [code for hand in known_hands for code in hand] + known_board
+    if len(set(known)) != len(known) or any(code >= len(DECK_CODES) for code in known):
+        raise ValueError("Known cards must be distinct cards without jokers.")
+
+    known_set = set(known)
+    remaining = [code for code in DECK_CODES if code not in known_set]
+    missing_hands = [hand_size - len(hand) for hand in known_hands]
+    missing_board = board_size - len(known_board)
+    if sum(missing_hands) + missing_board > len(remaining):
+        raise ValueError("Not enough cards in the deck.")
+
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    evaluator = get_hand_evaluator()
+    wins = np.zeros(players, dtype=np.int64)
+    ties = np.zeros(players, dtype=np.int64)
+    equity = np.zeros(players, dtype=np.float64)
+
+    done = 0
+    while done < trials:
+        count = min(chunk_size, trials - done)
+        decks = shuffled_decks(count, rng, remaining)
+
+        # デッキの先頭から, 足りない手札と場のカードを順に取り出す
+        cursor = 0
+        board_cards = np.empty((count, board_size), dtype=np.uint8)
+        board_cards[:, :len(known_board)] = known_board
+        board_cards[:, len(known_board):] = decks[:, cursor:cursor + missing_board]
+        cursor += missing_board
+        cards = np.empty((count, players, hand_size + board_size), dtype=np.uint8)
+        for player, (hand, missing) in enumerate(zip(known_hands, missing_hands)):
+            cards[:, player, :len(hand)] = hand
+            cards[:, player, len(hand):hand_size] = decks[:, cursor:cursor + missing]
+            cursor += missing
+        cards[:, :, hand_size:] = board_cards[:, np.newaxis, :]
+
+        scores = evaluator.evaluate_batch(cards.reshape(count * players, -1)).reshape(count, players)
+        winners = scores == scores.max(axis=1, keepdims=True)
+        winner_counts = winners.sum(axis=1, keepdims=True)
+        wins += (winners & (winner_counts == 1)).sum(axis=0)
+        ties += (winners & (winner_counts > 1)).sum(axis=0)
+        equity += (winners / winner_counts).sum(axis=0)
+        done += count
+
+    return EquityResult(trials, wins, ties, equity / trials if trials else equity)
@@ -0,0 +1,164 @@
+from array import array
+import mmap
+from typing import Iterable, Iterator, Sequence, Union
+from .trump import CODE_NUMBERS, CODE_STRINGS, CODE_SUITS, JOKER_CODES, SUIT_MARK_ALIASES, Suit
+
+
+def _build_notation_codes() -> dict:
+    """
+    表記（UTF-8 のバイト列）からカードのコードへの変換表を作る
+    Card.__str__ の表記に加えて, 白抜きと塗りつぶしのマーク, 字形選択子付きのマークも受け付ける
+
+    Returns:
+        dict: 表記からカードのコードへの辞書
+    """
+    notation_codes = {Suit.JOKER.mark.encode("utf-8"): JOKER_CODES[0]}
+    for code, (suit, number) in enumerate(zip(CODE_SUITS, CODE_NUMBERS)):
+        if suit == Suit.JOKER:
+            continue
+        marks = [suit.mark] + [mark for mark, alias in SUIT_MARK_ALIASES.items() if alias == suit]
+        for mark in marks:
+            for selector in ("", "\ufe0e", "\ufe0f"):
+                notation_codes[(mark + selector + "-" + number.mark).encode("utf-8")] = code
+    return notation_codes
+
+
+# 表記（UTF-8 のバイト列）からカードのコードへの変換表
+NOTATION_CODES = _build_notation_codes()
+# カードのコードから表記（UTF-8 のバイト列）への変換表
+CODE_NOTATIONS = tuple(string.encode("utf-8") for string in CODE_STRINGS)
+# 空の手札の表記. 空行は読み飛ばすため, 空の手札は空行ではなくこの表記で書く
+EMPTY_HAND = b"-"
+
+
+def parse_card(token: str) -> int:
+    """
+    カードの表記をコードに変換する
+
+    Args:
+        token (str): カードの表記. 例: "♠-A", "♡-10", "JOKER"
+
+    Returns:
+        int: カードのコード. JOKER は1枚目のコード52
+
+    Raises:
+        ValueError: 表記が不正な場合に発生します
+    """
+    code = NOTATION_CODES.get(token.encode("utf-8"))
+    if code is None:
+        raise ValueError(f"Invalid card notation: {token!r}")
+    return code
+
+
+def parse_hand(line: Union[bytes, str]) -> array:
+    """
+    空白またはカンマで区切ったカードの表記の並びを, コードの配列に変換する
+    1つの手札の中の2枚目の JOKER はコード53に変換する. 空の手札の表記 "-" は空の配列に変換する
+
+    Args:
+        line (bytes or str): 1つの手札の表記（UTF-8 のバイト列または文字列）
+
+    Returns:
+        array: カードのコードの配列
+
+    Raises:
+        ValueError: 表記が不正な場合に発生します
+    """
+    if isinstance(line, str):
+        line = line.encode("utf-8")
+    if line.strip() == EMPTY_HAND:
+        return array("B")
+    try:
+        codes = array("B", [NOTATION_CODES[token] for token in line.replace(b",", b" ").split()])
+    except KeyError as e:
+        raise ValueError(f"Invalid card notation: {e.args[0].decode('utf-8', 'replace')!r}") from None
+    if codes.count(JOKER_CODES[0]) > 1:
+        codes[codes.index(JOKER_CODES[0], codes.index(JOKER_CODES[0]) + 1)] = JOKER_CODES[1]
+    return codes
+
+
+def iter_hands(path: str, use_mmap: bool = False) -> Iterator[array]:
+    """
+    手札の履歴のファイルを1行ずつ読み込み, 手札ごとのカードのコードの配列を返すジェネレータ
+    1行が1つの手札で, 空行と # で始まる行は読み飛ばす. 読み込んだ行はすぐに捨てるため, ファイルの大きさによらず
+    メモリ使用量は1行分に収まる
+
+    Args:
+        path (str): 読み込むファイルのパス（UTF-8）
+        use_mmap (bool, optional): True の場合はファイルをメモリマップで読み込む. 既定値はFalse
+
+    Yields:
+        array: 手札のカードのコードの配列
+
+    Raises:
+        ValueError: 表記が不正な場合に発生します（行番号を含む）
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            if f.seek(0, 2) == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from _parse_lines(iter(mapped.readline, b""))
+        else:
+            yield from _parse_lines(f)
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[array]:
+    """
+    行の並びを手札ごとのカードのコードの配列に変換する
+
+    Args:
+        lines (Iterable[bytes]): 行の並び
+
+    Yields:
+        array: 手札のカードのコードの配列
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        try:
+            yield parse_hand(line)
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: {e}") from None
+
+
+def format_hand(codes: Sequence[int], separator: str = " ") -> str:
+    """
+    カードのコードの並びを表記に変換する
+
+    Args:
+        codes (Sequence[int]): カードのコードの並び
+        separator (str, optional): カードの区切り. 既定値は空白
+
+    Returns:
+        str: 手札の表記. 空の手札は "-"
+    """
+    if len(codes) == 0:
+        return EMPTY_HAND.decode("utf-8")
+    return separator.join(CODE_STRINGS[code] for code in codes)
+
+
+def write_hands(path: str, hands: Iterable[Sequence[int]], separator: str = " ", buffer_lines: int = 4096):
+    """
+    手札の並びを1行に1つずつ表記に変換してファイルに書き出す
+    変換したバイト列を buffer_lines 行ずつまとめて書き出すため, 手札の並びはジェネレータでもよい
+    空の手札は空行ではなく "-" と書くため, iter_hands で読み込んでも手札の数と順番は変わらない
+
+    Args:
+        path (str): 書き出すファイルのパス
+        hands (Iterable[Sequence[int]]): 手札ごとのカードのコードの並び
+        separator (str, optional): カードの区切り. 既定値は空白
+        buffer_lines (int, optional): まとめて書き出す行数. 既定値は4096
+    """
+    separator = separator.encode("utf-8")
+    notations = CODE_NOTATIONS
+    with open(path, "wb") as f:
+        lines = []
+        for codes in hands:
+            lines.append(separator.join([notations[code] for code in codes]) if len(codes) else EMPTY_HAND)
+            if len(lines) >= buffer_lines:
+                f.write(b"\n".join(lines) + b"\n")
+                lines.clear()
+        if lines:
+            f.write(b"\n".join(lines) + b"\n")
@@ -0,0 +1,304 @@
+from enum import Enum, unique
+from itertools import combinations_with_replacement
+from typing import Iterable, List, Optional, Sequence
+import numpy as np
+from .trump import JOKER_CODES, NUMBER_COUNT, SUIT_COUNT, Card
+
+
+@unique
+class HandCategory(Enum):
+    """
+    ポーカーの役を表す列挙型. 値が大きいほど強い
+
+    Attributes:
+        HIGH_CARD (HandCategory): ハイカード
+        ONE_PAIR (HandCategory): ワンペア
+        TWO_PAIR (HandCategory): ツーペア
+        THREE_OF_A_KIND (HandCategory): スリーカード
+        STRAIGHT (HandCategory): ストレート
+        FLUSH (HandCategory): フラッシュ
+        FULL_HOUSE (HandCategory): フルハウス
+        FOUR_OF_A_KIND (HandCategory): フォーカード
+        STRAIGHT_FLUSH (HandCategory): ストレートフラッシュ
+    """
+    HIGH_CARD = 0
+    ONE_PAIR = 1
+    TWO_PAIR = 2
+    THREE_OF_A_KIND = 3
+    STRAIGHT = 4
+    FLUSH = 5
+    FULL_HOUSE = 6
+    FOUR_OF_A_KIND = 7
+    STRAIGHT_FLUSH = 8
+
+
+# 役の強さの値は (役 << 20) | 比較に使う最大5つのランクを4ビットずつ並べたもの
+CATEGORY_SHIFT = 20
+# ランクは 2 を 0, A を 12 とする. カードのコードからランク・スート・ランクの素数への変換表
+RANK_COUNT = NUMBER_COUNT
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+CODE_RANKS = tuple((code % NUMBER_COUNT - 1) % NUMBER_COUNT for code in range(JOKER_CODES[0]))
+CODE_SUIT_INDEXES = tuple(code // NUMBER_COUNT for code in range(JOKER_CODES[0]))
+CODE_PRIMES = tuple(RANK_PRIMES[rank] for rank in CODE_RANKS)
+MIN_HAND_SIZE = 5
+MAX_HAND_SIZE = 7
+
+# A-2-3-4-5（ホイール）のランクのマスク
+_WHEEL_MASK = (1 << 12) | 0b1111
+
+
+def _make_score(category: HandCategory, ranks: Sequence[int]) -> int:
+    """
+    役と比較に使うランクから役の強さの値を作る
+
+    Args:
+        category (HandCategory): 役
+        ranks (Sequence[int]): 比較に使うランク（強い順, 最大5つ）
+
+    Returns:
+        int: 役の強さの値
+    """
+    score = category.value
+    for i in range(5):
+        score = (score << 4) | (ranks[i] if i < len(ranks) else 0)
+    return score
+
+
+def _straight_high(rank_mask: int) -> Optional[int]:
+    """
+    ランクのマスクに含まれる最も強いストレートの最上位のランクを求める
+
+    Args:
+        rank_mask (int): ランクのビットを立てたマスク
+
+    Returns:
+        int or None: ストレートの最上位のランク. ストレートがない場合は None
+    """
+    for high in range(RANK_COUNT - 1, 3, -1):
+        window = 0b11111 << (high - 4)
+        if rank_mask & window == window:
+            return high
+    if rank_mask & _WHEEL_MASK == _WHEEL_MASK:
+        return 3
+    return None
+
+
+def _score_flush(rank_mask: int) -> int:
+    """
+    同じスートのカードのランクのマスクから, フラッシュまたはストレートフラッシュの強さを求める
+
+    Args:
+        rank_mask (int): 同じスートのカード（5枚以上）のランクのマスク
+
+    Returns:
+        int: 役の強さの値
+    """
+    high = _straight_high(rank_mask)
+    if high is not None:
+        return _make_score(HandCategory.STRAIGHT_FLUSH, [high])
+    ranks = [rank for rank in range(RANK_COUNT - 1, -1, -1) if rank_mask >> rank & 1]
+    return _make_score(HandCategory.FLUSH, ranks[:5])
+
+
+def _score_ranks(counts: Sequence[int]) -> int:
+    """
+    ランクごとの枚数から, フラッシュを除いた最も強い役の強さを求める
+
+    Args:
+        counts (Sequence[int]): ランクごとの枚数（合計5〜7枚）
+
+    Returns:
+        int: 役の強さの値
+    """
+    # 枚数の多い順, 同じ枚数ならランクの強い順に並べる
+    groups = sorted(((count, rank) for rank, count in enumerate(counts) if count), reverse=True)
+    ranks_by_strength = [rank for rank in range(RANK_COUNT - 1, -1, -1) if counts[rank]]
+
+    def kickers(excluded, n):
+        return [rank for rank in ranks_by_strength if rank not in excluded][:n]
+
+    top_count, top_rank = groups[0]
+    if top_count == 4:
+        return _make_score(HandCategory.FOUR_OF_A_KIND, [top_rank] + kickers({top_rank}, 1))
+    if top_count == 3:
+        pair_ranks = [rank for count, rank in groups[1:] if count >= 2]
+        if pair_ranks:
+            return _make_score(HandCategory.FULL_HOUSE, [top_rank, max(pair_ranks)])
+
+    high = _straight_high(sum(1 << rank for rank in ranks_by_strength))
+    if high is not None:
+        return _make_score(HandCategory.STRAIGHT, [high])
+    if top_count == 3:
+        return _make_score(HandCategory.THREE_OF_A_KIND, [top_rank] + kickers({top_rank}, 2))
+    pair_ranks = [rank for count, rank in groups if count == 2]
+    if len(pair_ranks) >= 2:
+        pairs = pair_ranks[:2]
+        return _make_score(HandCategory.TWO_PAIR, pairs + kickers(set(pairs), 1))
+    if len(pair_ranks) == 1:
+        return _make_score(HandCategory.ONE_PAIR, [top_rank] + kickers({top_rank}, 3))
+    return _make_score(HandCategory.HIGH_CARD, ranks_by_strength[:5])
+
+
+class HandEvaluator:
+    """
+    HandEvaluatorクラスは, 事前計算した表を使ってポーカーの役（5〜7枚から最も強い5枚）を判定します
+    フラッシュは同じスートのカードのランクのマスク（13ビット）で引く表で,
+    それ以外はランクの素数の積（ランクの組み合わせごとに一意）で引く表で判定するため,
+    1つの手札の判定は数回の表の参照で済みます
+
+    役の強さの値は大きいほど強く, 値の比較で手札の強弱を判定できます
+
+    Example:
+        evaluator = get_hand_evaluator()  # 表は最初の1回だけ作られる
+        score = evaluator.evaluate(cards)  # Card のリスト（5〜7枚）の役の強さ
+        category = get_category(score)  # 役の種類
+        scores = evaluator.evaluate_batch(hands)  # (N, 5〜7) のカードのコードの配列をまとめて判定する
+    """
+
+    def __init__(self):
+        """
+        コンストラクタ. 判定に使う表を作る
+        """
+        # 同じスートのカードのランクのマスクから, フラッシュの強さへの表（5枚未満は0）
+        self.__flush_table = np.zeros(1 << RANK_COUNT, dtype=np.int32)
+        for rank_mask in range(1 << RANK_COUNT):
+            if bin(rank_mask).count("1") >= MIN_HAND_SIZE:
+                self.__flush_table[rank_mask] = _score_flush(rank_mask)
+        self.__flush_list = self.__flush_table.tolist()
+
+        # ランクの素数の積から, フラッシュを除いた役の強さへの表
+        self.__rank_table = {}
+        for hand_size in range(MIN_HAND_SIZE, MAX_HAND_SIZE + 1):
+            for ranks in combinations_with_replacement(range(RANK_COUNT), hand_size):
+                counts = [0] * RANK_COUNT
+                for rank in ranks:
+                    counts[rank] += 1
+                if max(counts) > 4:
+                    continue
+                product = 1
+                for rank in ranks:
+                    product *= RANK_PRIMES[rank]
+                self.__rank_table[product] = _score_ranks(counts)
+        # 一括判定用に, 素数の積を昇順に並べた配列と対応する強さの配列
+        products = sorted(self.__rank_table)
+        self.__rank_keys = np.array(products, dtype=np.int64)
+        self.__rank_scores = np.array([self.__rank_table[product] for product in products], dtype=np.int32)
+
+        self.__code_primes = np.array(CODE_PRIMES, dtype=np.int64)
+        self.__code_rank_bits = np.array([1 << rank for rank in CODE_RANKS], dtype=np.int32)
+        self.__code_suits = np.array(CODE_SUIT_INDEXES, dtype=np.int8)
+
+    def evaluate(self, cards: Iterable[Card]) -> int:
+        """
+        手札の役の強さを求める
+
+        Args:
+            cards (Iterable[Card]): 5〜7枚のカード（JOKER は含められない）
+
+        Returns:
+            int: 役の強さの値
+
+        Raises:
+            ValueError: 枚数が範囲外の場合, または JOKER を含む場合に発生します
+        """
+        return self.evaluate_codes([card.code for card in cards])
+
+    def evaluate_codes(self, codes: Sequence[int]) -> int:
+        """
+        カードのコードの並びから役の強さを求める
+
+        Args:
+            codes (Sequence[int]): 5〜7枚のカードのコード（JOKER と, 同じカードの重複は含められない）
+
+        Returns:
+            int: 役の強さの値
+
+        Raises:
+            ValueError: 枚数が範囲外の場合, または JOKER を含む場合に発生します
+        """
+        if not MIN_HAND_SIZE <= len(codes) <= MAX_HAND_SIZE:
+            raise ValueError("A poker hand must have 5 to 7 cards.")
+        product = 1
+        suit_masks = [0, 0, 0, 0]
+        for code in codes:
+            if code >= JOKER_CODES[0]:
+                raise ValueError("Jokers cannot be evaluated.")
+            product *= CODE_PRIMES[code]
+            suit_masks[CODE_SUIT_INDEXES[code]] |= 1 << CODE_RANKS[code]
+        # フラッシュ（5枚未満のスートは0）と, それ以外の役のうち強い方
+        flush_list = self.__flush_list
+        return max(
+            self.__rank_table[product],
+            flush_list[suit_masks[0]], flush_list[suit_masks[1]], flush_list[suit_masks[2]], flush_list[suit_masks[3]]
+        )
+
+    def evaluate_batch(self, hands: np.ndarray) -> np.ndarray:
+        """
+        複数の手札の役の強さをまとめて求める
+
+        Args:
+            hands (np.ndarray): 手札ごとのカードのコードを行とした (N, 5〜7) の整数配列（1つの手札に同じカードを含めない）
+
+        Returns:
+            np.ndarray: 手札ごとの役の強さを格納した (N,) の int32 配列
+
+        Raises:
+            ValueError: 配列の形が不正な場合, または JOKER を含む場合に発生します
+        """
+        hands = np.asarray(hands)
+        if hands.ndim != 2 or not MIN_HAND_SIZE <= hands.shape[1] <= MAX_HAND_SIZE:
+            raise ValueError("Hands must be an (N, 5..7) array of card codes.")
+        if hands.size and (hands.min() < 0 or hands.max() >= JOKER_CODES[0]):
+            raise ValueError("Jokers cannot be evaluated.")
+
+        products = self.__code_primes[hands].prod(axis=1)
+        scores = self.__rank_scores[np.searchsorted(self.__rank_keys, products)]
+
+        rank_bits = self.__code_rank_bits[hands]
+        suits = self.__code_suits[hands]
+        for suit in range(SUIT_COUNT):
+            suit_masks = np.where(suits == suit, rank_bits, 0).sum(axis=1)
+            np.maximum(scores, self.__flush_table[suit_masks], out=scores)
+        return scores
+
+
+def get_category(score: int) -> HandCategory:
+    """
+    役の強さの値から役の種類を求める
+
+    Args:
+        score (int): 役の強さの値
+
+    Returns:
+        HandCategory: 役の種類
+    """
+    return HandCategory(int(score) >> CATEGORY_SHIFT)
+
+
+def describe_ranks(score: int) -> List[int]:
+    """
+    役の強さの値から, 比較に使われたランク（2 を 0, A を 12 とする）を取り出す
+
+    Args:
+        score (int): 役の強さの値
+
+    Returns:
+        List[int]: 比較に使われたランク（強い順, 常に5つ. 使われない位置は0）
+    """
+    return [(int(score) >> shift) & 0b1111 for shift in (16, 12, 8, 4, 0)]
+
+
+_hand_evaluator = None
+
+
+def get_hand_evaluator() -> HandEvaluator:
+    """
+    共有の HandEvaluator を取得する. 表は最初に呼ばれたときに1度だけ作られる
+
+    Returns:
+        HandEvaluator: 共有の HandEvaluator
+    """
+    global _hand_evaluator
+    if _hand_evaluator is None:
+        _hand_evaluator = HandEvaluator()
+    return _hand_evaluator
@@ -0,0 +1,139 @@
+from array import array
+import random
+from typing import List, Optional, Union
+from .trump import Card, Trump
+
+
+class Shoe(Trump):
+    """
+    複数組のトランプをまとめたシューを表すクラス
+    Trump と同じく codes の先頭から順にカーソルで配り, カットカードの位置まで配るとシャッフルが必要になる
+
+    Attributes:
+        codes (array): シューに含まれる全てのカードのコードの配列（配り終えたカードも含む）
+        deck_count (int): まとめたトランプの組数
+        penetration (float): シャッフルまでに配るカードの割合
+
+    Example:
+        shoe = Shoe(deck_count=6, rng=random.Random(0))
+        shoe.shuffle()
+        hand = shoe.draw(2)  # 2枚まとめて配る
+        if shoe.needs_shuffle():  # カットカードに達したら, ラウンドの終わりにシャッフルする
+            shoe.shuffle()
+    """
+
+    def __init__(self, deck_count: int = 6, include_jokers: bool = False, penetration: float = 0.75,
+                 rng: Optional[random.Random] = None):
+        """
+        コンストラクタ. deck_count 組のトランプを並べたシューを作る（シャッフルはしない）
+
+        Args:
+            deck_count (int, optional): まとめるトランプの組数. 既定値は6
+            include_jokers (bool, optional): True の場合は各組に JOKER を2枚ずつ含める. 既定値はFalse
+            penetration (float, optional): シャッフルまでに配るカードの割合（0より大きく1以下）. 既定値は0.75
+            rng (random.Random, optional): シャッフルに用いる乱数生成器. 省略時は新しく作る
+
+        Raises:
+            ValueError: 組数が1未満の場合, または penetration が範囲外の場合に発生します
+        """
+        if deck_count < 1:
+            raise ValueError("Deck count must be positive.")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be in (0, 1].")
+        super().__init__(include_jokers=include_jokers, rng=rng)
+        # 1組分のカードのコードを deck_count 回並べる
+        self.codes = array("B", self.codes.tobytes() * deck_count)
+        self._rebuild_index(self.codes)
+        self.deck_count = deck_count
+        self.penetration = penetration
+        self.__cut_card_position = int(len(self.codes) * penetration)
+
+    def shuffle(self):
+        """
+        配り終えたカードも含めて全てのカードを戻し, その場で1回の置換としてシャッフルする
+        """
+        self._rng.shuffle(self.codes)
+        self._cursor = 0
+        self._rebuild_index(self.codes)
+
+    def draw(self, n: Optional[int] = None) -> Union[Card, List[Card], bool]:
+        """
+        カードを配る
+
+        Args:
+            n (int, optional): まとめて配る枚数. 省略時は1枚だけ配る
+
+        Returns:
+            Card or False: n を省略した場合は配ったカード. カードが残っていない場合はFalse
+            List[Card]: n を指定した場合は配ったカードのリスト. 残りが n 枚未満の場合は残り全て
+
+        Raises:
+            ValueError: 枚数が負の場合に発生します
+        """
+        if n is None:
+            return super().draw()
+
+        return [Card.from_code(code) for code in self.draw_codes(n)]
+
+    def draw_codes(self, n: int) -> array:
+        """
+        カードのコードをまとめて配る. Card オブジェクトを作らないため, シミュレーションなどで大量に配る場合に用いる
+
+        Args:
+            n (int): 配る枚数
+
+        Returns:
+            array: 配ったカードのコードの配列. 残りが n 枚未満の場合は残り全て
+
+        Raises:
+            ValueError: 枚数が負の場合に発生します
+        """
+        if n < 0:
+            raise ValueError("Number of cards to draw must not be negative.")
+        codes = self.codes[self._cursor:self._cursor + n]
+        self._cursor += len(codes)
+        for code in codes:
+            self._discard_from_index(code)
+        return codes
+
+    def remove(self, card: Card) -> bool:
+        """
+        残りのカードから指定されたカードを1枚取り除く. 同じカードが複数ある場合は, 先に配られる方を取り除く
+
+        Args:
+            card (Card): 取り除くカード
+
+        Returns:
+            bool: 取り除いた場合はTrue. カードが残っていない場合はFalse
+        """
+        if not super().remove(card):
+            return False
+        self.__cut_card_position = min(self.__cut_card_position, len(self.codes))
+        return True
+
+    def get_dealt_count(self) -> int:
+        """
+        前回のシャッフルから配ったカードの枚数を返す
+
+        Returns:
+            int: 配ったカードの枚数
+        """
+        return self._cursor
+
+    def get_cut_card_position(self) -> int:
+        """
+        カットカードの位置（シャッフルまでに配るカードの枚数）を返す
+
+        Returns:
+            int: カットカードの位置
+        """
+        return self.__cut_card_position
+
+    def needs_shuffle(self) -> bool:
+        """
+        カットカードの位置まで配り終えたかどうかを返す
+
+        Returns:
+            bool: シャッフルが必要な場合はTrue
+        """
+        return self._cursor >= self.__cut_card_position
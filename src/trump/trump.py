@@ -1,7 +1,9 @@
 from pathlib import Path
+from array import array
+from collections import deque
 from enum import Enum, unique
 import random
-from typing import List
+from typing import List, Optional
 
 
 @unique
@@ -37,18 +39,7 @@ class Suit(Enum):
             Suit or None: マークに対応する Suit オブジェクト
                           マークが不正な場合は None を返す
         """
-        if mark == "♤":
-            mark = "♠"
-        if mark == "♥":
-            mark = "♡"
-        if mark == "♦":
-            mark = "♢"
-        if mark == "♧":
-            mark = "♣"
-
-        for s in Suit:
-            if s.mark == mark:
-                return s
+        return _MARK_SUITS.get(mark)
 
 
 @unique
@@ -115,9 +106,7 @@ class Number(Enum):
             Number or None: 引数で指定された整数に対応する Number オブジェクト
                             引数が1から13までの整数でない場合は, None を返す
         """
-        for n in Number:
-            if n.num == num:
-                return n
+        return _INT_NUMBERS.get(num)
 
     @staticmethod
     def mark2Number(mark: str) -> 'Number':
@@ -131,37 +120,106 @@ class Number(Enum):
             Number or None: 引数で指定された文字列に対応する Number オブジェクト
                             引数が正しい文字列でない場合は, None を返す
         """
-        for n in Number:
-            if n.mark == mark:
-                return n
+        return _MARK_NUMBERS.get(mark)
+
+
+# 記号・整数から Suit, Number への変換表. 白抜きと塗りつぶしのマークはどちらも同じスートに変換する
+SUIT_MARK_ALIASES = {"♤": Suit.SPADE, "♥": Suit.HEART, "♦": Suit.DIA, "♧": Suit.CLUB}
+_MARK_SUITS = {**{s.mark: s for s in Suit}, **SUIT_MARK_ALIASES}
+_INT_NUMBERS = {n.num: n for n in Number}
+_MARK_NUMBERS = {n.mark: n for n in Number}
+
+
+# カードのコード. スペード・ハート・ダイヤ・クラブの順に A〜K を 0〜51 に割り当て, JOKER は 52 と 53
+SUIT_COUNT = 4
+NUMBER_COUNT = 13
+JOKER_CODES = (52, 53)
+CARD_CODE_COUNT = 54
+
+# コードからスート・数字・文字列表現への変換表
+CODE_SUITS = tuple([s for s in Suit if s != Suit.JOKER for _ in Number] + [Suit.JOKER] * len(JOKER_CODES))
+CODE_NUMBERS = tuple([n for s in Suit if s != Suit.JOKER for n in Number] + [None] * len(JOKER_CODES))
+CODE_STRINGS = tuple(
+    Suit.JOKER.mark if suit == Suit.JOKER else suit.mark + "-" + number.mark
+    for suit, number in zip(CODE_SUITS, CODE_NUMBERS)
+)
+# 1組分のカードのコード（JOKERを含む場合と含まない場合）
+DECK_CODES = bytes(range(JOKER_CODES[0]))
+DECK_CODES_WITH_JOKERS = bytes(range(CARD_CODE_COUNT))
 
 
 class Card:
     """
     トランプのカードを表すクラス
+    カードは 0〜53 のコードで識別され, 同じコードの Card オブジェクトは1つだけ作られて共有される（フライウェイト）
+    共有されるため, 属性を書き換えてはならない
 
     Attributes:
+        code (int): カードのコード
         suit (Suit): スート
-        number (Number): 数字
+        number (Number): 数字. JOKER の場合は None
     """
 
-    def __init__(self, suit: Suit, number: Number):
+    __slots__ = ("code", "suit", "number")
+
+    def __new__(cls, suit: Suit, number: Number) -> 'Card':
         """
-        コンストラクタ
+        スートと数字に対応するカードを取得する. JOKER は1枚目（コード52）のカードを返す
 
         Args:
             suit (Suit): スート
             number (Number): 数字
+
+        Returns:
+            Card: 共有された Card オブジェクト
+        """
+        return _CARDS[Card.encode(suit, number)]
+
+    @staticmethod
+    def encode(suit: Suit, number: Number) -> int:
+        """
+        スートと数字をカードのコードに変換する静的メソッド. JOKER は1枚目のコード52に変換する
+
+        Args:
+            suit (Suit): スート
+            number (Number): 数字. JOKER の場合は無視される
+
+        Returns:
+            int: カードのコード
         """
-        self.suit = suit
-        self.number = number
+        if suit == Suit.JOKER:
+            return JOKER_CODES[0]
+        return _SUIT_INDEXES[suit] * NUMBER_COUNT + number.num - 1
 
-    def __del__(self):
+    @staticmethod
+    def from_code(code: int) -> 'Card':
         """
-        デコンストラクタ. 何もしない
+        コードに対応するカードを取得する静的メソッド
+
+        Args:
+            code (int): カードのコード
+
+        Returns:
+            Card: 共有された Card オブジェクト
         """
-        # print("delete : " + self.suit.mark + "-" + self.number.mark)
-        pass
+        return _CARDS[code]
+
+    @classmethod
+    def __create(cls, code: int) -> 'Card':
+        """
+        コードに対応する Card オブジェクトを作る. モジュールの読み込み時に1度だけ呼ばれる
+
+        Args:
+            code (int): カードのコード
+
+        Returns:
+            Card: 新しい Card オブジェクト
+        """
+        card = object.__new__(cls)
+        card.code = code
+        card.suit = CODE_SUITS[code]
+        card.number = CODE_NUMBERS[code]
+        return card
 
     def __str__(self) -> str:
         """
@@ -170,41 +228,68 @@ class Card:
         Returns:
             str: カードのスートと数字. 例: "♠︎-A", "♠︎-2", "♡-K", "JOKER"
         """
-        if self.suit == Suit.JOKER:
-            return self.suit.mark
-        else:
-            return self.suit.mark + "-" + self.number.mark
+        return CODE_STRINGS[self.code]
+
+    def __reduce__(self):
+        # pickle しても共有された Card オブジェクトに戻す
+        return (Card.from_code, (self.code,))
+
+
+_SUIT_INDEXES = {suit: index for index, suit in enumerate(s for s in Suit if s != Suit.JOKER)}
+_CARDS = tuple(Card._Card__create(code) for code in range(CARD_CODE_COUNT))
+
+# スート・数字ごとに, 該当するカードのコードのビットを立てたマスク
+ALL_CARDS_MASK = (1 << CARD_CODE_COUNT) - 1
+SUIT_MASKS = {suit: sum(1 << code for code in range(CARD_CODE_COUNT) if CODE_SUITS[code] == suit) for suit in Suit}
+NUMBER_MASKS = {number: sum(1 << code for code in range(CARD_CODE_COUNT) if CODE_NUMBERS[code] == number) for number in Number}
 
 
 class Trump:
     """
     トランプの一組を表すクラス
-    
+    カードは1枚1バイトのコードの配列として保持し, Card オブジェクトは必要なときに取り出す
+    カードは codes の先頭から順に引き, 引いた位置をカーソルで管理するため, 1枚あたり O(1) で引ける
+    残りのカードはコードごとの位置とビットマスクで索引付けされ, 検索や所持の判定はデッキ全体を走査しない
+
     Attributes:
-        card_list (list): トランプのカードを表すCardオブジェクトのリスト
-    
+        codes (array): カードのコードの配列（先頭から順に引く. 引いたカードはシャッフルするまで残る）
+
     Methods:
-        __init__(): トランプ一組を初期化する（JOKERを含む場合:54枚, JOKERを含まない場合:52枚）
+        __init__(include_jokers=False, rng=None): トランプ一組を初期化する（JOKERを含む場合:54枚, JOKERを含まない場合:52枚）
         __str__(): カードリストの文字列表現を返す
         __len__(): 残りのカード枚数を返す
-        shuffle(): カードをシャッフルする
+        __contains__(card): カードが残っているかどうかを返す
+        shuffle(): 残りのカードをシャッフルする
         draw(): カードを引く. カードが残っていない場合にはFalseを返す
+        remove(card): 指定されたカードを1枚取り除く
         search(suit=None, number=None): カードを検索する. suitやnumberに指定がある場合, 条件に一致するカードを返す
+        count(suit=None, number=None): 条件に一致するカードの枚数を返す
+        has(suit=None, number=None): 条件に一致するカードが残っているかどうかを返す
     """
 
-    def __init__(self, include_jokers: bool=False):
+    def __init__(self, include_jokers: bool=False, rng: Optional[random.Random] = None):
         """
         トランプ一組を初期化する（JOKERを含む場合:54枚, JOKERを含まない場合:52枚）
+
+        Args:
+            include_jokers (bool, optional): True の場合は JOKER を2枚含める. 既定値はFalse
+            rng (random.Random, optional): シャッフルに用いる乱数生成器. 省略時は新しく作る
+        """
+        self.codes = array("B", DECK_CODES_WITH_JOKERS if include_jokers else DECK_CODES)
+        self._rng = rng if rng is not None else random.Random()
+        # 次に引くカードの codes 上の位置
+        self._cursor = 0
+        self._rebuild_index(self.codes)
+
+    @property
+    def card_list(self) -> List[Card]:
         """
-        self.card_list = []
-        for s in Suit:
-            if s == Suit.JOKER:
-                continue
-            for n in Number:
-                self.card_list.append(Card(suit=s, number=n))
-        if include_jokers:
-            self.card_list.append(Card(suit=Suit.JOKER, number=None))
-            self.card_list.append(Card(suit=Suit.JOKER, number=None))
+        残りのカードの Card オブジェクトのリスト. 参照のたびに作られるため, 書き換えてもトランプには反映されない
+
+        Returns:
+            list: 残りのカードの Card オブジェクトのリスト
+        """
+        return [_CARDS[code] for code in self.codes[self._cursor:]]
 
     def __str__(self) -> str:
         """
@@ -213,7 +298,7 @@ class Trump:
         Returns:
             str: カードリストの文字列表現
         """
-        return "\n".join(str(card) for card in self.card_list)
+        return "\n".join(CODE_STRINGS[code] for code in self.codes[self._cursor:])
 
     def __len__(self) -> int:
         """
@@ -222,13 +307,30 @@ class Trump:
         Returns:
             int: 残りのカード枚数
         """
-        return len(self.card_list)
+        return len(self.codes) - self._cursor
+
+    def __contains__(self, card: Card) -> bool:
+        """
+        カードが残っているかどうかを返す
+
+        Args:
+            card (Card): 調べるカード. JOKER は2枚のどちらかが残っていればTrue
+
+        Returns:
+            bool: 残っている場合はTrue
+        """
+        if card.suit == Suit.JOKER:
+            return self.__mask & SUIT_MASKS[Suit.JOKER] != 0
+        return bool(self.__mask >> card.code & 1)
 
     def shuffle(self):
         """
-        カードをシャッフルする
+        残りのカードをシャッフルする. 引いたカードは codes から取り除かれる
         """
-        random.shuffle(self.card_list)
+        del self.codes[:self._cursor]
+        self._cursor = 0
+        self._rng.shuffle(self.codes)
+        self._rebuild_index(self.codes)
 
     def draw(self) -> 'Card':
         """
@@ -237,12 +339,29 @@ class Trump:
         Returns:
             Card or False: 引かれたカードの Card オブジェクト, もしくはFalse
         """
-        if len(self.card_list) == 0:
-            print("There are only 0 cards left in the deck.")
+        if self._cursor >= len(self.codes):
+            return False
+        code = self.codes[self._cursor]
+        self._cursor += 1
+        self._discard_from_index(code)
+        return _CARDS[code]
+
+    def remove(self, card: Card) -> bool:
+        """
+        指定されたカードを1枚取り除く. 同じカードが複数ある場合（JOKER を含む）は, 先に引かれる方を取り除く
+
+        Args:
+            card (Card): 取り除くカード
+
+        Returns:
+            bool: 取り除いた場合はTrue. カードが残っていない場合はFalse
+        """
+        code = self._resolve_code(card)
+        if code < 0:
             return False
-        else:
-            draw_card = self.card_list.pop(0)
-            return draw_card
+        del self.codes[self.codes.index(code, self._cursor)]
+        self._discard_from_index(code)
+        return True
 
     def search(self, suit: Suit = None, number: Number = None) -> List[Card]:
         """
@@ -253,14 +372,116 @@ class Trump:
             number (Number): 検索するカードの Number オブジェクト
         
         Returns:
-            list: 条件に一致するカードの Card オブジェクトのリスト
+            list: 条件に一致するカードの Card オブジェクトのリスト（引かれる順）
         """
-        search_list = []
-
         if (suit is None) and (number is None):
-            return search_list
+            return []
+
+        # 一致するコードの位置だけを集め, 引かれる順に並べる
+        matches = sorted(
+            (position, code) for code in self.__matching_codes(suit, number) for position in self.__positions[code]
+        )
+        return [_CARDS[code] for _, code in matches]
+
+    def count(self, suit: Suit = None, number: Number = None) -> int:
+        """
+        条件に一致する残りのカードの枚数を返す. suitとnumberの両方を省略した場合は残り全ての枚数
+
+        Args:
+            suit (Suit): 数えるカードの Suit オブジェクト
+            number (Number): 数えるカードの Number オブジェクト
+
+        Returns:
+            int: 条件に一致するカードの枚数
+        """
+        return sum(len(self.__positions[code]) for code in self.__matching_codes(suit, number))
+
+    def has(self, suit: Suit = None, number: Number = None) -> bool:
+        """
+        条件に一致するカードが残っているかどうかを返す
 
-        for card in self.card_list:
-            if (suit is None or card.suit == suit) and (number is None or card.number == number):
-                search_list.append(card)
-        return search_list
+        Args:
+            suit (Suit): 調べるカードの Suit オブジェクト
+            number (Number): 調べるカードの Number オブジェクト
+
+        Returns:
+            bool: 条件に一致するカードが1枚以上残っている場合はTrue
+        """
+        return self.__mask & Trump.__query_mask(suit, number) != 0
+
+    def _rebuild_index(self, codes: array):
+        """
+        残りのカードの索引を作り直す. カードの並びが変わったときに呼ぶ
+
+        Args:
+            codes (array): 残りのカードのコードの配列（引かれる順）
+        """
+        # コードごとに, 残りのカードの位置を引かれる順に並べたキュー
+        self.__positions = [deque() for _ in range(CARD_CODE_COUNT)]
+        for position, code in enumerate(codes):
+            self.__positions[code].append(position)
+        # 1枚以上残っているコードのビットを立てたマスク
+        self.__mask = sum(1 << code for code in range(CARD_CODE_COUNT) if self.__positions[code])
+
+    def _resolve_code(self, card: Card) -> int:
+        """
+        残りのカードのうち, 指定されたカードとして次に引かれるカードのコードを求める
+        JOKER の Card は常にコード52だが, デッキには52と53の2枚があるため, 先に引かれる方のコードを返す
+
+        Args:
+            card (Card): 探すカード
+
+        Returns:
+            int: カードのコード. 残っていない場合は-1
+        """
+        codes = JOKER_CODES if card.suit == Suit.JOKER else (card.code,)
+        remaining = [(self.__positions[code][0], code) for code in codes if self.__positions[code]]
+        return min(remaining)[1] if remaining else -1
+
+    def _discard_from_index(self, code: int):
+        """
+        残りのカードのうち, 指定されたコードで最初に引かれるカードを索引から取り除く
+
+        Args:
+            code (int): 取り除くカードのコード
+        """
+        positions = self.__positions[code]
+        positions.popleft()
+        if not positions:
+            self.__mask &= ~(1 << code)
+
+    def __matching_codes(self, suit: Suit, number: Number):
+        """
+        条件に一致し, 1枚以上残っているカードのコードを列挙する
+
+        Args:
+            suit (Suit): スートの条件. None の場合は全てのスート
+            number (Number): 数字の条件. None の場合は全ての数字
+
+        Yields:
+            int: カードのコード
+        """
+        mask = self.__mask & Trump.__query_mask(suit, number)
+        while mask:
+            lowest = mask & -mask
+            yield lowest.bit_length() - 1
+            mask ^= lowest
+
+    @staticmethod
+    def __query_mask(suit: Suit, number: Number) -> int:
+        """
+        スートと数字の条件に一致するカードのマスクを求める
+
+        Args:
+            suit (Suit): スートの条件. None の場合は全てのスート
+            number (Number): 数字の条件. None の場合は全ての数字
+
+        Returns:
+            int: 条件に一致するカードのコードのビットを立てたマスク
+        """
+        mask = ALL_CARDS_MASK
+        if suit is not None:
+            mask &= SUIT_MASKS[suit]
+        if number is not None:
+            mask &= NUMBER_MASKS[number]
+        return mask
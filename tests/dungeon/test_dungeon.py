@@ -0,0 +1,292 @@
+import pytest
+import random
+import sys
+from collections import deque
+import numpy as np
+from src.dungeon.dungeon import Dungeon, DungeonError
+
+
+@pytest.mark.parametrize(
+    "width, height, seed",
+    [
+        (40, 20, 1),
+        (60, 40, 2),
+    ],
+)
+def test_dungeon_seed(width, height, seed):
+    # GIVEN
+
+    # WHEN
+    first = Dungeon(width, height, seed=seed)
+    second = Dungeon(width, height, rng=random.Random(seed))
+
+    # THEN
+    # 同じシード値からは同じダンジョンが生成されることを確認する
+    assert str(first) == str(second)
+
+
+def test_dungeon_map():
+    # GIVEN
+    dungeon = Dungeon(40, 20, seed=1)
+
+    # WHEN
+    dungeon_map = dungeon.get_map()
+
+    # THEN
+    # マップが uint8 のコード配列で, 文字列表現と Area の対応が取れていることを確認する
+    assert dungeon_map.dtype == np.uint8
+    assert dungeon_map.shape == (20, 40)
+    assert dungeon.get_size() == (40, 20)
+    rows = str(dungeon).split("\n")
+    for y in range(20):
+        for x in range(40):
+            area = dungeon.get_area(x, y)
+            assert area == Dungeon.AREAS[dungeon_map[y, x]]
+            assert rows[y][x] == area.disp_char
+
+
+@pytest.mark.parametrize(
+    "width, height, seed",
+    [
+        (60, 40, 295),
+        (200, 150, 0),
+    ],
+)
+def test_dungeon_connected(width, height, seed):
+    # GIVEN
+    dungeon = Dungeon(width, height, seed=seed)
+
+    # WHEN
+    # 最初に見つかった部屋から, 壁以外のセルを幅優先探索でたどる
+    open_cells = {(x, y) for y in range(height) for x in range(width) if dungeon.get_area(x, y) != Dungeon.Area.WALL}
+    start = next(iter(open_cells))
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) in open_cells and (nx, ny) not in reached:
+                reached.add((nx, ny))
+                queue.append((nx, ny))
+
+    # THEN
+    # 全ての部屋と通路が繋がっていることを確認する
+    assert reached == open_cells
+
+
+@pytest.fixture()
+def dungeon_with_rooms():
+    return Dungeon(120, 80, seed=7)
+
+
+def test_get_rooms(dungeon_with_rooms):
+    # GIVEN
+    dungeon = dungeon_with_rooms
+
+    # WHEN
+    rooms = dungeon.get_rooms()
+
+    # THEN
+    # 部屋の範囲が全て ROOM で, 部屋の合計面積がマップ上の ROOM の数と一致することを確認する
+    dungeon_map = dungeon.get_map()
+    for index, room in enumerate(rooms):
+        assert room.index == index
+        assert (dungeon_map[room.top:room.bottom + 1, room.left:room.right + 1] == Dungeon.Area.ROOM.code).all()
+    area = sum((room.right - room.left + 1) * (room.bottom - room.top + 1) for room in rooms)
+    assert area == (dungeon_map == Dungeon.Area.ROOM.code).sum()
+
+
+def test_find_room(dungeon_with_rooms):
+    # GIVEN
+    dungeon = dungeon_with_rooms
+    rooms = dungeon.get_rooms()
+    width, height = dungeon.get_size()
+
+    # WHEN
+
+    # THEN
+    # 全てのセルについて, 全ての部屋を調べた結果と一致することを確認する
+    for y in range(height):
+        for x in range(width):
+            expected = next((room for room in rooms if room.contains(x, y)), None)
+            assert dungeon.find_room(x, y) is expected
+
+
+@pytest.mark.parametrize("x, y", [(0, 0), (60, 40), (119, 79), (-10, 200)])
+def test_nearest_room(dungeon_with_rooms, x, y):
+    # GIVEN
+    dungeon = dungeon_with_rooms
+
+    # WHEN
+    room = dungeon.nearest_room(x, y)
+
+    # THEN
+    assert room.distance_squared(x, y) == min(r.distance_squared(x, y) for r in dungeon.get_rooms())
+
+
+@pytest.mark.parametrize("left, top, right, bottom", [(0, 0, 19, 14), (30, 20, 70, 50), (0, 0, 119, 79)])
+def test_rooms_in_rect(dungeon_with_rooms, left, top, right, bottom):
+    # GIVEN
+    dungeon = dungeon_with_rooms
+
+    # WHEN
+    rooms = dungeon.rooms_in_rect(left, top, right, bottom)
+
+    # THEN
+    expected = [room for room in dungeon.get_rooms() if room.intersects(left, top, right, bottom)]
+    assert rooms == expected
+
+
+@pytest.mark.parametrize(
+    "min_room_width, min_room_height, max_room_width, max_room_height, room_margin",
+    [
+        (3, 3, None, None, 1),
+        (5, 4, 8, 6, 2),
+        (1, 1, 1, 1, 0),
+    ],
+)
+def test_room_constraints(min_room_width, min_room_height, max_room_width, max_room_height, room_margin):
+    # GIVEN
+    width, height = 150, 100
+
+    # WHEN
+    dungeon = Dungeon(width, height, seed=3, min_room_width=min_room_width, min_room_height=min_room_height,
+                      max_room_width=max_room_width, max_room_height=max_room_height, room_margin=room_margin)
+
+    # THEN
+    # 全ての部屋の大きさが指定された範囲に収まり, 部屋の外周に余白があることを確認する
+    rooms = dungeon.get_rooms()
+    assert len(rooms) > 1
+    for room in rooms:
+        room_width = room.right - room.left + 1
+        room_height = room.bottom - room.top + 1
+        assert min_room_width <= room_width <= (max_room_width or width)
+        assert min_room_height <= room_height <= (max_room_height or height)
+        assert room_margin <= room.left and room.right < width - room_margin
+        assert room_margin <= room.top and room.bottom < height - room_margin
+
+
+@pytest.mark.parametrize("max_depth", [0, 1, 4])
+def test_max_depth(max_depth):
+    # GIVEN
+
+    # WHEN
+    dungeon = Dungeon(200, 200, seed=5, max_depth=max_depth)
+
+    # THEN
+    # 分割の深さが制限され, 部屋の数が 2 の max_depth 乗以下になることを確認する
+    assert 1 <= len(dungeon.get_rooms()) <= 2 ** max_depth
+    assert len(dungeon.get_corridors()) == len(dungeon.get_rooms()) - 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"min_room_width": 0},
+        {"room_margin": -1},
+        {"min_room_height": 5, "max_room_height": 4},
+        {"max_depth": -1},
+    ],
+)
+def test_invalid_room_constraints(options):
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        Dungeon(40, 20, seed=1, **options)
+
+
+def test_large_dungeon_without_recursion():
+    # GIVEN
+    limit = sys.getrecursionlimit()
+
+    # WHEN
+    # 再帰の上限を低くしても, 多数の部屋を持つダンジョンを生成できることを確認する
+    sys.setrecursionlimit(100)
+    try:
+        dungeon = Dungeon(1000, 1000, seed=0)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    # THEN
+    tree = dungeon.get_tree()
+    assert len(dungeon.get_rooms()) == sum(1 for _ in tree.get_leaf_node())
+    assert len(tree) == len(dungeon.get_rooms()) * 2 - 1
+
+
+@pytest.mark.parametrize("tile_size", [None, 16, 200])
+def test_save_and_load(tmp_path, tile_size):
+    # GIVEN
+    dungeon = Dungeon(103, 67, seed=4, min_room_width=4, max_depth=6)
+    path = str(tmp_path / "dungeon.npy")
+
+    # WHEN
+    dungeon.save(path, tile_size=tile_size)
+    loaded = Dungeon.load(path)
+
+    # THEN
+    # マップと部屋・通路・BSP 木が復元され, 部屋の検索も同じ結果になることを確認する
+    assert (tmp_path / "dungeon.json").exists()
+    assert str(loaded) == str(dungeon)
+    assert repr(loaded.get_rooms()) == repr(dungeon.get_rooms())
+    assert repr(loaded.get_corridors()) == repr(dungeon.get_corridors())
+    assert loaded.get_room_graph() == dungeon.get_room_graph()
+    for x, y in [(0, 0), (30, 20), (80, 50)]:
+        assert repr(loaded.find_room(x, y)) == repr(dungeon.find_room(x, y))
+        assert repr(loaded.nearest_room(x, y)) == repr(dungeon.nearest_room(x, y))
+
+
+def test_load_memory_mapped(tmp_path):
+    # GIVEN
+    dungeon = Dungeon(60, 40, seed=2)
+    path = str(tmp_path / "dungeon.npy")
+    dungeon.save(path)
+
+    # WHEN
+    loaded = Dungeon.load(path, mmap_mode="r")
+
+    # THEN
+    # マップがコピーされずにメモリマップのまま読み取り専用で開かれることを確認する
+    assert isinstance(loaded.get_map().base, np.memmap)
+    assert (loaded.get_map() == dungeon.get_map()).all()
+    with pytest.raises(ValueError):
+        loaded.set_area(0, 0, Dungeon.Area.ROOM)
+
+
+@pytest.mark.parametrize("tile_size", [None, 7, 32])
+@pytest.mark.parametrize(
+    "left, top, right, bottom",
+    [
+        (0, 0, 102, 66),
+        (10, 5, 60, 40),
+        (33, 20, 33, 20),
+        (-10, -10, 200, 200),
+    ],
+)
+def test_read_region(tmp_path, tile_size, left, top, right, bottom):
+    # GIVEN
+    dungeon = Dungeon(103, 67, seed=4)
+    path = str(tmp_path / "dungeon.npy")
+    dungeon.save(path, tile_size=tile_size)
+
+    # WHEN
+    region = Dungeon.read_region(path, left, top, right, bottom)
+
+    # THEN
+    # マップの範囲に切り詰めた矩形の部分が読み込まれることを確認する
+    expected = dungeon.get_map()[max(top, 0):min(bottom, 66) + 1, max(left, 0):min(right, 102) + 1]
+    assert region.shape == expected.shape
+    assert (region == expected).all()
+
+
+def test_load_invalid_data(tmp_path):
+    # GIVEN
+    path = str(tmp_path / "dungeon.npy")
+    Dungeon(40, 20, seed=1).save(path)
+    (tmp_path / "dungeon.json").write_text("not json")
+
+    # WHEN
+    # THEN
+    with pytest.raises(DungeonError):
+        Dungeon.load(path)
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from src.dungeon.dungeon import Dungeon
+from src.dungeon.dungeon_batch import generate_batch
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_generate_batch_shared_memory(processes):
+    # GIVEN
+    specs = [(40, 20, 1), (60, 40, 2), (30, 30, 3)]
+
+    # WHEN
+    batch = generate_batch(specs, processes=processes, chunksize=1)
+
+    # THEN
+    # 各マップが同じシード値で生成したダンジョンと一致することを確認する
+    assert len(batch) == 3
+    for (width, height, seed), dungeon_map in zip(specs, batch.maps):
+        assert dungeon_map.dtype == np.uint8
+        assert np.array_equal(dungeon_map, Dungeon(width, height, seed=seed).get_map())
+    assert batch.get_throughput() > 0
+
+
+def test_generate_batch_npy(tmp_path):
+    # GIVEN
+    specs = [(50, 30, seed) for seed in range(5)]
+    path = str(tmp_path / "dungeons.npy")
+
+    # WHEN
+    batch = generate_batch(specs, processes=2, output_path=path, chunksize=2)
+
+    # THEN
+    # 1つの (N, height, width) の .npy ファイルとして保存されることを確認する
+    stacked = np.load(path)
+    assert stacked.shape == (5, 30, 50)
+    for (width, height, seed), dungeon_map in zip(specs, stacked):
+        assert np.array_equal(dungeon_map, Dungeon(width, height, seed=seed).get_map())
+    assert np.array_equal(batch.maps[4], stacked[4])
+
+
+def test_generate_batch_npy_mixed_sizes(tmp_path):
+    # GIVEN
+    specs = [(40, 20, 1), (60, 40, 2)]
+
+    # WHEN
+    with pytest.raises(ValueError) as e:
+        generate_batch(specs, output_path=str(tmp_path / "dungeons.npy"))
+
+    # THEN
+    assert str(e.value) == "All dungeons must have the same size to be stacked into one .npy file."
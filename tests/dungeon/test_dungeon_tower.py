@@ -0,0 +1,101 @@
+import pytest
+from src.dungeon.dungeon import Dungeon
+from src.dungeon.dungeon_tower import DungeonTower
+
+
+def test_floors_are_lazy_and_bounded():
+    # GIVEN
+    tower = DungeonTower(40, 30, floor_count=10, seed=1, max_live_floors=2)
+
+    # WHEN
+    tower.get_floor(0)
+    tower.get_floor(1)
+    tower.get_floor(2)
+
+    # THEN
+    # 訪れていない階層は生成されず, 古い階層から追い出されることを確認する
+    assert not tower.is_live(0)
+    assert tower.is_live(1)
+    assert tower.is_live(2)
+    assert not tower.is_live(5)
+
+
+def test_evicted_floor_is_regenerated():
+    # GIVEN
+    tower = DungeonTower(40, 30, floor_count=10, seed=1, max_live_floors=1)
+    first = str(tower.get_floor(3))
+
+    # WHEN
+    tower.get_floor(4)
+    regenerated = str(tower.get_floor(3))
+
+    # THEN
+    assert regenerated == first
+
+
+def test_stairs_are_consistent():
+    # GIVEN
+    tower = DungeonTower(40, 30, floor_count=3, seed=2, max_live_floors=1)
+
+    # WHEN
+    next_floor, arrival = tower.descend(0)
+    previous_floor, departure = tower.ascend(next_floor)
+
+    # THEN
+    # 下った先は上り階段, 上った先は下り階段で, 最上階と最下階には片方の階段しかないことを確認する
+    assert next_floor == 1
+    assert tower.get_floor(1).get_area(*arrival) == Dungeon.Area.UP_STAIRS
+    assert previous_floor == 0
+    assert departure == tower.get_stairs(0)[1]
+    assert tower.get_floor(0).get_area(*departure) == Dungeon.Area.DOWN_STAIRS
+    assert tower.get_stairs(0)[0] is None
+    assert tower.get_stairs(2)[1] is None
+    with pytest.raises(ValueError):
+        tower.descend(2)
+
+
+def test_modified_floor_is_persisted(tmp_path):
+    # GIVEN
+    tower = DungeonTower(40, 30, floor_count=5, seed=3, max_live_floors=1, persist_dir=str(tmp_path))
+    room = tower.get_floor(1).get_rooms()[0]
+    tower.get_floor(1).set_area(room.left, room.top, Dungeon.Area.WALL)
+
+    # WHEN
+    tower.get_floor(2)
+    restored = tower.get_floor(1)
+
+    # THEN
+    # 追い出された階層の書き換えがディスクから復元されることを確認する
+    assert (tmp_path / "floor_1.npy").exists()
+    assert not (tmp_path / "floor_2.npy").exists()
+    assert restored.get_area(room.left, room.top) == Dungeon.Area.WALL
+
+
+def test_flush_persists_live_floors(tmp_path):
+    # GIVEN
+    tower = DungeonTower(40, 30, floor_count=5, seed=3, persist_dir=str(tmp_path))
+    room = tower.get_floor(1).get_rooms()[0]
+    tower.get_floor(1).set_area(room.left, room.top, Dungeon.Area.WALL)
+    tower.get_floor(2)
+
+    # WHEN
+    tower.flush()
+
+    # THEN
+    # メモリ上の書き換えられた階層だけが保存され, 別の塔から復元できることを確認する
+    assert tower.is_live(1)
+    assert (tmp_path / "floor_1.npy").exists()
+    assert not (tmp_path / "floor_2.npy").exists()
+    restored = DungeonTower(40, 30, floor_count=5, seed=3, persist_dir=str(tmp_path)).get_floor(1)
+    assert restored.get_area(room.left, room.top) == Dungeon.Area.WALL
+
+
+def test_floor_without_rooms():
+    # GIVEN
+    tower = DungeonTower(4, 4, floor_count=3)
+
+    # WHEN
+    tower.get_floor(1)
+
+    # THEN
+    assert tower.get_stairs(1) == (None, None)
@@ -0,0 +1,78 @@
+import pytest
+from collections import deque
+import numpy as np
+from src.dungeon.dungeon import Dungeon
+from src.dungeon.dungeon_world import DungeonWorld, build_chunk
+
+
+def test_chunks_are_stitched():
+    # GIVEN
+    with DungeonWorld(seed=5, chunk_width=30, chunk_height=20) as world:
+        # WHEN
+        # 負の座標を含む 3x3 チャンクの範囲の通行可能なセルを集める
+        cells = {
+            (x, y) for y in range(-20, 40) for x in range(-30, 60) if world.get_area(x, y) != Dungeon.Area.WALL
+        }
+
+    # THEN
+    # チャンクの境界を越えて, 範囲内の全ての部屋と通路が繋がっていることを確認する
+    start = next(iter(cells))
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for neighbor in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if neighbor in cells and neighbor not in reached:
+                reached.add(neighbor)
+                queue.append(neighbor)
+    assert reached == cells
+
+
+def test_build_chunk_is_deterministic():
+    # GIVEN
+
+    # WHEN
+    first = build_chunk(7, -3, 12, 40, 30)
+    second = build_chunk(7, -3, 12, 40, 30)
+
+    # THEN
+    assert np.array_equal(first, second)
+
+
+def test_mirrored_chunks_differ():
+    # GIVEN
+
+    # WHEN
+    # 符号だけが異なる座標のチャンクにも別の乱数生成器が割り当てられることを確認する
+    positive = build_chunk(7, 3, 12, 40, 30)
+    negative = build_chunk(7, -3, 12, 40, 30)
+
+    # THEN
+    assert not np.array_equal(positive, negative)
+
+
+def test_prefetch_and_evict():
+    # GIVEN
+    with DungeonWorld(seed=1, chunk_width=20, chunk_height=20, prefetch_radius=1, evict_radius=1) as world:
+        # WHEN
+        world.update_position(5, 5)
+        world.get_chunk(1, 1)
+        world.update_position(5 + 20 * 3, 5)
+
+        # THEN
+        # 先読みしたチャンクのうち, プレイヤーから離れたものが追い出されることを確認する
+        world.get_chunk(3, 0)
+        assert world.is_loaded(3, 0)
+        assert not world.is_loaded(0, 0)
+        assert not world.is_loaded(1, 1)
+
+
+def test_chunk_too_small():
+    # GIVEN
+
+    # WHEN
+    with pytest.raises(ValueError) as e:
+        DungeonWorld(chunk_width=3, chunk_height=3)
+
+    # THEN
+    assert str(e.value) == "Chunk size is too small."
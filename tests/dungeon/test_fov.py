@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+from src.dungeon.dungeon import Dungeon
+from src.dungeon.fov import DungeonFOV
+
+
+@pytest.fixture()
+def dungeon():
+    return Dungeon(60, 40, seed=3)
+
+
+def test_compute_inside_room(dungeon):
+    # GIVEN
+    fov = DungeonFOV(dungeon)
+    room = max(dungeon.get_rooms(), key=lambda r: (r.right - r.left) * (r.bottom - r.top))
+    x, y = room.left, room.top
+    radius = max(room.right - room.left, room.bottom - room.top)
+
+    # WHEN
+    visible = fov.compute(x, y, radius)
+
+    # THEN
+    # 遮るもののない部屋の中は, 半径内の全てのセルが見えることを確認する
+    for ty in range(room.top, room.bottom + 1):
+        for tx in range(room.left, room.right + 1):
+            if (tx - x) ** 2 + (ty - y) ** 2 <= radius ** 2:
+                assert visible[ty - y + radius, tx - x + radius]
+    # 部屋の中のセルへの視線は全て通ることを確認する
+    targets = np.array([(tx, ty) for ty in range(room.top, room.bottom + 1) for tx in range(room.left, room.right + 1)])
+    sources = np.tile((x, y), (len(targets), 1))
+    assert fov.line_of_sight(sources, targets).all()
+
+
+def test_compute_is_cached_and_invalidated(dungeon):
+    # GIVEN
+    fov = DungeonFOV(dungeon)
+    room = dungeon.get_rooms()[0]
+    first = fov.compute(room.left, room.top, 5)
+
+    # WHEN
+    second = fov.compute(room.left, room.top, 5)
+    dungeon.set_area(room.left + 1, room.top, Dungeon.Area.WALL)
+    third = fov.compute(room.left, room.top, 5)
+
+    # THEN
+    # マップが変わるまではキャッシュが返り, 変わった後は再計算されることを確認する
+    assert first is second
+    assert third is not first
+    assert not third[5, 7]
+
+
+def test_line_of_sight():
+    # GIVEN
+    dungeon = Dungeon(60, 40, seed=3)
+    fov = DungeonFOV(dungeon)
+    room = dungeon.get_rooms()[0]
+    sources = np.array([(room.left, room.top), (room.left, room.top), (room.left, room.top)])
+    targets = np.array([(room.right, room.bottom), (room.left, room.top), (room.left, room.bottom + 5)])
+
+    # WHEN
+    result = fov.line_of_sight(sources, targets)
+
+    # THEN
+    # 部屋の中の視線は通り, 部屋の外の壁の向こうへの視線は遮られることを確認する
+    assert result.tolist() == [True, True, False]
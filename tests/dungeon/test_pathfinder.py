@@ -0,0 +1,57 @@
+import pytest
+import random
+from src.dungeon.dungeon import Dungeon
+from src.dungeon.pathfinder import DungeonPathfinder
+
+
+@pytest.fixture()
+def dungeon():
+    return Dungeon(120, 80, seed=11)
+
+
+def test_find_path(dungeon):
+    # GIVEN
+    pathfinder = DungeonPathfinder(dungeon)
+    width, height = dungeon.get_size()
+    open_cells = [(x, y) for y in range(height) for x in range(width) if dungeon.get_area(x, y) != Dungeon.Area.WALL]
+    rng = random.Random(0)
+
+    for _ in range(50):
+        start, goal = rng.choice(open_cells), rng.choice(open_cells)
+
+        # WHEN
+        path = pathfinder.find_path(start, goal)
+
+        # THEN
+        # 経路が出発地点から目的地まで, 壁を通らずに1マスずつ繋がっていることを確認する
+        assert path[0] == start
+        assert path[-1] == goal
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            assert abs(x1 - x0) + abs(y1 - y0) == 1
+        assert all(dungeon.get_area(x, y) != Dungeon.Area.WALL for x, y in path)
+
+
+def test_find_path_from_wall(dungeon):
+    # GIVEN
+    pathfinder = DungeonPathfinder(dungeon)
+    room = dungeon.get_rooms()[0]
+
+    # WHEN
+    path = pathfinder.find_path((0, 0), (room.left, room.top))
+
+    # THEN
+    assert path is None
+
+
+def test_room_distances_are_cached(dungeon):
+    # GIVEN
+    pathfinder = DungeonPathfinder(dungeon)
+
+    # WHEN
+    first = pathfinder.get_room_distances(0)
+    second = pathfinder.get_room_distances(0)
+
+    # THEN
+    # 全ての部屋に到達でき, 2回目はキャッシュされた結果が返ることを確認する
+    assert first is second
+    assert len(first[0]) == len(dungeon.get_rooms())
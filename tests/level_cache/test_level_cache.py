@@ -0,0 +1,79 @@
+import pytest
+import pickle
+from src.maze.maze import Maze
+from src.dungeon.dungeon import Dungeon
+from src.level_cache.level_cache import LevelCache
+
+
+@pytest.mark.parametrize(
+    "level_class, size, seed",
+    [
+        (Maze, (21, 21), 42),
+        (Dungeon, (40, 20), 1),
+    ],
+)
+def test_get_returns_cached_level(tmp_path, level_class, size, seed):
+    # GIVEN
+    cache = LevelCache(directory=str(tmp_path))
+
+    # WHEN
+    first = cache.get(level_class, size, seed)
+    second = cache.get(level_class, size, seed)
+
+    # THEN
+    # 2回目はメモリ上の同じオブジェクトが返り, 生成結果はシード値から再現できることを確認する
+    assert first is second
+    assert str(first) == str(level_class(*size, seed=seed))
+    assert LevelCache.make_key(level_class, size, seed) in cache
+
+
+def test_get_reads_disk_after_eviction(tmp_path):
+    # GIVEN
+    cache = LevelCache(max_entries=1, directory=str(tmp_path))
+    first = cache.get(Maze, (21, 21), seed=1)
+
+    # WHEN
+    cache.get(Maze, (21, 21), seed=2)
+    reloaded = cache.get(Maze, (21, 21), seed=1)
+
+    # THEN
+    # メモリから追い出されたマップがディスクから復元されることを確認する
+    assert len(cache) == 1
+    assert reloaded is not first
+    assert str(reloaded) == str(first)
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_get_without_seed():
+    # GIVEN
+    cache = LevelCache()
+
+    # WHEN
+    with pytest.raises(ValueError) as e:
+        cache.get(Maze, (21, 21), seed=None)
+
+    # THEN
+    assert str(e.value) == "Seed must be specified to cache a level."
+
+
+@pytest.mark.parametrize(
+    "max_bytes, expected_dumps",
+    [
+        (None, 0),
+        (1 << 20, 1),
+    ],
+)
+def test_get_pickles_only_when_needed(monkeypatch, max_bytes, expected_dumps):
+    # GIVEN
+    cache = LevelCache(max_bytes=max_bytes)
+    dumps = []
+    original_dumps = pickle.dumps
+    monkeypatch.setattr(pickle, "dumps", lambda *args, **kwargs: dumps.append(args) or original_dumps(*args, **kwargs))
+
+    # WHEN
+    level = cache.get(Maze, (21, 21), seed=3)
+
+    # THEN
+    # ディスクもサイズの上限もないメモリだけのキャッシュでは, 生成したマップを pickle しないことを確認する
+    assert len(dumps) == expected_dumps
+    assert cache.get(Maze, (21, 21), seed=3) is level
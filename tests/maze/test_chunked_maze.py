@@ -0,0 +1,132 @@
+import pytest
+import gc
+import os
+from collections import deque
+import numpy as np
+from src.maze.maze import Maze, MazeError
+from src.maze.chunked_maze import CELL_CODES, ChunkedMaze
+
+
+def read_all_cells(maze):
+    width, height = maze.get_size()
+    return [[maze.get_cell(x, y) for x in range(width)] for y in range(height)]
+
+
+@pytest.mark.parametrize(
+    "width, height, chunk_size",
+    [
+        (5, 5, 1),
+        (21, 15, 3),
+        (41, 41, 4),
+    ],
+)
+def test_chunked_maze_is_perfect(tmp_path, width, height, chunk_size):
+    # GIVEN
+    maze = ChunkedMaze(width, height, seed=1, chunk_size=chunk_size, path=str(tmp_path / "maze.bin"))
+
+    # WHEN
+    cells = read_all_cells(maze)
+
+    # THEN
+    # スタートから全ての通路セルに到達でき, 通路の辺の数がセル数-1（ループがない）であることを確認する
+    open_cells = {(x, y) for y in range(height) for x in range(width) if cells[y][x] != Maze.Cell.WALL}
+    edges = sum(1 for (x, y) in open_cells for (nx, ny) in ((x + 1, y), (x, y + 1)) if (nx, ny) in open_cells)
+    reached = {(1, 1)}
+    queue = deque([(1, 1)])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) in open_cells and (nx, ny) not in reached:
+                reached.add((nx, ny))
+                queue.append((nx, ny))
+    assert reached == open_cells
+    assert edges == len(open_cells) - 1
+    assert cells[1][1] == Maze.Cell.START
+    assert cells[height - 2][width - 2] == Maze.Cell.GOAL
+
+
+def test_chunked_maze_is_deterministic(tmp_path):
+    # GIVEN
+    first = ChunkedMaze(31, 31, seed=7, chunk_size=3, path=str(tmp_path / "first.bin"))
+    second = ChunkedMaze(31, 31, seed=7, chunk_size=3, path=str(tmp_path / "second.bin"))
+
+    # WHEN
+    # 異なる順序でチャンクを生成させる
+    second.get_cell(29, 29)
+
+    # THEN
+    assert read_all_cells(first) == read_all_cells(second)
+
+
+def test_chunked_maze_lazy_generation_and_lru(tmp_path):
+    # GIVEN
+    maze = ChunkedMaze(41, 41, seed=0, chunk_size=4, path=str(tmp_path / "maze.bin"), max_cached_chunks=2)
+
+    # WHEN
+    maze.get_cell(1, 1)
+    maze.get_cell(39, 39)
+    maze.get_cell(20, 1)
+
+    # THEN
+    assert maze.get_chunk_count() == (5, 5)
+    assert maze.is_generated(0, 0)
+    assert maze.is_generated(4, 4)
+    assert not maze.is_generated(2, 2)
+    assert maze.get_cached_chunk_count() == 2
+
+
+def test_chunked_maze_even(tmp_path):
+    # GIVEN
+
+    # WHEN
+    with pytest.raises(MazeError) as e:
+        ChunkedMaze(6, 6, path=str(tmp_path / "maze.bin"))
+
+    # THEN
+    assert str(e.value) == "Maze size must be specified in odd numbers."
+
+
+def test_chunked_maze_close_removes_temporary_file():
+    # GIVEN
+    maze = ChunkedMaze(21, 21, seed=0, chunk_size=4)
+    path = maze.path
+    maze.get_cell(1, 1)
+
+    # WHEN
+    with maze:
+        pass
+
+    # THEN
+    # 自分で作った一時ファイルが削除され, 閉じた後は参照できないことを確認する
+    assert not os.path.exists(path)
+    with pytest.raises(MazeError):
+        maze.get_cell(1, 1)
+
+
+def test_chunked_maze_finalizer_removes_temporary_file():
+    # GIVEN
+    maze = ChunkedMaze(21, 21, seed=0, chunk_size=4)
+    path = maze.path
+
+    # WHEN
+    # close を呼ばずに破棄する
+    del maze
+    gc.collect()
+
+    # THEN
+    assert not os.path.exists(path)
+
+
+def test_chunked_maze_close_keeps_given_file(tmp_path):
+    # GIVEN
+    path = str(tmp_path / "maze.bin")
+    maze = ChunkedMaze(21, 21, seed=0, chunk_size=4, path=path)
+    maze.get_cell(1, 1)
+
+    # WHEN
+    maze.close()
+
+    # THEN
+    # 指定されたファイルは削除されず, 生成済みのセルが書き出されていることを確認する
+    cells = np.fromfile(path, dtype=np.uint8).reshape(21, 21)
+    assert CELL_CODES[cells[1, 1]] == Maze.Cell.START
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+from src.maze.maze import Maze
+from src.maze.flow_field import FlowField, get_flow_field
+
+
+@pytest.mark.parametrize(
+    "width, height, seed",
+    [
+        (5, 5, 0),
+        (21, 21, 1),
+        (31, 15, 2),
+    ],
+)
+def test_flow_field_reaches_goal(width, height, seed):
+    # GIVEN
+    maze = Maze(width, height, seed=seed)
+    field = FlowField(maze)
+
+    # WHEN
+    # 全ての通路セルにエージェントを置き, まとめて進める
+    positions = np.array([(x, y) for y in range(height) for x in range(width) if maze.get_cell(x, y) != Maze.Cell.WALL])
+    for _ in range(width * height):
+        positions = field.step(positions)
+
+    # THEN
+    # 全てのエージェントがゴールに到達することを確認する
+    assert (positions == (width - 2, height - 2)).all()
+    assert field.get_direction(width - 2, height - 2) == FlowField.Direction.NONE
+    assert field.get_direction(0, 0) == FlowField.Direction.NONE
+
+
+def test_flow_field_next_position():
+    # GIVEN
+    maze = Maze(21, 21, seed=3)
+    field = FlowField(maze, target=(1, 1))
+
+    # WHEN
+    x, y = 19, 19
+    steps = 0
+    while (x, y) != (1, 1):
+        x, y = field.next_position(x, y)
+        steps += 1
+
+    # THEN
+    # 1歩ごとに目的地までの歩数が1ずつ減り, 目的地に到達することを確認する
+    assert steps == field.get_distance(19, 19)
+
+
+def test_get_flow_field_cache():
+    # GIVEN
+    maze = Maze(11, 11, seed=4)
+
+    # WHEN
+    first = get_flow_field(maze)
+    second = get_flow_field(maze, target=(9, 9))
+    other = get_flow_field(maze, target=(1, 1))
+
+    # THEN
+    assert first is second
+    assert other is not first
+    assert other.target == (1, 1)
+
+
+def test_flow_field_wall_target():
+    # GIVEN
+    maze = Maze(11, 11, seed=5)
+
+    # WHEN
+    with pytest.raises(ValueError) as e:
+        FlowField(maze, target=(0, 0))
+
+    # THEN
+    assert str(e.value) == "Target must not be a wall."
@@ -54,3 +54,116 @@ def test_init_maze_even(width, height):
 
     # THEN
     assert str(e.value) == "Maze size must be specified in odd numbers."
+
+
+def test_init_maze_seed():
+    # GIVEN
+
+    # WHEN
+    first = Maze(21, 21, seed=42)
+    second = Maze(21, 21, seed=42)
+
+    # THEN
+    # 同じシード値からは同じ迷路が生成されることを確認する
+    assert str(first) == str(second)
+
+
+@pytest.mark.parametrize(
+    "width, height, compress",
+    [
+        (5, 5, False),
+        (21, 15, False),
+        (21, 15, True),
+    ],
+)
+def test_maze_bytes(width, height, compress):
+    # GIVEN
+    maze = Maze(width, height, seed=0)
+
+    # WHEN
+    data = maze.to_bytes(compress=compress)
+    restored = Maze.from_bytes(data)
+
+    # THEN
+    # 1セル1ビットで格納され, 元の迷路と同じ迷路が復元されることを確認する
+    if not compress:
+        assert len(data) == Maze.BINARY_HEADER.size + (width * height + 7) // 8
+    assert restored.get_size() == (width, height)
+    assert str(restored) == str(maze)
+
+
+def test_maze_save_load(tmp_path):
+    # GIVEN
+    maze = Maze(31, 31, seed=1)
+    path = str(tmp_path / "level.maze")
+
+    # WHEN
+    maze.save(path, compress=True)
+    restored = Maze.load(path)
+
+    # THEN
+    assert str(restored) == str(maze)
+    assert restored.get_cell(1, 1) == Maze.Cell.START
+    assert restored.get_cell(29, 29) == Maze.Cell.GOAL
+
+
+def test_maze_from_invalid_bytes():
+    # GIVEN
+
+    # WHEN
+    with pytest.raises(MazeError) as e:
+        Maze.from_bytes(b"NOT A MAZE")
+
+    # THEN
+    assert str(e.value) == "Invalid maze data."
+
+
+def test_maze_from_corrupt_compressed_bytes():
+    # GIVEN
+    data = Maze(11, 11, seed=0).to_bytes(compress=True)
+    header_size = Maze.BINARY_HEADER.size
+
+    # WHEN
+    # 圧縮されたセルの部分を壊す
+    with pytest.raises(MazeError) as e:
+        Maze.from_bytes(data[:header_size] + b"\x00" * (len(data) - header_size))
+
+    # THEN
+    assert str(e.value) == "Invalid maze data."
+
+
+def test_maze_bytes_without_start():
+    # GIVEN
+    # スタートがゴールの位置にあるため, ゴールに上書きされてスタートのセルが無い迷路
+    maze = Maze(5, 5, start_x=3, start_y=3, seed=0)
+
+    # WHEN
+    restored = Maze.from_bytes(maze.to_bytes())
+
+    # THEN
+    assert str(restored) == str(maze)
+    assert restored.get_cell(0, 0) == Maze.Cell.WALL
+    assert restored.get_cell(3, 3) == Maze.Cell.GOAL
+
+
+@pytest.mark.parametrize("width, height, start_x, start_y, goal_x, goal_y", [
+    (0, 11, 1, 1, 9, 9),
+    (11, 0, 1, 1, 9, 9),
+    (11, 11, 11, 1, 9, 9),
+    (11, 11, 1, 11, 9, 9),
+    (11, 11, 1, 1, 11, 9),
+    (11, 11, 1, 1, 9, 11),
+])
+def test_maze_from_out_of_range_header(width, height, start_x, start_y, goal_x, goal_y):
+    # GIVEN
+    header = Maze.BINARY_HEADER.pack(
+        Maze.BINARY_MAGIC, Maze.BINARY_VERSION, 0, width, height, start_x, start_y, goal_x, goal_y
+    )
+    data = header + b"\x00" * ((width * height + 7) // 8)
+
+    # WHEN
+    with pytest.raises(MazeError) as e:
+        Maze.from_bytes(data)
+
+    # THEN
+    assert str(e.value) == "Invalid maze data."
@@ -0,0 +1,74 @@
+import pytest
+from collections import deque
+from src.maze.maze import Maze
+import numpy as np
+from src.maze.parallel_maze import generate_parallel, generate_parallel_grid, measure_speedup
+
+
+@pytest.mark.parametrize(
+    "width, height, processes, regions",
+    [
+        (5, 5, 1, None),
+        (21, 21, 2, None),
+        (31, 25, 2, 5),
+    ],
+)
+def test_generate_parallel_is_perfect(width, height, processes, regions):
+    # GIVEN
+
+    # WHEN
+    maze = generate_parallel(width, height, processes=processes, regions=regions, seed=3)
+
+    # THEN
+    # スタートから全ての通路セルに到達でき, 通路の辺の数がセル数-1（ループがない）であることを確認する
+    open_cells = {(x, y) for y in range(height) for x in range(width) if maze.get_cell(x, y) != Maze.Cell.WALL}
+    edges = sum(1 for (x, y) in open_cells for (nx, ny) in ((x + 1, y), (x, y + 1)) if (nx, ny) in open_cells)
+    reached = {(1, 1)}
+    queue = deque([(1, 1)])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) in open_cells and (nx, ny) not in reached:
+                reached.add((nx, ny))
+                queue.append((nx, ny))
+    assert maze.get_size() == (width, height)
+    assert reached == open_cells
+    assert edges == len(open_cells) - 1
+    assert maze.get_cell(1, 1) == Maze.Cell.START
+    assert maze.get_cell(width - 2, height - 2) == Maze.Cell.GOAL
+
+
+def test_generate_parallel_is_deterministic():
+    # GIVEN
+
+    # WHEN
+    first = generate_parallel(21, 21, processes=1, regions=3, seed=5)
+    second = generate_parallel(21, 21, processes=2, regions=3, seed=5)
+
+    # THEN
+    # 同じ領域分割とシードであれば, プロセス数によらず同じ迷路になることを確認する
+    assert str(first) == str(second)
+
+
+def test_generate_parallel_default_regions_ignore_processes():
+    # GIVEN
+
+    # WHEN
+    # 領域の数を省略し, プロセス数だけを変える
+    first = generate_parallel_grid(41, 41, processes=1, seed=9)
+    second = generate_parallel_grid(41, 41, processes=2, seed=9)
+
+    # THEN
+    # 既定の領域の数はプロセス数に依存しないため, 同じシードから同じ迷路になることを確認する
+    assert np.array_equal(first, second)
+
+
+def test_measure_speedup():
+    # GIVEN
+
+    # WHEN
+    results = measure_speedup(21, 21, process_counts=(1, 2))
+
+    # THEN
+    assert [result["processes"] for result in results] == [1, 2]
+    assert results[0]["speedup"] == 1.0
@@ -1,4 +1,7 @@
 import pytest
+import random
+import subprocess
+import sys
 from src.reversi.player import *
 
 
@@ -45,4 +48,34 @@ def test_init_reversi_player_error(class_name, stone_color):
         player = class_name(stone_color)
 
     # THEN
-    assert str(e.value) == "Invalid stone color. Must be either ReversiBoard.Stone.BLACK or ReversiBoard.Stone.WHITE"
\ No newline at end of file
+    assert str(e.value) == "Invalid stone color. Must be either ReversiBoard.Stone.BLACK or ReversiBoard.Stone.WHITE"
+
+def test_random_player_rng():
+    # GIVEN
+    first_board = ReversiBoard()
+    second_board = ReversiBoard()
+    first_player = ReversiRandomPlayer(ReversiBoard.Stone.BLACK, rng=random.Random(3))
+    second_player = ReversiRandomPlayer(ReversiBoard.Stone.BLACK, rng=random.Random(3))
+
+    # WHEN
+    # 同じ乱数生成器を渡したプレイヤーに同じ盤面で打たせる
+    random.seed(0)
+    first_player.play(first_board)
+    random.seed(1)
+    second_player.play(second_board)
+
+    # THEN
+    assert str(first_board) == str(second_board)
+
+
+def test_import_without_curses():
+    # GIVEN
+    code = "import sys, src.reversi.game_master; print('curses' in sys.modules)"
+
+    # WHEN
+    # 新しいインタプリタでプレイヤーを読み込む
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    # THEN
+    # 人間のプレイヤーが打つまでは curses が読み込まれないことを確認する
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,120 @@
+import pytest
+import numpy as np
+from src.rng.rng_provider import RngProvider
+
+
+def test_python_random_seed():
+    # GIVEN
+    first = RngProvider(seed=42)
+    second = RngProvider(seed=42)
+
+    # WHEN
+    first_values = [first.python_random().random() for _ in range(3)]
+    second_values = [second.python_random().random() for _ in range(3)]
+
+    # THEN
+    # 同じシード値からは同じ順番で同じ乱数生成器が作られ, 呼び出すたびに別の系列になることを確認する
+    assert first_values == second_values
+    assert len(set(first_values)) == 3
+
+
+def test_numpy_generator_seed():
+    # GIVEN
+    first = RngProvider(seed=7)
+    second = RngProvider(seed=7)
+
+    # WHEN
+    first_values = first.numpy_generator().random(5)
+    second_values = second.numpy_generator().random(5)
+
+    # THEN
+    assert isinstance(first.numpy_generator(), np.random.Generator)
+    assert np.array_equal(first_values, second_values)
+
+
+def test_spawn():
+    # GIVEN
+    provider = RngProvider(seed=0)
+
+    # WHEN
+    # ワーカーごとの子を作り, それぞれから乱数生成器を作る
+    workers = provider.spawn(4)
+    values = [worker.python_random().getrandbits(64) for worker in workers]
+    again = [worker.python_random().getrandbits(64) for worker in RngProvider(seed=0).spawn(4)]
+
+    # THEN
+    # 子どうしの系列は異なり, 同じシード値からは同じ子が作られることを確認する
+    assert len(set(values)) == 4
+    assert values == again
+
+
+@pytest.mark.parametrize("n", [0, 1, 16])
+def test_spawn_seeds(n):
+    # GIVEN
+    provider = RngProvider(seed=123)
+
+    # WHEN
+    seeds = provider.spawn_seeds(n)
+
+    # THEN
+    assert seeds == RngProvider(seed=123).spawn_seeds(n)
+    assert len(set(seeds)) == n
+    assert all(0 <= seed < 2 ** 64 for seed in seeds)
+
+
+def test_derive():
+    # GIVEN
+    provider = RngProvider(seed=5)
+
+    # WHEN
+    # 別の子を作った後でも, 同じキーからは同じ乱数生成器が作られる
+    first = provider.derive(3, 4).python_random().random()
+    provider.spawn(10)
+    provider.python_random()
+    second = provider.derive(3, 4).python_random().random()
+    other = provider.derive(4, 3).python_random().random()
+    spawned = RngProvider(seed=5).spawn(1)[0].python_random().random()
+
+    # THEN
+    assert first == second
+    assert first != other
+    assert first != spawned
+
+
+def test_derive_error():
+    # GIVEN
+    provider = RngProvider(seed=5)
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        provider.derive(-1)
+
+
+def test_entropy():
+    # GIVEN
+    provider = RngProvider()
+
+    # WHEN
+    # シード値を省略した場合のエントロピーから作り直す
+    recreated = RngProvider(seed=provider.get_entropy())
+
+    # THEN
+    assert provider.python_random().random() == recreated.python_random().random()
+
+
+def test_independent_objects():
+    # GIVEN
+    provider = RngProvider(seed=1)
+    rngs = [provider.python_random() for _ in range(2)]
+    other = RngProvider(seed=1)
+    other_rngs = [other.python_random() for _ in range(2)]
+
+    # WHEN
+    # 一方の乱数生成器だけを消費する
+    for _ in range(100):
+        rngs[0].random()
+
+    # THEN
+    # 乱数生成器を共有しないため, 他方の系列は影響を受けないことを確認する
+    assert rngs[1].random() == other_rngs[1].random()
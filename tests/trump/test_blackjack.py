@@ -0,0 +1,137 @@
+import pytest
+import numpy as np
+from src.trump.blackjack import Action, Rules, RunningStats, Strategy, hand_total, simulate, split_shards
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([10, 7], (17, False)),
+        ([11, 6], (17, True)),
+        ([11, 11], (12, True)),
+        ([11, 6, 10], (17, False)),
+        ([10, 10, 5], (25, False)),
+        ([11, 10], (21, True)),
+    ],
+)
+def test_hand_total(values, expected):
+    # GIVEN
+
+    # WHEN
+    ret = hand_total(values)
+
+    # THEN
+    assert ret == expected
+
+
+@pytest.mark.parametrize(
+    "values, upcard, can_split, expected",
+    [
+        ([10, 6], 10, True, Action.HIT),
+        ([10, 6], 6, True, Action.STAND),
+        ([6, 5], 11, True, Action.HIT),
+        ([6, 5], 10, True, Action.DOUBLE),
+        ([11, 7], 3, True, Action.DOUBLE_OR_STAND),
+        ([11, 7], 9, True, Action.HIT),
+        ([8, 8], 10, True, Action.SPLIT),
+        ([8, 8], 10, False, Action.HIT),
+        ([10, 10], 6, True, Action.STAND),
+        ([5, 5], 9, True, Action.DOUBLE),
+        ([10, 9], 11, True, Action.STAND),
+        ([2, 3, 10, 4], 7, True, Action.STAND),
+    ],
+)
+def test_basic_strategy(values, upcard, can_split, expected):
+    # GIVEN
+    strategy = Strategy.basic()
+
+    # WHEN
+    action = strategy.decide(values, upcard, can_split)
+
+    # THEN
+    assert action == expected
+
+
+def test_invalid_strategy():
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        Strategy({12: "H H S"}, {}, {})
+
+
+def test_bet_ramp():
+    # GIVEN
+    strategy = Strategy.basic(bet_ramp=[(2, 4), (1, 2), (4, 8)])
+
+    # WHEN
+
+    # THEN
+    # トゥルーカウントが高いほど多く賭けることを確認する
+    assert [strategy.get_bet(true_count) for true_count in (-3, 0, 1, 2.5, 5)] == [1, 1, 2, 4, 8]
+
+
+def test_running_stats_merge():
+    # GIVEN
+    values = np.random.default_rng(0).normal(size=1000)
+    first, second, whole = RunningStats(), RunningStats(), RunningStats()
+
+    # WHEN
+    # 値を2つに分けて集計し, 結合する
+    for value in values[:300]:
+        first.add(value)
+    for value in values[300:]:
+        second.add(value)
+    for value in values:
+        whole.add(value)
+    first.merge(second)
+
+    # THEN
+    # 結合した結果が, 全ての値を1度に集計した結果と一致することを確認する
+    assert first.count == 1000
+    assert first.mean == pytest.approx(values.mean())
+    assert first.get_variance() == pytest.approx(values.var(ddof=1))
+    assert first.get_variance() == pytest.approx(whole.get_variance())
+
+
+def test_split_shards():
+    # GIVEN
+
+    # WHEN
+    shards = split_shards(1003, 10, seed=5)
+
+    # THEN
+    # ラウンド数が全て割り当てられ, シャードごとに異なるシード値になることを確認する
+    assert sum(size for size, _ in shards) == 1003
+    assert len({seed for _, seed in shards}) == 10
+    assert shards == split_shards(1003, 10, seed=5)
+
+
+def test_simulate_reproducible():
+    # GIVEN
+
+    # WHEN
+    # 同じシード値とシャード数で, プロセス数を変えてシミュレーションする
+    first = simulate(2000, seed=1, processes=1, shards=4)
+    second = simulate(2000, seed=1, processes=2, shards=4)
+
+    # THEN
+    # プロセス数によらず同じ結果になることを確認する
+    assert first.stats.count == 2000
+    assert (first.stats.mean, first.stats.m2, first.wagered) == (second.stats.mean, second.stats.m2, second.wagered)
+
+
+def test_simulate_counting():
+    # GIVEN
+    strategy = Strategy.basic(bet_ramp=[(1, 2), (2, 4)])
+    rules = Rules(deck_count=2, penetration=0.8)
+
+    # WHEN
+    result = simulate(3000, strategy=strategy, rules=rules, seed=2, processes=1)
+
+    # THEN
+    # カウントに応じて賭け金が変わり, 期待値が妥当な範囲に収まることを確認する
+    assert result.wagered > 3000
+    assert -0.2 < result.get_ev() < 0.2
+    assert result.stats.get_standard_error() > 0
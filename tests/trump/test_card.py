@@ -0,0 +1,73 @@
+import pytest
+import pickle
+from array import array
+from src.trump.trump import Suit, Number, Card, Trump, CODE_STRINGS, JOKER_CODES
+
+
+@pytest.mark.parametrize(
+    "suit, number, expected_code, expected_str",
+    [
+        (Suit.SPADE, Number.ACE, 0, "♠-A"),
+        (Suit.HEART, Number.TWO, 14, "♡-2"),
+        (Suit.DIA, Number.TEN, 35, "♢-10"),
+        (Suit.CLUB, Number.KING, 51, "♣-K"),
+        (Suit.JOKER, None, 52, "JOKER"),
+    ],
+)
+def test_card_code(suit, number, expected_code, expected_str):
+    # GIVEN
+
+    # WHEN
+    card = Card(suit, number)
+
+    # THEN
+    # スートと数字からコードが求まり, コードから同じカードが得られることを確認する
+    assert Card.encode(suit, number) == expected_code
+    assert card.code == expected_code
+    assert card.suit == suit
+    assert card.number == number
+    assert str(card) == expected_str
+    assert Card.from_code(expected_code) is card
+
+
+def test_card_flyweight():
+    # GIVEN
+
+    # WHEN
+    first = Card(Suit.SPADE, Number.ACE)
+    second = Card(suit=Suit.SPADE, number=Number.ACE)
+
+    # THEN
+    # 同じカードは同じオブジェクトが共有され, pickle しても共有されたオブジェクトに戻ることを確認する
+    assert first is second
+    assert pickle.loads(pickle.dumps(first)) is first
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(Card, "__del__")
+
+
+def test_card_table():
+    # GIVEN
+
+    # WHEN
+    cards = [Card.from_code(code) for code in range(54)]
+
+    # THEN
+    # 54種類のカードが全て異なり, 文字列表現の変換表と一致することを確認する
+    assert len(set(map(id, cards))) == 54
+    assert [str(card) for card in cards] == list(CODE_STRINGS)
+    assert [card.suit for card in cards].count(Suit.JOKER) == len(JOKER_CODES)
+
+
+@pytest.mark.parametrize("include_jokers, expected_codes", [(False, range(52)), (True, range(54))])
+def test_trump_codes(include_jokers, expected_codes):
+    # GIVEN
+
+    # WHEN
+    trump = Trump(include_jokers=include_jokers)
+
+    # THEN
+    # トランプがカードのコードの配列を持ち, Card オブジェクトは必要なときに作られることを確認する
+    assert trump.codes == array("B", expected_codes)
+    assert [card.code for card in trump.card_list] == list(expected_codes)
+    assert trump.draw() is Card.from_code(0)
+    assert len(trump) == len(expected_codes) - 1
@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from src.trump.trump import Suit, Number, Card
+from src.trump.monte_carlo import deal_hands, shuffled_decks, simulate_equity
+
+
+def test_shuffled_decks():
+    # GIVEN
+    rng = np.random.default_rng(0)
+
+    # WHEN
+    decks = shuffled_decks(1000, rng)
+
+    # THEN
+    # 各行が52枚のカードの順列で, 行ごとに異なる順序になっていることを確認する
+    assert decks.shape == (1000, 52)
+    assert decks.dtype == np.uint8
+    assert (np.sort(decks, axis=1) == np.arange(52)).all()
+    assert len({deck.tobytes() for deck in decks}) == 1000
+    # 各位置に各カードがほぼ均等に現れることを確認する
+    assert abs((decks[:, 0] == 0).mean() - 1 / 52) < 0.02
+
+
+def test_deal_hands():
+    # GIVEN
+    decks = shuffled_decks(10, np.random.default_rng(1))
+
+    # WHEN
+    hands = deal_hands(decks, 4, 2)
+
+    # THEN
+    assert hands.shape == (10, 4, 2)
+    assert (hands.reshape(10, 8) == decks[:, :8]).all()
+    with pytest.raises(ValueError):
+        deal_hands(decks, 27, 2)
+
+
+def test_simulate_equity_seed():
+    # GIVEN
+    hands = [[Card(Suit.SPADE, Number.ACE), Card(Suit.HEART, Number.ACE)], []]
+
+    # WHEN
+    first = simulate_equity(hands, trials=2000, seed=3, chunk_size=300)
+    second = simulate_equity(hands, trials=2000, seed=3, chunk_size=300)
+
+    # THEN
+    # 同じシード値からは同じ結果になり, 勝ち・引き分けの回数とエクイティが整合することを確認する
+    assert (first.equity == second.equity).all()
+    assert first.trials == 2000
+    assert (first.wins + first.ties <= 2000).all()
+    assert first.equity.sum() == pytest.approx(1.0)
+
+
+def test_simulate_equity_pocket_pairs():
+    # GIVEN
+    aces = [Card(Suit.SPADE, Number.ACE), Card(Suit.HEART, Number.ACE)]
+    kings = [Card(Suit.SPADE, Number.KING), Card(Suit.HEART, Number.KING)]
+
+    # WHEN
+    result = simulate_equity([aces, kings], trials=20000, seed=0)
+
+    # THEN
+    # AA 対 KK のエクイティが既知の値（約82%）に近いことを確認する
+    assert result.equity[0] == pytest.approx(0.82, abs=0.02)
+
+
+def test_simulate_equity_known_board():
+    # GIVEN
+    # 場のカードが全て分かっており, 1人目がロイヤルストレートフラッシュを持つ
+    board = [Card(Suit.SPADE, number) for number in (Number.TEN, Number.JACK, Number.QUEEN)] + \
+            [Card(Suit.HEART, Number.TWO), Card(Suit.DIA, Number.THREE)]
+    hands = [[Card(Suit.SPADE, Number.ACE), Card(Suit.SPADE, Number.KING)], [], []]
+
+    # WHEN
+    result = simulate_equity(hands, board=board, trials=500, seed=0, chunk_size=64)
+
+    # THEN
+    assert result.wins.tolist() == [500, 0, 0]
+    assert result.equity.tolist() == [1.0, 0.0, 0.0]
+
+
+@pytest.mark.parametrize(
+    "hands, board, hand_size, board_size",
+    [
+        ([], [], 2, 5),
+        ([[Card(Suit.SPADE, Number.ACE)], [Card(Suit.SPADE, Number.ACE)]], [], 2, 5),
+        ([[]], [], 2, 2),
+        ([[]] * 30, [], 2, 0),
+    ],
+)
+def test_simulate_equity_invalid(hands, board, hand_size, board_size):
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        simulate_equity(hands, board=board, trials=10, hand_size=hand_size, board_size=board_size)
@@ -0,0 +1,132 @@
+import pytest
+from array import array
+from src.trump.trump import Suit, Number, Card, Trump
+from src.trump.notation import format_hand, iter_hands, parse_card, parse_hand, write_hands
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("♠-A", Card(Suit.SPADE, Number.ACE).code),
+        ("♤-A", Card(Suit.SPADE, Number.ACE).code),
+        ("♠︎-A", Card(Suit.SPADE, Number.ACE).code),
+        ("♥-10", Card(Suit.HEART, Number.TEN).code),
+        ("♢-K", Card(Suit.DIA, Number.KING).code),
+        ("♣-2", Card(Suit.CLUB, Number.TWO).code),
+        ("JOKER", 52),
+    ],
+)
+def test_parse_card(token, expected):
+    # GIVEN
+
+    # WHEN
+    code = parse_card(token)
+
+    # THEN
+    assert code == expected
+
+
+@pytest.mark.parametrize("token", ["♠-1", "♠A", "X-A", "joker", ""])
+def test_parse_card_invalid(token):
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        parse_card(token)
+
+
+def test_parse_hand():
+    # GIVEN
+    line = "♠-A, ♡-K ♦-3  JOKER JOKER\n"
+
+    # WHEN
+    codes = parse_hand(line)
+
+    # THEN
+    # カンマと空白のどちらでも区切れ, 2枚目の JOKER はコード53になることを確認する
+    assert codes == array("B", [0, 25, 28, 52, 53])
+
+
+def test_format_hand():
+    # GIVEN
+    trump = Trump(include_jokers=True)
+
+    # WHEN
+    text = format_hand(trump.codes, separator="\n")
+
+    # THEN
+    # 表記が Card の文字列表現と一致し, 元のコードに戻せることを確認する
+    assert text == str(trump)
+    assert parse_hand(format_hand(trump.codes)) == trump.codes
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_write_and_iter_hands(tmp_path, use_mmap):
+    # GIVEN
+    path = str(tmp_path / "hands.txt")
+    hands = [[(i * 7 + j) % 52 for j in range(5)] for i in range(1000)]
+
+    # WHEN
+    # 手札をジェネレータから書き出し, 1行ずつ読み込む
+    write_hands(path, (hand for hand in hands), buffer_lines=64)
+    parsed = list(iter_hands(path, use_mmap=use_mmap))
+
+    # THEN
+    assert [codes.tolist() for codes in parsed] == hands
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_write_and_iter_empty_hands(tmp_path, use_mmap):
+    # GIVEN
+    path = str(tmp_path / "hands.txt")
+    hands = [[], [0, 1, 2, 3, 4], [], [], [51, 52, 53]]
+
+    # WHEN
+    # 空の手札を含む手札を書き出して読み込む
+    write_hands(path, hands)
+    parsed = list(iter_hands(path, use_mmap=use_mmap))
+
+    # THEN
+    # 空の手札も読み飛ばされず, 手札の数と順番が変わらないことを確認する
+    assert [codes.tolist() for codes in parsed] == hands
+    assert format_hand([]) == "-"
+    assert parse_hand(format_hand([])) == array("B")
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_iter_hands_skips_comments(tmp_path, use_mmap):
+    # GIVEN
+    path = tmp_path / "hands.txt"
+    path.write_text("# hand history\n\n♠-A ♠-K\n   \n♡-2\n", encoding="utf-8")
+
+    # WHEN
+    parsed = list(iter_hands(str(path), use_mmap=use_mmap))
+
+    # THEN
+    assert parsed == [array("B", [0, 12]), array("B", [14])]
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_iter_hands_invalid(tmp_path, use_mmap):
+    # GIVEN
+    path = tmp_path / "hands.txt"
+    path.write_text("♠-A\n♠-Z\n", encoding="utf-8")
+
+    # WHEN
+    # THEN
+    # 不正な表記の行番号がエラーに含まれることを確認する
+    with pytest.raises(ValueError, match="Line 2"):
+        list(iter_hands(str(path), use_mmap=use_mmap))
+
+
+def test_iter_hands_empty_file(tmp_path):
+    # GIVEN
+    path = tmp_path / "hands.txt"
+    path.write_bytes(b"")
+
+    # WHEN
+    parsed = list(iter_hands(str(path), use_mmap=True))
+
+    # THEN
+    assert parsed == []
@@ -0,0 +1,122 @@
+import pytest
+from itertools import combinations
+import numpy as np
+from src.trump.trump import Suit, Number, Card
+from src.trump.poker import HandCategory, get_category, get_hand_evaluator
+
+
+def parse_cards(text):
+    suits = {"S": Suit.SPADE, "H": Suit.HEART, "D": Suit.DIA, "C": Suit.CLUB}
+    return [Card(suits[token[0]], Number.mark2Number(token[1:])) for token in text.split()]
+
+
+@pytest.fixture(scope="module")
+def evaluator():
+    return get_hand_evaluator()
+
+
+@pytest.mark.parametrize(
+    "hand, expected_category",
+    [
+        ("SA SK SQ SJ S10", HandCategory.STRAIGHT_FLUSH),
+        ("H5 H4 H3 H2 HA", HandCategory.STRAIGHT_FLUSH),
+        ("SA HA DA CA S2", HandCategory.FOUR_OF_A_KIND),
+        ("SK HK DK C2 S2", HandCategory.FULL_HOUSE),
+        ("S2 S7 S9 SJ SK", HandCategory.FLUSH),
+        ("SA H2 D3 C4 S5", HandCategory.STRAIGHT),
+        ("S9 H9 D9 C4 S5", HandCategory.THREE_OF_A_KIND),
+        ("S9 H9 D4 C4 S5", HandCategory.TWO_PAIR),
+        ("S9 H9 D4 C3 S5", HandCategory.ONE_PAIR),
+        ("S9 H2 D4 C3 SK", HandCategory.HIGH_CARD),
+        ("S9 H9 D9 C4 S4 H4 D2", HandCategory.FULL_HOUSE),
+        ("S2 S3 S4 S5 H6 S9 DK", HandCategory.FLUSH),
+        ("S2 S3 S4 S5 S6 S7 SA", HandCategory.STRAIGHT_FLUSH),
+        ("SA HA D4 C4 S5 H5", HandCategory.TWO_PAIR),
+    ],
+)
+def test_category(evaluator, hand, expected_category):
+    # GIVEN
+    cards = parse_cards(hand)
+
+    # WHEN
+    score = evaluator.evaluate(cards)
+
+    # THEN
+    assert get_category(score) == expected_category
+
+
+@pytest.mark.parametrize(
+    "weaker, stronger",
+    [
+        ("HA H2 D3 C4 S5", "S2 H3 D4 C5 S6"),
+        ("SK SQ SJ S10 S8", "HA H4 H6 H8 H10"),
+        ("S9 H9 DA CK SQ", "S10 H10 D2 C3 S4"),
+        ("S9 H9 D4 C4 SK", "D9 C9 H4 S4 SA"),
+        ("SK HK DK C2 S2", "SA HA DA C2 S2"),
+        ("S9 H2 D4 C3 SK", "D9 C2 H4 S3 HA"),
+    ],
+)
+def test_compare(evaluator, weaker, stronger):
+    # GIVEN
+
+    # WHEN
+    weaker_score = evaluator.evaluate(parse_cards(weaker))
+    stronger_score = evaluator.evaluate(parse_cards(stronger))
+
+    # THEN
+    assert weaker_score < stronger_score
+
+
+def test_seven_cards_use_best_five(evaluator):
+    # GIVEN
+    rng = np.random.default_rng(0)
+    hands = [rng.permutation(52)[:7].tolist() for _ in range(300)]
+
+    # WHEN
+    scores = [evaluator.evaluate_codes(hand) for hand in hands]
+
+    # THEN
+    # 7枚の判定結果が, 5枚の組み合わせ21通りのうち最も強いものと一致することを確認する
+    for hand, score in zip(hands, scores):
+        assert score == max(evaluator.evaluate_codes(five) for five in combinations(hand, 5))
+
+
+@pytest.mark.parametrize("hand_size", [5, 6, 7])
+def test_evaluate_batch(evaluator, hand_size):
+    # GIVEN
+    rng = np.random.default_rng(hand_size)
+    hands = np.array([rng.permutation(52)[:hand_size] for _ in range(500)], dtype=np.uint8)
+
+    # WHEN
+    scores = evaluator.evaluate_batch(hands)
+
+    # THEN
+    # 一括判定の結果が1つずつ判定した結果と一致することを確認する
+    assert scores.shape == (500,)
+    assert scores.tolist() == [evaluator.evaluate_codes(hand.tolist()) for hand in hands]
+
+
+def test_five_card_category_counts(evaluator):
+    # GIVEN
+    hands = np.array(list(combinations(range(52), 5)), dtype=np.uint8)
+
+    # WHEN
+    scores = evaluator.evaluate_batch(hands)
+
+    # THEN
+    # 5枚の全ての組み合わせについて, 役ごとの数と強さの種類数が既知の値と一致することを確認する
+    counts = np.bincount(scores >> 20, minlength=len(HandCategory))
+    assert counts.tolist() == [1302540, 1098240, 123552, 54912, 10200, 5108, 3744, 624, 40]
+    assert len(np.unique(scores)) == 7462
+
+
+@pytest.mark.parametrize("codes", [[0, 1, 2, 3], [0, 1, 2, 3, 4, 5, 6, 7], [0, 1, 2, 3, 52]])
+def test_invalid_hand(evaluator, codes):
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        evaluator.evaluate_codes(codes)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_batch(np.array([codes]))
@@ -0,0 +1,173 @@
+import pytest
+import random
+from src.trump.trump import Suit, Number, Card
+from src.trump.shoe import Shoe
+
+
+@pytest.fixture()
+def shoe():
+    return Shoe(deck_count=6, rng=random.Random(0))
+
+
+@pytest.mark.parametrize(
+    "deck_count, include_jokers, expected_card_count",
+    [
+        (1, False, 52),
+        (6, False, 312),
+        (8, True, 432),
+    ],
+)
+def test_shoe(deck_count, include_jokers, expected_card_count):
+    # GIVEN
+
+    # WHEN
+    shoe = Shoe(deck_count=deck_count, include_jokers=include_jokers)
+
+    # THEN
+    # シューに含まれるカードの枚数が組数分であることを確認する
+    assert len(shoe) == expected_card_count
+    assert len(shoe.search(suit=Suit.SPADE, number=Number.ACE)) == deck_count
+
+
+@pytest.mark.parametrize(
+    "draw_count, expected_card_count",
+    [(1, 311), (312, 0), (313, 0)],
+)
+def test_draw(shoe, draw_count, expected_card_count):
+    # GIVEN
+    shoe = shoe
+    before_draw = shoe.card_list
+
+    # WHEN
+    # 指定された枚数のカードを1枚ずつ配る
+    cards = [shoe.draw() for _ in range(draw_count)]
+
+    # THEN
+    # 先頭から順に配られ, 残りがなくなると False が返ることを確認する
+    assert cards[0] is before_draw[0]
+    assert len(shoe) == expected_card_count
+    assert cards[-1] is (False if draw_count > 312 else before_draw[draw_count - 1])
+    assert shoe.card_list == before_draw[draw_count:]
+
+
+@pytest.mark.parametrize(
+    "n, expected_drawn_count",
+    [(0, 0), (5, 5), (400, 312)],
+)
+def test_draw_many(shoe, n, expected_drawn_count):
+    # GIVEN
+    shoe = shoe
+    expected = shoe.card_list[:expected_drawn_count]
+
+    # WHEN
+    # 指定された枚数のカードをまとめて配る
+    cards = shoe.draw(n)
+
+    # THEN
+    assert cards == expected
+    assert len(shoe) == 312 - expected_drawn_count
+    assert len(shoe.card_list) == len(shoe)
+    assert shoe.get_dealt_count() == expected_drawn_count
+
+
+def test_shuffle(shoe):
+    # GIVEN
+    shoe = shoe
+    before_shuffle = shoe.card_list
+    shoe.draw(100)
+
+    # WHEN
+    # 配ったカードを戻してシャッフルする
+    shoe.shuffle()
+
+    # THEN
+    # 全てのカードが戻り, 同じカードの集合のまま順序が変化したことを確認する
+    assert len(shoe) == 312
+    assert shoe.card_list != before_shuffle
+    assert sorted(map(id, shoe.card_list)) == sorted(map(id, before_shuffle))
+
+
+def test_shuffle_seed():
+    # GIVEN
+    first = Shoe(deck_count=2, rng=random.Random(42))
+    second = Shoe(deck_count=2, rng=random.Random(42))
+
+    # WHEN
+    first.shuffle()
+    second.shuffle()
+
+    # THEN
+    # 同じ乱数生成器からは同じ順序になることを確認する
+    assert str(first) == str(second)
+
+
+@pytest.mark.parametrize(
+    "penetration, expected_cut_card_position",
+    [(0.75, 234), (0.5, 156), (1, 312)],
+)
+def test_cut_card(penetration, expected_cut_card_position):
+    # GIVEN
+    shoe = Shoe(deck_count=6, penetration=penetration)
+
+    # WHEN
+    shoe.draw(expected_cut_card_position - 1)
+    before_cut_card = shoe.needs_shuffle()
+    shoe.draw()
+
+    # THEN
+    # カットカードの位置まで配るとシャッフルが必要になり, シャッフルで解除されることを確認する
+    assert shoe.get_cut_card_position() == expected_cut_card_position
+    assert not before_cut_card
+    assert shoe.needs_shuffle()
+    shoe.shuffle()
+    assert not shoe.needs_shuffle()
+
+
+@pytest.mark.parametrize(
+    "deck_count, penetration",
+    [(0, 0.75), (6, 0), (6, 1.5)],
+)
+def test_invalid_shoe(deck_count, penetration):
+    # GIVEN
+
+    # WHEN
+    # THEN
+    with pytest.raises(ValueError):
+        Shoe(deck_count=deck_count, penetration=penetration)
+
+
+def test_search_after_draw(shoe):
+    # GIVEN
+    shoe = shoe
+    shoe.shuffle()
+
+    # WHEN
+    # 何枚か配り, 残りのカードを1枚取り除いてから検索する
+    shoe.draw(100)
+    card = shoe.card_list[100]
+    removed = shoe.remove(card)
+
+    # THEN
+    # 索引を使った検索結果が, 残りのカードを先頭から走査した結果と一致することを確認する
+    remaining = shoe.card_list
+    assert removed
+    assert len(shoe) == 211
+    assert shoe.count() == 211
+    assert shoe.search(suit=card.suit) == [c for c in remaining if c.suit == card.suit]
+    assert shoe.count(suit=card.suit, number=card.number) == remaining.count(card)
+
+
+def test_remove_jokers():
+    # GIVEN
+    shoe = Shoe(deck_count=2, include_jokers=True, rng=random.Random(0))
+    shoe.shuffle()
+    joker = Card(Suit.JOKER, None)
+
+    # WHEN
+    # シューに含まれる4枚の JOKER を全て取り除く
+    removed = [shoe.remove(joker) for _ in range(5)]
+
+    # THEN
+    assert removed == [True, True, True, True, False]
+    assert joker not in shoe
+    assert shoe.count(Suit.JOKER) == 0
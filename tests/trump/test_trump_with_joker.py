@@ -1,5 +1,5 @@
 import pytest
-from src.trump.trump import Suit, Number, Trump
+from src.trump.trump import Suit, Number, Card, Trump
 
 
 @pytest.fixture()
@@ -76,3 +76,22 @@ def test_search(trump_with_joker, suit, number, expected_search_result_count):
     # THEN
     # 検索結果の数が期待される数であることを確認する
     assert len(search_result) == expected_search_result_count
+
+
+def test_remove_jokers(trump_with_joker):
+    # GIVEN
+    trump = trump_with_joker
+    joker = Card(Suit.JOKER, None)
+
+    # WHEN
+    # JOKER を2枚とも取り除く
+    first_removed = joker in trump and trump.remove(joker)
+    second_removed = joker in trump and trump.remove(joker)
+
+    # THEN
+    # 2枚とも取り除かれ, それ以上は取り除けないことを確認する
+    assert first_removed and second_removed
+    assert joker not in trump
+    assert not trump.remove(joker)
+    assert trump.count(Suit.JOKER) == 0
+    assert len(trump) == 52
@@ -1,10 +1,11 @@
 import pytest
-from src.trump.trump import Suit, Number, Trump
+import random
+from src.trump.trump import Suit, Number, Card, Trump
 
 
 @pytest.fixture()
 def trump():
-    return Trump()
+    return Trump(rng=random.Random(0))
 
 
 def test_trump(trump):
@@ -74,3 +75,119 @@ def test_search(trump, suit, number, expected_search_result_count):
     # THEN
     # 検索結果の数が期待される数であることを確認する
     assert len(search_result) == expected_search_result_count
+
+
+@pytest.mark.parametrize(
+    "suit, number, expected_count",
+    [
+        (Suit.HEART, None, 13),
+        (None, Number.KING, 4),
+        (Suit.CLUB, Number.TEN, 1),
+        (Suit.JOKER, None, 0),
+        (None, None, 52),
+    ],
+)
+def test_count_and_has(trump, suit, number, expected_count):
+    # GIVEN
+    trump = trump
+
+    # WHEN
+    count = trump.count(suit=suit, number=number)
+    has = trump.has(suit=suit, number=number)
+
+    # THEN
+    assert count == expected_count
+    assert has == (expected_count > 0)
+
+
+def test_index_after_shuffle_and_draw(trump):
+    # GIVEN
+    trump = trump
+
+    # WHEN
+    # シャッフルしてから何枚か引き, 残りのカードを索引で検索する
+    trump.shuffle()
+    drawn = [trump.draw() for _ in range(20)]
+
+    # THEN
+    # 索引を使った検索結果が, 残りのカードを先頭から走査した結果と一致することを確認する
+    remaining = trump.card_list
+    for suit in Suit:
+        assert trump.search(suit=suit) == [card for card in remaining if card.suit == suit]
+        assert trump.count(suit=suit) == sum(1 for card in remaining if card.suit == suit)
+    for number in Number:
+        assert trump.search(number=number) == [card for card in remaining if card.number == number]
+        assert trump.has(number=number) == any(card.number == number for card in remaining)
+    assert all(card not in trump for card in drawn)
+    assert all(card in trump for card in remaining)
+
+
+def test_remove(trump):
+    # GIVEN
+    trump = trump
+    card = Card(Suit.HEART, Number.QUEEN)
+
+    # WHEN
+    # 同じカードを2回取り除く
+    first = trump.remove(card)
+    second = trump.remove(card)
+
+    # THEN
+    # 1回目だけ取り除かれ, 検索結果からも消えることを確認する
+    assert first
+    assert not second
+    assert len(trump) == 51
+    assert card not in trump
+    assert trump.search(suit=Suit.HEART, number=Number.QUEEN) == []
+    assert trump.count(suit=Suit.HEART) == 12
+
+
+def test_shuffle_rng():
+    # GIVEN
+    first = Trump(rng=random.Random(42))
+    second = Trump(rng=random.Random(42))
+
+    # WHEN
+    # 同じ乱数生成器でシャッフルする
+    random.seed(0)
+    first.shuffle()
+    random.seed(1)
+    second.shuffle()
+
+    # THEN
+    # グローバルな乱数の状態によらず, 渡した乱数生成器だけで順序が決まることを確認する
+    assert str(first) == str(second)
+
+
+def test_draw_from_empty_deck(trump, capsys):
+    # GIVEN
+    trump = trump
+    for _ in range(52):
+        trump.draw()
+
+    # WHEN
+    card = trump.draw()
+
+    # THEN
+    # カードが残っていない場合は何も出力せずにFalseを返すことを確認する
+    assert card is False
+    assert capsys.readouterr().out == ""
+
+
+def test_shuffle_after_draw(trump):
+    # GIVEN
+    trump = trump
+    drawn = [trump.draw() for _ in range(10)]
+
+    # WHEN
+    # 何枚か引いてからシャッフルする
+    trump.shuffle()
+
+    # THEN
+    # 引いたカードは戻らず, 残りのカードだけがシャッフルされることを確認する
+    assert len(trump) == 42
+    assert len(trump.codes) == 42
+    assert all(card not in trump for card in drawn)
+    remaining = trump.card_list
+    assert trump.search(suit=Suit.HEART) == [card for card in remaining if card.suit == Suit.HEART]
+    assert [trump.draw() for _ in range(42)] == remaining